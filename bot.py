@@ -5,18 +5,40 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 import random
 import os
-from datetime import datetime
+import sys
+import glob
+from datetime import datetime, timedelta
 import json
+import re
+import hashlib
+import sqlite3
+import zlib
+import base64
+import threading
+import queue
+import itertools
+from collections import deque
+from contextlib import contextmanager
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from string import Template
+import tempfile
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # Session persistence is skipped rather than storing cookies in plain text
+    Fernet = None
 
 # Configuration
-USERNAME = input("Enter user mail:")      
-PASSWORD = input("Enter password:") 
-RESUME_PATH = input("Enter resume path:")
+USERNAME = ""  # Asked for by prompt_credentials() when the bot is started from the command line
+PASSWORD = ""
+RESUME_PATH = ""
 JOB_KEYWORDS = ["data analyst", "data science", "python developer"]  
 MAX_JOBS_PER_KEYWORD = 25  
 LOCATION = "Hyderabad"
@@ -48,24 +70,1806 @@ Best regards,
 Laxmana ra Vangapangu"""
 }
 
+DEFAULT_TEXTAREA_ANSWER = "I am very interested in this position and believe my skills and experience make me a great fit."
+
 # Advanced options
 SKIP_APPLIED_JOBS = True
 SAVE_APPLIED_JOBS = True
-LOG_FILE = f"linkedin_job_applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+LOG_FILE = f"linkedin_job_applications_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+SAVE_EVENT_LOG = True  # Write structured per-job span events to LOG_FILE
+EVENT_LOG_FLUSH_EVERY = 50  # Events per batch written by the background writer
+EVENT_LOG_FLUSH_SECONDS = 2.0  # Longest an event waits in the buffer
+PROFILE_WEBDRIVER = False  # Time every WebDriver command per calling bot method and report the hot spots
+PROFILE_REPORT_ROWS = 15
+# Generic bot helpers skipped when attributing a command, so their time lands on the method that called them
+PROFILE_HELPER_METHODS = {"span", "log", "random_delay", "pace", "load_page", "report_page_load", "record_page_stats",
+                          "find_present", "get_step_inventory", "fill_form_field", "counted_execute"}
+APPLIED_JOBS_DB = "applied_jobs.sqlite3"  # Application history shared by every run
+ANSWER_BANK_DB = "screening_answers.sqlite3"  # Screening question answers and the review queue
+ANSWER_MATCH_THRESHOLD = 0.8  # Minimum token-set Jaccard similarity to reuse a stored answer
+FORM_PLANS_DB = "form_plans.sqlite3"  # Fill plans learned per company-site form and fingerprint
+SITE_PROFILES_DB = "site_profiles.sqlite3"  # What was learned about each external domain across runs
+SITE_FAILURE_LIMIT = 3  # Consecutive failed applications after which a domain's jobs are skipped
+SITE_BLOCK_DAYS = 14  # A skipped domain (failures or login wall) is tried again after this many days
+# Applicant tracking systems that serve many companies from one host, each under its own first path segment
+# (boards.greenhouse.io/<company>/...); their profiles and failure streaks are kept per company
+MULTI_TENANT_HOSTS = ["boards.greenhouse.io", "job-boards.greenhouse.io", "jobs.lever.co", "jobs.eu.lever.co",
+                      "jobs.ashbyhq.com", "apply.workable.com", "jobs.smartrecruiters.com", "careers.smartrecruiters.com",
+                      "jobs.jobvite.com", "jobs.recruitee.com", "ats.rippling.com"]
+SITE_PROFILE_COLUMNS = ('apply_selector', 'cookie_banner', 'login_wall', 'visits', 'successes', 'failure_streak',
+                        'load_ms')  # site_profiles columns besides domain and updated_at
+USE_FORM_PLANS = True  # Replay a learned plan with direct selectors when a company-site form was seen before
+FORM_PLAN_VERSION = 1  # Bump when the plan format changes; plans of other versions are ignored
+MANUAL_INPUT_DB = "manual_input_tasks.sqlite3"  # Company-site forms waiting for answers a human must give
+DEFER_MANUAL_INPUT = True  # Save unfillable required fields as tasks instead of stopping the run on input()
+CHECKPOINT_FILE = "linkedin_run_checkpoint.json"  # Run state for --resume, rewritten after every finished job
+SAVE_CHECKPOINTS = True  # Checkpoint the keyword position, discovered jobs and results so a stopped run can resume
+GUESS_UNKNOWN_ANSWERS = False  # False: leave unknown screening questions empty and queue them for review
 HANDLE_COMPANY_SITES = True  # New option to handle external applications
+ASYNC_COMPANY_SITES = True  # Queue company-site applications to their own browsers instead of blocking the LinkedIn loop
+COMPANY_SITE_WORKERS = 1  # Browsers in the company-site lane, started with the first queued job
+USE_DOM_SNAPSHOT = True  # Read all job cards with one execute_script call instead of per-element lookups
+TRIAGE_JOB_CARDS = True  # Drop already-applied / ineligible cards before opening their pages
+USE_LISTING_CRAWLER = True  # Scroll the result list and follow &start= pages instead of reading one screen
+MAX_LISTING_PAGES = 5  # Result pages (of LISTING_PAGE_SIZE jobs) to crawl per keyword
+LISTING_PAGE_SIZE = 25
+WARM_START = True  # Reuse the cached chromedriver and the saved LinkedIn session when possible
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH", "")  # Pinned driver binary, e.g. for offline runs
+DRIVER_CACHE_FILE = ".chromedriver_path"  # Driver path resolved by an earlier run
+SESSION_FILE = "linkedin_session.enc"  # Encrypted LinkedIn cookies from the last successful login
+LEAN_BROWSER_PROFILE = False  # Headless, small window, no images/fonts/media - for high-volume runs
+LEAN_WINDOW_SIZE = "1280,900"
+EAGER_PAGE_LOAD = True  # Lean profile only: return from driver.get at DOMContentLoaded
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg"
+]
+REPORT_PAGE_STATS = True  # Log transfer size and load time of search and job pages
+CLASSIFY_APPLY_BUTTON = True  # Find and classify the job's apply control with one script instead of the XPath cascade
+USE_FIELD_MATCHER = True  # Fill forms from one JS input inventory matched against FIELD_RULES
 
-class LinkedInJobBot:
+# Declarative autofill rules, highest priority first: (rule name, PERSONAL_INFO key or handler, keywords).
+# Keywords match whole tokens of an input's name and id, then of its placeholder, aria-label and label text.
+FIELD_RULES = [
+    ('phone_country', 'handler:phone_country', ['phone_country', 'phonecountry', 'country_code', 'countrycode', 'dial_code']),
+    ('country', 'handler:country', ['country', 'nation']),
+    ('phone_full', 'phone', ['phone_full', 'full_phone', 'phone_with_code']),
+    ('first_name', 'first_name', ['firstname', 'first_name', 'fname', 'given_name']),
+    ('last_name', 'last_name', ['lastname', 'last_name', 'lname', 'family_name', 'surname']),
+    ('email', 'email', ['email', 'e_mail', 'emailaddress']),
+    ('phone_number', 'phone_number', ['phone', 'phonenumber', 'telephone', 'mobile']),
+    ('city', 'city', ['city', 'location']),
+    ('state', 'state', ['state', 'region', 'province']),
+    ('postal_code', 'postal_code', ['postal', 'postcode', 'zip', 'zipcode', 'pincode', 'pin_code']),
+    ('experience_years', 'experience_years', ['experience', 'years_experience', 'years_of_experience']),
+    ('current_company', 'current_company', ['current_company', 'current_employer', 'employer', 'company_name'])
+]
+FIELD_LABEL_MAX_WORDS = 4  # Longer label texts, and questions, are screening questions for the answer bank
+LINKEDIN_BASE_URL = "https://www.linkedin.com"
+
+# Worker pool mode: one collector searches keywords while headless workers apply in parallel
+WORKER_POOL_SIZE = 1  # 1 keeps the classic single-browser sequential run
+MAX_CONCURRENT_APPLIES = 2  # Global cap on applications in flight across all workers
+WORKER_HEADLESS = True
+WORKER_PACING = (5, 8)  # Delay range (seconds) each worker waits between its applications
+KEYWORD_PACING = (8, 15)  # Delay range (seconds) between keyword searches
+
+# Rate governor: paced actions take a token from their class's bucket instead of sleeping fixed ranges
+USE_RATE_GOVERNOR = True  # False restores the fixed random_delay pauses (and WORKER_/KEYWORD_PACING)
+RATE_BUDGETS = {  # Action class -> (actions per minute, burst), shared by every browser of the run
+    'page_load': (10, 2),  # LinkedIn job pages and login
+    'company_site': (10, 2),  # External company-site pages; a slow ATS backs off this class, not LinkedIn's
+    'search': (4, 1),  # Keyword searches and result pages
+    'submit': (6, 1)  # Application submissions and the login form
+}
+RATE_JITTER = 0.3  # Each wait moves by up to this fraction of an interval around its scheduled slot
+RATE_SLOW_RESPONSE = 6.0  # Seconds; a slower page load counts like an error page
+RATE_BACKOFF_FACTOR = 2.0  # Divides a class's rate after a slow response or error page
+RATE_RECOVERY = 0.8  # Each normal response shrinks the backoff towards the configured rate
+RATE_MAX_BACKOFF = 8.0
+
+# Job prefetch: the next jobs load in background tabs while the current one is being applied to
+PREFETCH_JOBS = 2  # K upcoming job pages kept loading ahead of the current job (0 loads each job when it is reached)
+
+# Local HTML fixtures used by the offline benchmarks
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+REPLAY_RESULTS_FILE = "replay_benchmark_results.jsonl"  # End-to-end replay benchmark history for regression checks
+REPLAY_JOB_COUNT = 40  # Jobs listed by the replay server's search results
+REPLAY_LATENCY_MS = 50  # Artificial latency the replay server adds to every request
+
+# Extracts every job card on the listing page in a single WebDriver round-trip
+JOB_CARD_SNAPSHOT_JS = """
+const cardSelector = "[data-job-id], [data-occludable-job-id], .job-card-container, .jobs-search-results__list-item, li";
+const companySelectors = [".job-card-container__primary-description", ".job-card-container__company-name",
+                          ".artdeco-entity-lockup__subtitle", ".base-search-card__subtitle"];
+const locationSelectors = [".job-card-container__metadata-item", ".artdeco-entity-lockup__caption",
+                           ".job-search-card__location"];
+const firstText = (root, selectors) => {
+    for (const selector of selectors) {
+        const el = root ? root.querySelector(selector) : null;
+        const text = el ? el.innerText.trim() : "";
+        if (text) return text.split("\\n")[0].trim();
+    }
+    return "";
+};
+const seen = new Set();
+const cards = [];
+for (const link of document.querySelectorAll("a[href*='/jobs/view/']")) {
+    const url = link.href;
+    if (!url || seen.has(url)) continue;
+    seen.add(url);
+    const card = link.closest(cardSelector) || link.parentElement;
+    let title = (link.innerText || "").trim();
+    if (!title) {
+        const child = link.querySelector(".job-card-list__title, h3, span");
+        title = child ? child.innerText.trim() : "";
+    }
+    const cardLines = card ? card.innerText.toLowerCase().split("\\n").map(line => line.trim()) : [];
+    // The footer state says "Applied"; titles and companies can start with the word too ("Applied Scientist")
+    const jobState = card ? card.querySelector(".job-card-container__footer-job-state") : null;
+    cards.push({
+        url: url,
+        job_id: card ? (card.getAttribute("data-job-id") || card.getAttribute("data-occludable-job-id")) : null,
+        title: title.split("\\n")[0].trim(),
+        company: firstText(card, companySelectors),
+        location: firstText(card, locationSelectors),
+        easy_apply: cardLines.includes("easy apply"),
+        applied: jobState ? /^applied\\b/i.test(jobState.innerText.trim()) : cardLines.includes("applied")
+    });
+}
+return cards;
+"""
+
+# Shared JS helper: describes every fillable control under a root node. Each entry carries its
+# element, so fills need no further lookups.
+COLLECT_FIELDS_JS = """
+const labelText = (el) => {
+    let text = "";
+    if (el.id) {
+        const label = document.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+        if (label) text = label.innerText;
+    }
+    if (!text && el.closest("label")) text = el.closest("label").innerText;
+    if (!text && el.getAttribute("aria-labelledby")) {
+        text = el.getAttribute("aria-labelledby").split(/\\s+/)
+            .map(id => document.getElementById(id)).filter(Boolean).map(node => node.innerText).join(" ");
+    }
+    return text.trim();
+};
+const isVisible = (el) => {
+    const style = window.getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    return style.display !== "none" && style.visibility !== "hidden" && (rect.width > 0 || rect.height > 0);
+};
+const collectFields = (root) => {
+    const fields = [];
+    root.querySelectorAll("input, select, textarea").forEach((el, index) => {
+        const type = (el.getAttribute("type") || el.tagName).toLowerCase();
+        if (["hidden", "submit", "button", "image", "reset"].includes(type)) return;
+        fields.push({
+            element: el,
+            index: index,
+            tag: el.tagName.toLowerCase(),
+            type: type,
+            name: el.name || "",
+            id: el.id || "",
+            placeholder: el.getAttribute("placeholder") || "",
+            aria_label: el.getAttribute("aria-label") || "",
+            label: labelText(el),
+            group_label: el.closest("fieldset") && el.closest("fieldset").querySelector("legend")
+                ? el.closest("fieldset").querySelector("legend").innerText.trim() : "",
+            value: el.value || "",
+            checked: !!el.checked,
+            required: el.required || el.getAttribute("aria-required") === "true",
+            visible: isVisible(el),
+            enabled: !el.disabled && !el.readOnly,
+            options: el.tagName === "SELECT" ? Array.from(el.options).map(option => option.text.trim()) : [],
+            selected_index: el.tagName === "SELECT" ? el.selectedIndex : -1
+        });
+    });
+    return fields;
+};
+"""
+
+# Inventory of every fillable control under a root selector (or the whole page) in one round-trip
+FORM_INVENTORY_JS = COLLECT_FIELDS_JS + """
+return collectFields((arguments[0] && document.querySelector(arguments[0])) || document);
+"""
+
+# Everything an Easy Apply step needs in one round-trip: visible fields, visible buttons and the
+# step's text (used afterwards to detect that the modal moved on)
+STEP_INVENTORY_JS = COLLECT_FIELDS_JS + """
+const root = document.querySelector(arguments[0]) || document;
+const buttons = Array.from(root.querySelectorAll("button"))
+    .filter(button => isVisible(button) && !button.disabled)
+    .map(button => ({
+        element: button,
+        text: (button.innerText || "").trim(),
+        aria_label: button.getAttribute("aria-label") || "",
+        primary: button.classList.contains("artdeco-button--primary")
+    }));
+return {
+    fields: collectFields(root).filter(field => field.visible),
+    buttons: buttons,
+    step_text: root === document ? "" : root.innerText
+};
+"""
+
+# Selects an option by index and fires the events frameworks listen for
+SELECT_OPTION_JS = """
+const select = arguments[0];
+select.selectedIndex = arguments[1];
+select.dispatchEvent(new Event("input", {bubbles: true}));
+select.dispatchEvent(new Event("change", {bubbles: true}));
+"""
+
+# Scrolls the inner results list (or the window) to its end and returns how many job links are loaded
+SCROLL_JOB_LIST_JS = """
+const list = document.querySelector(".jobs-search-results-list, .scaffold-layout__list, .jobs-search-results__list");
+if (list) {
+    list.scrollTop = list.scrollHeight;
+} else {
+    window.scrollTo(0, document.body.scrollHeight);
+}
+return document.querySelectorAll("a[href*='/jobs/view/']").length;
+"""
+
+# Bytes transferred over the network (document + subresources, transferSize only) and load time of the
+# current page. Resource Timing reports transferSize 0 for two other kinds of entry, counted separately:
+# cache hits (a body size but nothing transferred) and opaque cross-origin resources sent without
+# Timing-Allow-Origin (no sizes at all), whose bytes are unknown rather than zero.
+PAGE_STATS_JS = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+const cached = resources.filter((entry) => !entry.transferSize && entry.encodedBodySize > 0);
+const opaque = resources.filter((entry) => !entry.transferSize && !entry.encodedBodySize &&
+    !entry.name.startsWith(location.origin + "/"));
+const loadEnd = navigation ? (navigation.loadEventEnd || navigation.domContentLoadedEventEnd) : 0;
+return {
+    url: location.href,
+    transfer_bytes: [navigation, ...resources].reduce((total, entry) => total + ((entry && entry.transferSize) || 0), 0),
+    resources: resources.length,
+    cache_hits: cached.length,
+    opaque: opaque.length,
+    load_ms: navigation ? loadEnd - navigation.startTime : 0
+};
+"""
+
+# Why the current page is an error or throttling page (null when it looks normal), for the rate governor
+ERROR_PAGE_JS = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const status = navigation ? navigation.responseStatus || 0 : 0;
+if (status === 429 || status === 999 || status >= 500) return "HTTP " + status;
+const text = (document.title + " " + (document.body ? document.body.innerText.slice(0, 600) : "")).toLowerCase();
+const notice = text.match(/too many requests|rate limit|unusual activity|something went wrong|try again later/);
+return notice ? notice[0] : null;
+"""
+
+# Condition-driven waits: each page state has a readiness check polled until it holds
+APPLY_CONTROL_JS = """
+const topCardSelector = ".jobs-apply-button--top-card, .jobs-s-apply, .jobs-unified-top-card, " +
+    ".job-details-jobs-unified-top-card__container--two-pane, .top-card-layout";
+const normalize = (text) => (text || "").replace(/\\s+/g, " ").trim().toLowerCase();
+const isVisible = (el) => {
+    const style = window.getComputedStyle(el);
+    const rect = el.getBoundingClientRect();
+    return style.display !== "none" && style.visibility !== "hidden" && (rect.width > 0 || rect.height > 0);
+};
+const candidates = [];
+for (const el of document.querySelectorAll("button, a, input[type='submit'], input[type='button']")) {
+    const text = normalize(el.innerText || el.value);
+    const ariaLabel = normalize(el.getAttribute("aria-label"));
+    const label = text + " | " + ariaLabel;
+    if (!/\\bapply\\b/.test(label) || /filter|sign in/.test(label)) continue;
+    if (!isVisible(el) || el.disabled || el.getAttribute("aria-disabled") === "true") continue;
+    const inTopCard = !!el.closest(topCardSelector);
+    // LinkedIn's only other apply flow is the offsite one, whatever its label says
+    const kind = label.includes("easy apply") ? "easy_apply" : "company_site";
+    candidates.push({
+        element: el, kind: kind, text: text || ariaLabel, in_top_card: inTopCard,
+        score: (inTopCard ? 4 : 0) + (kind === "easy_apply" ? 2 : 0) + (el.classList.contains("jobs-apply-button") ? 1 : 0)
+    });
+}
+candidates.sort((a, b) => b.score - a.score);
+const best = candidates[0];
+const result = (kind, control, text) => ({
+    kind: kind, element: control ? control.element : null, text: control ? control.text : text, candidates: candidates.length
+});
+if (best && best.in_top_card) return result(best.kind, best);
+
+// No apply control on the job itself: the status banner says why
+const statusTexts = Array.from(document.querySelectorAll(
+    ".artdeco-inline-feedback__message, .jobs-s-apply__application-link, .post-apply-timeline__entity, " +
+    ".jobs-details-top-card__apply-error, " + topCardSelector)).map(el => normalize(el.innerText));
+const applied = statusTexts.find(text => /^applied\\b/.test(text) || text.includes("see application"));
+if (applied) return result("applied", null, applied);
+const closed = statusTexts.find(text => /no longer accepting applications|job is closed|applications are closed/.test(text));
+if (closed) return result("closed", null, closed);
+return best ? result(best.kind, best) : result("none", null, "");
+"""
+
+FILL_PLAN_JS = """
+const setValue = (el, value) => {
+    // The native setter, so frameworks that track the value property see the change
+    const proto = el.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+};
+const missing = [];
+arguments[0].forEach((step, position) => {
+    const el = document.querySelector(step.selector);
+    if (!el) {
+        missing.push(position);
+        return;
+    }
+    if (step.action === "check") {
+        if (!el.checked) el.click();
+        return;
+    }
+    if (step.action === "select") {
+        const index = Array.from(el.options).findIndex(option => option.text.trim() === step.value);
+        if (index < 0) {
+            missing.push(position);
+            return;
+        }
+        el.selectedIndex = index;
+    } else {
+        setValue(el, step.value);
+    }
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+});
+return missing;
+"""
+
+WAIT_TIMEOUT = 10  # Upper bound for any single readiness wait (seconds)
+WAIT_MIN_POLL = 0.05  # First poll interval, grows while the page is not ready
+WAIT_MAX_POLL = 0.5  # Poll interval cap
+IMPLICIT_WAIT = 0  # Seconds a missing find_element blocks; 0 makes misses fail at once (the old setting was 10)
+BATCHED_LOOKUPS = True  # Check fallback selector lists in one script instead of one blocking lookup each
+COOKIE_BANNER_WAIT = 1.5  # How long a late cookie banner is polled for before assuming there is none
+
+# Fallback selector lists, tried in order; XPath when the selector starts with "/" or "("
+COMPANY_APPLY_SELECTORS = [
+    "//button[contains(translate(text(),'APPLY','apply'),'apply')]",
+    "//a[contains(translate(text(),'APPLY','apply'),'apply')]",
+    "//input[contains(translate(@value,'APPLY','apply'),'apply')]",
+    "//button[contains(translate(text(),'Easy Apply','Easy Apply'),'Easy Apply')]",
+    "//a[contains(translate(text(),'Easy Apply','Easy Apply'),'Easy Apply')]",
+    "//input[contains(translate(@value,'Easy Apply','Easy Apply'),'Easy Apply')]",
+    "//button[contains(text(),'Submit Application')]",
+    "//button[contains(text(),'Join Us')]",
+    "//a[contains(text(),'Career')]",
+    "//a[contains(text(),'Jobs')]",
+    "//button[contains(text(),'Get Started')]",
+    
+    # Generic form submissions
+    "//button[@type='submit']",
+    "//input[@type='submit']"
+]
+COMPANY_NAME_SELECTORS = [
+    ".jobs-unified-top-card__company-name a",
+    ".jobs-unified-top-card__company-name",
+    ".topcard__org-name-link",
+    ".job-details-jobs-unified-top-card__company-name"
+]
+COOKIE_BUTTON_SELECTORS = [
+    "//button[contains(translate(text(),'ACCEPT','accept'),'accept')]",
+    "//button[contains(translate(text(),'ALLOW','allow'),'allow')]",
+    "//button[contains(translate(text(),'OK','ok'),'ok')]",
+    "//button[contains(translate(text(),'AGREE','agree'),'agree')]",
+    "//button[contains(translate(text(),'CONTINUE','continue'),'continue')]",
+    "//a[contains(translate(text(),'ACCEPT','accept'),'accept')]",
+    "button[id*='accept']",
+    "button[class*='accept']",
+    "button[id*='cookie']",
+    "button[class*='cookie']",
+    ".cookie-accept",
+    ".accept-cookies",
+    "#cookie-accept",
+    "#accept-cookies"
+]
+
+# Dismiss a cookie-consent banner in one script: the handler that worked on this domain before is tried
+# first, then the known frameworks, then accept-like controls inside cookie/consent containers and the
+# fallback selectors. arguments: preferred handler (or null), fallback CSS selectors.
+# Returns {handler, text} after clicking, or null when no banner is showing.
+CONSENT_JS = """
+const [preferred, fallbackSelectors] = arguments;
+const visible = (el) => !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== "hidden" && !el.disabled;
+const first = (selectors) => selectors.map((selector) => document.querySelector(selector)).find(visible) || null;
+const label = (el) => (el.innerText || el.value || el.getAttribute("aria-label") || "").trim();
+const ACCEPT = /\\b(accept|agree|allow|got it|ok|okay|i understand)\\b/i;
+const DECLINE = /reject|decline|deny|necessary|required only|settings|preferences|manage|customi[sz]e|options/i;
+const handlers = {
+    onetrust: () => first(["#onetrust-accept-btn-handler", "#accept-recommended-btn-handler"]),
+    cookiebot: () => first(["#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+                            "#CybotCookiebotDialogBodyButtonAccept", "#CybotCookiebotDialogBodyLevelButtonAccept"]),
+    trustarc: () => first(["#truste-consent-button", ".trustarc-agree-btn"]),
+    generic: () => {
+        const containers = document.querySelectorAll('[id*="cookie" i], [class*="cookie" i], [id*="consent" i], '
+            + '[class*="consent" i], [id*="gdpr" i], [class*="gdpr" i], [aria-label*="cookie" i]');
+        for (const container of containers) {
+            const control = Array.from(container.querySelectorAll(
+                "button, a, [role='button'], input[type='button'], input[type='submit']"))
+                .find((el) => visible(el) && ACCEPT.test(label(el)) && !DECLINE.test(label(el)));
+            if (control) return control;
+        }
+        return first(fallbackSelectors);
+    }
+};
+const order = [preferred, ...Object.keys(handlers).filter((name) => name !== preferred)];
+for (const name of order) {
+    const control = handlers[name] ? handlers[name]() : null;
+    if (control) {
+        control.click();
+        return {handler: name, text: label(control).slice(0, 60)};
+    }
+}
+return null;
+"""
+
+# Whether an external page is a sign-in wall rather than an application form, and how long it took to load
+SITE_CHECK_JS = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const password = Array.from(document.querySelectorAll("input[type='password']")).some(visible);
+const fields = Array.from(document.querySelectorAll("input, textarea, select")).filter((el) =>
+    visible(el) && !/^(hidden|password|checkbox|radio|submit|button|image|reset)$/.test(el.type));
+return {
+    login_wall: password && fields.length <= 2,
+    load_ms: navigation ? (navigation.loadEventEnd || navigation.domContentLoadedEventEnd) - navigation.startTime : null
+};
+"""
+
+# Presence of a whole selector list in one round-trip. arguments: selectors and the required state
+# ("present", "visible" or "clickable"); returns a hit or null per selector
+FIND_PRESENT_JS = """
+const [selectors, state] = arguments;
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== "hidden";
+const matches = (selector) => {
+    try {
+        if (/^[/(]/.test(selector)) {
+            const result = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        return Array.from(document.querySelectorAll(selector));
+    } catch (e) {
+        return [];
+    }
+};
+const hits = [];
+for (const selector of selectors) {
+    const element = matches(selector).find((el) =>
+        state === "present" || (visible(el) && (state !== "clickable" || !el.disabled)));
+    const hit = element ? {selector: selector, element: element, text: (element.innerText || "").trim()} : null;
+    hits.push(hit);
+}
+return hits;
+"""
+
+EASY_APPLY_MODAL_SELECTOR = '.jobs-easy-apply-modal, .artdeco-modal[role="dialog"], [role="dialog"]'
+EASY_APPLY_MODAL_JS = f"document.querySelector('{EASY_APPLY_MODAL_SELECTOR}')"
+NO_RESULTS_SELECTOR = ".jobs-search-no-results-banner, .jobs-search-results-list__no-results, .jobs-search-no-results"
+
+# Close the Easy Apply modal without submitting; returns whether there was a close control to click
+DISMISS_EASY_APPLY_JS = f"const modal = {EASY_APPLY_MODAL_JS};" + """
+const dismiss = modal && modal.querySelector(".artdeco-modal__dismiss, button[aria-label='Dismiss']");
+if (dismiss) dismiss.click();
+return !!dismiss;
+"""
+# Click "Discard" in the prompt LinkedIn shows after a started application is dismissed
+CONFIRM_DISCARD_JS = """
+const discard = Array.from(document.querySelectorAll("[role='alertdialog'] button, [role='dialog'] button"))
+    .find(button => /discard/i.test(button.innerText || ""));
+if (discard) discard.click();
+return !!discard;
+"""
+
+PAGE_STATE_CONDITIONS = {
+    'page_ready': "return document.readyState === 'complete';",
+    'login_complete': (
+        "return !location.href.toLowerCase().includes('login') || "
+        "!!document.querySelector(\"a[href*='/feed/'], button[aria-label*='Me']\");"
+    ),
+    'listing_loaded': (  # "empty" when the search has no results, so an empty page does not wait out the timeout
+        "if (document.readyState === 'loading') return false;"
+        "if (document.querySelectorAll(\"a[href*='/jobs/view/']\").length > 0) return true;"
+        f"return document.querySelector('{NO_RESULTS_SELECTOR}') ? 'empty' : false;"
+    ),
+    'job_page_loaded': (
+        "return document.readyState !== 'loading' && !!document.querySelector("
+        "'.jobs-apply-button, .jobs-unified-top-card, .job-details-jobs-unified-top-card__company-name, .topcard__org-name-link');"
+    ),
+    'modal_step_rendered': (
+        f"const modal = {EASY_APPLY_MODAL_JS};"
+        "return !!modal && !!modal.querySelector('input, select, textarea, button');"
+    ),
+    'modal_step_changed': (
+        f"const modal = {EASY_APPLY_MODAL_JS};"
+        "return !modal || modal.innerText !== arguments[0];"
+    ),
+    'more_cards_loaded': "return document.querySelectorAll(\"a[href*='/jobs/view/']\").length > arguments[0];",
+    'upload_finished': (
+        "return !document.querySelector(\"[role='progressbar'], .artdeco-loader, "
+        ".jobs-document-upload__loading, .jobs-document-upload-redesign-card__loading\");"
+    ),
+    # Only the Easy Apply modal or the dialog that replaces it counts: the job description behind it
+    # often says "thank you for your interest"
+    'submit_confirmed': (
+        f"return Array.from(document.querySelectorAll('{EASY_APPLY_MODAL_SELECTOR}')).some(dialog => "
+        "['application submitted', 'application was sent', 'application received', 'application was received']"
+        ".some(phrase => dialog.innerText.toLowerCase().includes(phrase)));"
+    ),
+    'site_submit_confirmed': (
+        "const text = document.body ? document.body.innerText.toLowerCase() : '';"
+        "return ['application submitted', 'application was sent', 'application received', 'application was received',"
+        " 'thank you for applying', 'thanks for applying'].some(phrase => text.includes(phrase));"
+    ),
+    'dropdown_open': (
+        "return document.evaluate(\"//div[contains(@class, 'dropdown') or contains(@class, 'menu')]"
+        "//div[contains(text(), 'India')]\", document, null, XPathResult.BOOLEAN_TYPE, null).booleanValue;"
+    )
+}
+
+# Apply kind, control text and company name of a job page in one script (no element references,
+# so it also works where results must be plain JSON). arguments[0]: company name selectors
+JOB_SUMMARY_JS = (
+    "const control = (function () {" + APPLY_CONTROL_JS + "})();\n"
+    "const hits = (function () {" + FIND_PRESENT_JS + "}).apply(null, [arguments[0], 'present']);\n"
+    "const company = hits.map((hit) => hit && hit.text).find(Boolean) || null;\n"
+    "return {kind: control.kind, text: control.text, company: company};"
+)
+
+# Open job pages in named background tabs from the listing tab, which keeps the window references
+# so it can read them later. arguments[0]: [tab name, url] pairs
+PREFETCH_OPEN_JS = """
+const tabs = window.__jobPrefetch = window.__jobPrefetch || {};
+for (const [name, url] of arguments[0]) tabs[name] = window.open(url, name);
+return Object.keys(tabs).length;
+"""
+
+# JOB_SUMMARY_JS run against every prefetched tab from the listing tab (same origin), plus the tab's JS heap
+# and DOM size. arguments[0]: tab names, arguments[1]: company name selectors. A tab that is still loading,
+# or whose reference was lost because the listing tab navigated, maps to null.
+PREFETCH_SUMMARY_JS = (
+    "const [names, companySelectors] = arguments;\n"
+    "const tabs = window.__jobPrefetch || {};\n"
+    "const summaries = {};\n"
+    "for (const name of names) {\n"
+    "    summaries[name] = null;\n"
+    "    const tab = tabs[name];\n"
+    "    try {\n"
+    "        if (!tab || tab.closed || tab.document.readyState === 'loading') continue;\n"
+    "        const summary = (function (document, window, getComputedStyle) {\n"
+    "            return (function () {" + JOB_SUMMARY_JS + "}).apply(null, [companySelectors]);\n"
+    "        })(tab.document, tab, tab.getComputedStyle.bind(tab));\n"
+    "        const memory = tab.performance.memory;\n"
+    "        summary.heap_mb = memory ? memory.usedJSHeapSize / 1048576 : null;\n"
+    "        summary.dom_nodes = tab.document.getElementsByTagName('*').length;\n"
+    "        summaries[name] = summary;\n"
+    "    } catch (e) {}\n"
+    "}\n"
+    "return summaries;"
+)
+
+# ERROR_PAGE_JS on a prefetched tab once it is the current one, plus its load time in ms from Navigation
+# Timing (null until the load event has fired), since the tab did not load inside a timed driver.get
+PREFETCH_LOAD_JS = (
+    "const entry = performance.getEntriesByType('navigation')[0];\n"
+    "const problem = (function () {" + ERROR_PAGE_JS + "})();\n"
+    "return {problem: problem, load_ms: entry && entry.loadEventEnd ? entry.loadEventEnd - entry.startTime : null};"
+)
+
+JOB_ID_PATTERN = re.compile(r"/jobs/view/(\d+)|[?&]currentJobId=(\d+)")
+
+def parse_job_id(job_url):
+    """Return the LinkedIn job ID from a /jobs/view/<id> (or currentJobId=<id>) URL, or None"""
+    match = JOB_ID_PATTERN.search(job_url or "")
+    return (match.group(1) or match.group(2)) if match else None
+
+def site_key(url):
+    """Key of an external site's profile: the host, plus the company's path segment on a shared ATS host"""
+    parts = urlsplit(url or "")
+    host = parts.netloc.lower()
+    tenant = parts.path.strip("/").split("/")[0].lower()
+    return f"{host}/{tenant}" if host in MULTI_TENANT_HOSTS and tenant else host
+
+def job_signature(job_title, company):
+    """Hashed title/company signature used when a job ID is not available"""
+    return hashlib.sha1(f"{job_title.lower().strip()}_{company.lower().strip()}".encode("utf-8")).hexdigest()
+
+class AppliedJobStore:
+    """SQLite history of submitted applications, keyed by LinkedIn job ID with the hashed signature
+    as a secondary index. Lookups are indexed queries, so nothing is loaded into memory at startup."""
+    def __init__(self, path=APPLIED_JOBS_DB):
+        self.path = path
+        self.lock = threading.Lock()  # One connection shared by pool workers
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS applied_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    signature TEXT NOT NULL,
+                    title TEXT,
+                    company TEXT,
+                    url TEXT,
+                    application_type TEXT,
+                    applied_at TEXT
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS applied_jobs_signature ON applied_jobs (signature)")
+            
+    def contains(self, job_id=None, signature=None):
+        """True if a job with this ID or signature hash was applied to in any run"""
+        with self.lock:
+            if job_id and self.conn.execute("SELECT 1 FROM applied_jobs WHERE job_id = ?", (job_id,)).fetchone():
+                return True
+            if signature and self.conn.execute("SELECT 1 FROM applied_jobs WHERE signature = ? LIMIT 1", (signature,)).fetchone():
+                return True
+        return False
+    
+    def add(self, job_data):
+        signature = job_signature(job_data['title'], job_data['company'])
+        # Jobs without a parseable ID fall back to their signature as the primary key
+        job_id = job_data.get('job_id') or parse_job_id(job_data.get('url')) or f"sig:{signature}"
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO applied_jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, signature, job_data['title'], job_data['company'], job_data.get('url'),
+                 job_data.get('application_type'), job_data.get('applied_at'))
+            )
+            
+    def count(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0]
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def normalize_field_text(text):
+    """Split camelCase, lowercase and collapse spaces, hyphens and underscores, so 'firstName' and
+    'First Name' both become 'first_name'"""
+    text = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", text or "")
+    return re.sub(r"[\s\-_]+", "_", text.lower())
+
+class FieldMatcher:
+    """FIELD_RULES compiled into a single regex. Every keyword of every rule is tried at each position
+    of a field descriptor in one scan, and the highest-priority rule found anywhere wins. Keywords only
+    match whole tokens, so 'state' does not fire inside 'statement' nor 'location' inside 'relocation'.
+    The name and id decide first; label texts are only read when those match nothing, and only when
+    they are short and not a question."""
+    def __init__(self, rules):
+        self.rules = rules
+        groups = []
+        for index, (_, _, keywords) in enumerate(rules):
+            alternatives = "|".join(re.escape(normalize_field_text(keyword)) for keyword in keywords)
+            groups.append(f"(?P<r{index}>{alternatives})")
+        # Zero-width lookahead so matches at every position are seen, not just non-overlapping ones.
+        # Underscores separate tokens, so the boundaries are letters and digits rather than \b.
+        self.pattern = re.compile(f"(?<![a-z0-9])(?=(?:{'|'.join(groups)})(?![a-z0-9]))")
+        self.cache = {}
+    
+    def match(self, *identifiers, labels=()):
+        """Return the (rule name, target, keywords) rule for a field, or None.
+        identifiers are its name and id, labels its placeholder, aria-label and label texts."""
+        key = (identifiers, tuple(labels))
+        if key in self.cache:
+            return self.cache[key]
+        rule = self.scan(identifiers)
+        if rule is None:
+            rule = self.scan(text for text in labels if self.is_short_label(text))
+        self.cache[key] = rule
+        return rule
+    
+    def match_field(self, field):
+        """match() for a FORM_INVENTORY_JS / STEP_INVENTORY_JS field"""
+        return self.match(field['name'], field['id'], labels=(field['placeholder'], field['aria_label'], field['label']))
+    
+    def scan(self, texts):
+        """The highest-priority rule with a keyword in any of the texts"""
+        descriptor = " ".join(normalize_field_text(text) for text in texts if text)
+        best = None
+        for found in self.pattern.finditer(descriptor):
+            index = int(found.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        return self.rules[best] if best is not None else None
+    
+    @staticmethod
+    def is_short_label(text):
+        """A field caption such as 'Postal code' rather than a question such as 'Are you open to relocation?'"""
+        return bool(text) and "?" not in text and len(re.findall(r"[a-z0-9]+", text.lower())) <= FIELD_LABEL_MAX_WORDS
+
+FIELD_MATCHER = FieldMatcher(FIELD_RULES)
+
+# Option texts that identify India in country and phone-code dropdowns, per handler rule
+COUNTRY_OPTION_KEYWORDS = {
+    'country': ['india'],
+    'phone_country': ['+91', 'india']
+}
+CONSENT_CHECKBOX_WORDS = ['term', 'privacy', 'agree', 'consent']
+
+QUESTION_STOPWORDS = {
+    'a', 'an', 'the', 'of', 'to', 'in', 'on', 'for', 'with', 'and', 'or', 'do', 'does', 'you', 'your',
+    'have', 'has', 'are', 'is', 'be', 'this', 'that', 'what', 'how', 'please', 'if', 'any', 'at', 'as'
+}
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = 8  # 8 bands of 4 rows: pairs above ~0.6 Jaccard almost always share a bucket
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_MAX_CANDIDATES = 256  # Similarity checks per lookup, taken from the most selective buckets first
+MINHASH_SEEDS = [(random.Random(seed).randrange(1, MINHASH_PRIME), random.Random(-seed).randrange(0, MINHASH_PRIME))
+                 for seed in range(1, MINHASH_PERMUTATIONS + 1)]
+
+def normalize_question(text):
+    """Lowercase, strip punctuation and collapse whitespace; also drops the trailing required marker"""
+    return " ".join(re.findall(r"[a-z0-9+#]+", (text or "").lower()))
+
+def question_tokens(question_key):
+    return frozenset(token for token in question_key.split() if token not in QUESTION_STOPWORDS)
+
+def option_range(option):
+    """Test for the numbers an option covers ("1-3 years", "10+ years", "Less than 1 year", "5"), or None
+    when the option does not name a number or a range"""
+    text = option.lower()
+    numbers = [float(number) for number in re.findall(r"\d+(?:\.\d+)?", text)]
+    if len(numbers) == 2 and re.search(r"\d\s*(?:-|–|to)\s*\d", text):
+        low, high = numbers
+        return lambda value: low <= value <= high
+    if len(numbers) != 1:
+        return None
+    bound = numbers[0]
+    if re.search(r"less than|fewer than|under|below", text):
+        return lambda value: value < bound
+    if re.search(r"up to|at most|or less", text):
+        return lambda value: value <= bound
+    if re.search(r"more than|over|above", text):
+        return lambda value: value > bound
+    if re.search(r"\+|at least|or more", text):
+        return lambda value: value >= bound
+    return lambda value: value == bound
+
+def match_option(answer, options):
+    """The option a stored answer names: the identical option, else the one numeric range holding a
+    numeric answer, else the one option containing every word of the answer. None when nothing or more
+    than one option matches, so "1" never becomes "10+ years" and "no" never becomes "Not sure"."""
+    wanted = answer.lower().strip()
+    for option in options:
+        if option.lower().strip() == wanted:
+            return option
+    number = re.fullmatch(r"(\d+(?:\.\d+)?)(?:\s*(?:years?|yrs?))?", wanted)
+    if number:
+        ranges = [(option, option_range(option)) for option in options]
+        hits = [option for option, covers in ranges if covers and covers(float(number.group(1)))]
+        if any(covers for _, covers in ranges):
+            return hits[0] if len(hits) == 1 else None
+    words = set(re.findall(r"[a-z0-9+#]+", wanted))
+    hits = [option for option in options if words and words <= set(re.findall(r"[a-z0-9+#]+", option.lower()))]
+    return hits[0] if len(hits) == 1 else None
+
+def minhash_bands(tokens):
+    """LSH band keys of a token set's MinHash signature"""
+    hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens]
+    signature = [min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in MINHASH_SEEDS]
+    rows = MINHASH_PERMUTATIONS // MINHASH_BANDS
+    return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(MINHASH_BANDS)]
+
+class AnswerBank:
+    """Persistent screening question -> answer store keyed by normalized question text.
+    Exact keys are a dict lookup; near-duplicates are found through MinHash LSH buckets and confirmed
+    with token-set Jaccard similarity. Questions without an answer go to a review queue."""
+    def __init__(self, path=ANSWER_BANK_DB):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.answers = {}  # question key -> answer
+        self.tokens = {}  # question key -> token set
+        self.by_tokens = {}  # token set -> question key, catches reordered / reworded-stopword questions
+        self.buckets = {}  # (band, band hash) -> question keys
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    question_key TEXT PRIMARY KEY,
+                    question TEXT,
+                    answer TEXT NOT NULL,
+                    updated_at TEXT
+                )""")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS pending_questions (
+                    question_key TEXT PRIMARY KEY,
+                    question TEXT,
+                    field_type TEXT,
+                    options TEXT,
+                    job_url TEXT,
+                    first_seen TEXT,
+                    times_seen INTEGER DEFAULT 1
+                )""")
+            for question_key, answer in self.conn.execute("SELECT question_key, answer FROM answers"):
+                self.index(question_key, answer)
+    
+    def index(self, question_key, answer):
+        tokens = question_tokens(question_key)
+        self.answers[question_key] = answer
+        self.tokens[question_key] = tokens
+        self.by_tokens[tokens] = question_key
+        if tokens:
+            for band in minhash_bands(tokens):
+                self.buckets.setdefault(band, set()).add(question_key)
+    
+    def lookup(self, question, options=None):
+        """Stored answer for this question or a near-identical one, or None.
+        With options, the answer must name exactly one of them (see match_option) and that option's text is returned."""
+        question_key = normalize_question(question)
+        if not question_key:
+            return None
+        answer = self.answers.get(question_key)
+        
+        if answer is None:
+            tokens = question_tokens(question_key)
+            if not tokens:
+                return None
+            if tokens in self.by_tokens:
+                return self.lookup(self.by_tokens[tokens], options)
+            
+            # Smallest buckets are the most similar questions; large ones are templated noise
+            best_score = ANSWER_MATCH_THRESHOLD
+            candidates = set()
+            buckets = sorted((self.buckets.get(band, ()) for band in minhash_bands(tokens)), key=len)
+            for bucket in buckets:
+                if candidates and len(candidates) + len(bucket) > MINHASH_MAX_CANDIDATES:
+                    break
+                candidates.update(bucket)
+            for candidate in candidates:
+                other = self.tokens[candidate]
+                score = len(tokens & other) / len(tokens | other)
+                if score >= best_score:
+                    best_score, answer = score, self.answers[candidate]
+        
+        if answer is None or not options:
+            return answer
+        return match_option(answer, options)
+    
+    def add(self, question, answer):
+        question_key = normalize_question(question)
+        if not question_key:
+            return
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?)",
+                              (question_key, question, answer, datetime.now().isoformat()))
+            self.conn.execute("DELETE FROM pending_questions WHERE question_key = ?", (question_key,))
+            self.index(question_key, answer)
+    
+    def queue_unknown(self, question, field_type, options=None, job_url=None):
+        """Record a question with no stored answer for offline review"""
+        question_key = normalize_question(question)
+        if not question_key:
+            return
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO pending_questions VALUES (?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(question_key) DO UPDATE SET times_seen = times_seen + 1""",
+                (question_key, question, field_type, json.dumps(options or []), job_url, datetime.now().isoformat()))
+    
+    def pending(self):
+        """Queued questions, most frequently seen first"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT question, field_type, options, job_url, times_seen FROM pending_questions "
+                "ORDER BY times_seen DESC").fetchall()
+        return [{'question': question, 'field_type': field_type, 'options': json.loads(options),
+                 'job_url': job_url, 'times_seen': times_seen}
+                for question, field_type, options, job_url, times_seen in rows]
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def field_question(field):
+    """The text a person would read for a field descriptor from COLLECT_FIELDS_JS"""
+    return field['label'] or field['aria_label'] or field['placeholder'] or field['name'] or field['id']
+
+def form_fingerprint(fields):
+    """Structural fingerprint of a form: a hash of its ordered field tags, types, names and labels"""
+    shape = "|".join(f"{field['tag']}:{field['type']}:{field['name'] or field['id']}:{normalize_field_text(field['label'])}"
+                     for field in fields)
+    return hashlib.sha1(shape.encode("utf-8")).hexdigest()[:16]
+
+def form_url_key(url):
+    """The form a plan belongs to: host and path of the page it was learned on"""
+    parts = urlsplit(url)
+    return parts.netloc + parts.path
+
+def field_selector(field):
+    """Direct CSS selector for a field descriptor: by id, else by tag and name (plus value for
+    checkbox and radio groups). None when the field has neither id nor name."""
+    quote = lambda text: text.replace("\\", "\\\\").replace('"', '\\"')
+    if field['id']:
+        return f'[id="{quote(field["id"])}"]'
+    if not field['name']:
+        return None
+    selector = f'{field["tag"]}[name="{quote(field["name"])}"]'
+    if field['type'] in ('checkbox', 'radio'):
+        selector += f'[value="{quote(field["value"])}"]'
+    return selector
+
+class FormPlanStore:
+    """Fill plans learned from company-site forms, keyed by form URL and fingerprint. A plan is a list of
+    {selector, action, source} steps; PERSONAL_INFO values and stored answers are referenced, not copied,
+    but text typed in by hand is stored as a literal and only ever replayed on the form it was typed into.
+    Each form URL keeps a revision count: learning a new fingerprint for the same form supersedes the old
+    plan, and a plan whose selectors stop matching is invalidated."""
+    def __init__(self, path=FORM_PLANS_DB):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            columns = self.conn.execute("PRAGMA table_info(form_plans)").fetchall()
+            if any(name == 'fingerprint' and primary_key == 1 for _, name, _, _, _, primary_key in columns):
+                # Plans are a cache: a table from when plans were keyed on the fingerprint alone is relearned
+                self.conn.execute("DROP TABLE form_plans")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS form_plans (
+                    fingerprint TEXT NOT NULL,
+                    form_key TEXT NOT NULL,
+                    plan_version INTEGER NOT NULL,
+                    revision INTEGER NOT NULL,
+                    steps TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    uses INTEGER DEFAULT 0,
+                    learned_at TEXT,
+                    last_used TEXT,
+                    PRIMARY KEY (form_key, fingerprint)
+                )""")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS form_plans_form_key ON form_plans (form_key)")
+    
+    def get(self, fingerprint, form_key):
+        """Active plan for this form and fingerprint in the current FORM_PLAN_VERSION, or None. A plan
+        learned on another form with the same fingerprint (an ATS template several companies use) is
+        borrowed only when it has no text literals, which may be answers meant for that company."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT form_key, revision, steps FROM form_plans WHERE fingerprint = ? AND status = 'active' "
+                "AND plan_version = ? ORDER BY form_key = ? DESC, learned_at DESC",
+                (fingerprint, FORM_PLAN_VERSION, form_key)).fetchall()
+        for key, revision, steps in rows:
+            steps = json.loads(steps)
+            if key == form_key or not any((step['source'] or '').startswith('text:') for step in steps):
+                return {'fingerprint': fingerprint, 'form_key': key, 'revision': revision, 'steps': steps}
+        return None
+    
+    def learn(self, fingerprint, form_key, steps):
+        """Store a plan as the next revision of its form; returns the revision"""
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            revision = self.conn.execute("SELECT COALESCE(MAX(revision), 0) + 1 FROM form_plans WHERE form_key = ?",
+                                         (form_key,)).fetchone()[0]
+            self.conn.execute("UPDATE form_plans SET status = 'superseded' WHERE form_key = ? AND status = 'active'",
+                              (form_key,))
+            self.conn.execute("""
+                INSERT OR REPLACE INTO form_plans VALUES (?, ?, ?, ?, ?, 'active', 0, ?, NULL)""",
+                (fingerprint, form_key, FORM_PLAN_VERSION, revision, json.dumps(steps), now))
+        return revision
+    
+    def used(self, fingerprint, form_key):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE form_plans SET uses = uses + 1, last_used = ? WHERE form_key = ? AND fingerprint = ?",
+                              (datetime.now().isoformat(), form_key, fingerprint))
+    
+    def invalidate(self, fingerprint, form_key):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE form_plans SET status = 'invalid' WHERE form_key = ? AND fingerprint = ?",
+                              (form_key, fingerprint))
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class SiteProfileStore:
+    """Per-domain knowledge about external sites, kept across runs.
+    consent_handlers: which cookie-consent handler dismissed the banner on a domain last time.
+    site_profiles: the apply selector that led to a submitted form ('' when the form is on the landing
+    page), whether a cookie banner showed up, whether the site is a login wall, a moving average of the
+    load time, and the failure streak behind the negative cache.
+    company_sites: the domain each company's LinkedIn apply button led to, so a skipped domain's jobs are
+    recognised before the button is clicked.
+    Consent handlers are kept per host; site profiles and company sites per site_key(), so the companies
+    sharing an ATS host are profiled (and skipped) one by one."""
+    def __init__(self, path=SITE_PROFILES_DB):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS consent_handlers (
+                    domain TEXT PRIMARY KEY,
+                    handler TEXT NOT NULL,
+                    hits INTEGER DEFAULT 1,
+                    updated_at TEXT
+                )""")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS site_profiles (
+                    domain TEXT PRIMARY KEY,
+                    apply_selector TEXT,
+                    cookie_banner INTEGER,
+                    login_wall INTEGER DEFAULT 0,
+                    visits INTEGER DEFAULT 0,
+                    successes INTEGER DEFAULT 0,
+                    failure_streak INTEGER DEFAULT 0,
+                    load_ms REAL,
+                    updated_at TEXT
+                )""")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS company_sites (
+                    company TEXT PRIMARY KEY,
+                    domain TEXT NOT NULL
+                )""")
+    
+    def _profile(self, domain):
+        """Read a profile; the caller holds self.lock"""
+        cursor = self.conn.execute("SELECT * FROM site_profiles WHERE domain = ?", (domain,))
+        row = cursor.fetchone()
+        return dict(zip([column[0] for column in cursor.description], row)) if row else None
+    
+    def profile(self, domain):
+        with self.lock:
+            return self._profile(domain)
+    
+    def _upsert(self, domain, inserted, updates):
+        """Create the profile from inserted, or apply the SQL updates to the existing row, in one statement
+        under the lock, so workers recording the same domain never overwrite each other's counters"""
+        values = {'apply_selector': None, 'cookie_banner': None, 'login_wall': 0, 'visits': 0, 'successes': 0,
+                  'failure_streak': 0, 'load_ms': None, **inserted}
+        with self.lock, self.conn:
+            self.conn.execute(f"""
+                INSERT INTO site_profiles (domain, {', '.join(SITE_PROFILE_COLUMNS)}, updated_at)
+                VALUES ({', '.join('?' * (len(SITE_PROFILE_COLUMNS) + 2))})
+                ON CONFLICT(domain) DO UPDATE SET {', '.join(updates + ['updated_at = excluded.updated_at'])}""",
+                (domain, *(values[column] for column in SITE_PROFILE_COLUMNS), datetime.now().isoformat()))
+            return self._profile(domain)
+    
+    def update_profile(self, domain, **changes):
+        """Merge changes into a domain's profile, creating it on the first visit"""
+        unknown = set(changes) - set(SITE_PROFILE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown site profile fields: {', '.join(sorted(unknown))}")
+        return self._upsert(domain, changes, [f"{column} = excluded.{column}" for column in changes])
+    
+    def record_visit(self, domain, success=None, apply_selector=None, login_wall=False, load_ms=None):
+        """Record one application attempt: success True or False, or None when it stopped for manual
+        input, which says nothing about the site. A failure forgets the learned apply selector.
+        The counters are incremented in SQL rather than read and written back."""
+        inserted = {'visits': 1, 'login_wall': int(login_wall)}
+        updates = ["visits = visits + 1", "login_wall = excluded.login_wall"]
+        if load_ms:
+            inserted['load_ms'] = load_ms
+            updates.append("load_ms = CASE WHEN load_ms IS NULL THEN excluded.load_ms "
+                           "ELSE load_ms * 0.7 + excluded.load_ms * 0.3 END")
+        if success:
+            inserted.update(successes=1, apply_selector=apply_selector)
+            updates += ["successes = successes + 1", "failure_streak = 0", "apply_selector = excluded.apply_selector"]
+        elif success is False:
+            inserted['failure_streak'] = 1
+            updates += ["failure_streak = failure_streak + 1", "apply_selector = NULL"]
+        return self._upsert(domain, inserted, updates)
+    
+    def link_company(self, company, domain):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO company_sites VALUES (?, ?)", (company.lower(), domain))
+    
+    def blocked_reason(self, domain=None, company=None):
+        """Why jobs on this site (or this company's usual site) are skipped, or None"""
+        if domain is None and company:
+            with self.lock:
+                row = self.conn.execute("SELECT domain FROM company_sites WHERE company = ?", (company.lower(),)).fetchone()
+            # Links saved before profiles were kept per tenant point at the whole shared host
+            domain = row[0] if row and row[0] not in MULTI_TENANT_HOSTS else None
+        profile = self.profile(domain) if domain else None
+        if not profile or datetime.now() - datetime.fromisoformat(profile['updated_at']) > timedelta(days=SITE_BLOCK_DAYS):
+            return None
+        if profile['login_wall']:
+            return f"{domain} requires signing in"
+        if profile['failure_streak'] >= SITE_FAILURE_LIMIT:
+            return f"{domain} failed the last {profile['failure_streak']} applications"
+        return None
+    
+    def page_timeout(self, domain):
+        """Readiness timeout from the domain's typical load time (None when unknown)"""
+        profile = self.profile(domain)
+        if not profile or not profile['load_ms']:
+            return None
+        return min(WAIT_TIMEOUT, max(3.0, profile['load_ms'] * 3 / 1000))
+    
+    def consent_handler(self, domain):
+        with self.lock:
+            row = self.conn.execute("SELECT handler FROM consent_handlers WHERE domain = ?", (domain,)).fetchone()
+        return row[0] if row else None
+    
+    def learn_consent(self, domain, handler):
+        """Remember the handler that worked; hits count how often it worked in a row"""
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO consent_handlers (domain, handler, hits, updated_at) VALUES (?, ?, 1, ?)
+                ON CONFLICT(domain) DO UPDATE SET
+                    hits = CASE WHEN handler = excluded.handler THEN hits + 1 ELSE 1 END,
+                    handler = excluded.handler, updated_at = excluded.updated_at""",
+                (domain, handler, datetime.now().isoformat()))
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class ManualInputQueue:
+    """Persistent tasks for company-site forms that stopped on required fields nobody could fill.
+    A task keeps the job and form URLs, the form fingerprint and the unfilled fields' metadata.
+    It stays needs_input until the batch command answers and replays it (applied or failed)."""
+    def __init__(self, path=MANUAL_INPUT_DB):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS manual_tasks (
+                    job_url TEXT PRIMARY KEY,
+                    site_url TEXT,
+                    title TEXT,
+                    company TEXT,
+                    fingerprint TEXT,
+                    fields TEXT,
+                    status TEXT NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    updated_at TEXT
+                )""")
+    
+    def add(self, job):
+        """Save a needs-input job; a job seen again replaces its earlier task"""
+        fields = [{key: value for key, value in field.items() if key != 'element'} for field in job['fields']]
+        with self.lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO manual_tasks VALUES (?, ?, ?, ?, ?, ?, 'needs_input', 0, ?)
+                ON CONFLICT(job_url) DO UPDATE SET site_url = excluded.site_url, fingerprint = excluded.fingerprint,
+                    fields = excluded.fields, status = 'needs_input', updated_at = excluded.updated_at""",
+                (job['url'], job['site_url'], job['title'], job['company'], job['fingerprint'], json.dumps(fields),
+                 datetime.now().isoformat()))
+    
+    def set_status(self, job_url, status):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE manual_tasks SET status = ?, attempts = attempts + 1, updated_at = ? WHERE job_url = ?",
+                              (status, datetime.now().isoformat(), job_url))
+    
+    def pending(self):
+        """Tasks still waiting for input, oldest first"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT job_url, site_url, title, company, fingerprint, fields FROM manual_tasks "
+                "WHERE status = 'needs_input' ORDER BY updated_at").fetchall()
+        return [{'job_url': job_url, 'site_url': site_url, 'title': title, 'company': company,
+                 'fingerprint': fingerprint, 'fields': json.loads(fields)}
+                for job_url, site_url, title, company, fingerprint, fields in rows]
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class EventLog:
+    """Buffered JSONL event sink. emit() only enqueues; a background thread writes events in batches,
+    so logging never blocks the browser loop. Shared by pool workers."""
+    def __init__(self, path=LOG_FILE, enabled=True):
+        self.path = path
+        self.enabled = enabled
+        self.events = queue.Queue()
+        self.writer = None
+        if enabled:
+            self.writer = threading.Thread(target=self.write_loop, name="event-log-writer", daemon=True)
+            self.writer.start()
+    
+    def emit(self, event, **fields):
+        if self.enabled:
+            self.events.put({'ts': datetime.now().isoformat(), 'event': event, **fields})
+    
+    def write_loop(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                batch.append(self.events.get(timeout=EVENT_LOG_FLUSH_SECONDS))
+                while len(batch) < EVENT_LOG_FLUSH_EVERY:
+                    batch.append(self.events.get_nowait())
+            except queue.Empty:
+                pass
+            if None in batch:
+                stopping = True
+                batch = [event for event in batch if event is not None]
+            if batch:
+                with open(self.path, "a", encoding="utf-8") as log_file:
+                    log_file.write("".join(json.dumps(event, default=str) + "\n" for event in batch))
+    
+    def close(self):
+        """Flush everything still buffered and stop the writer"""
+        if self.writer and self.writer.is_alive():
+            self.events.put(None)
+            self.writer.join()
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+def summarize_event_logs(pattern="linkedin_job_applications_*.jsonl"):
+    """Print p50/p95 duration and WebDriver calls per span phase across every matching run log"""
+    phases = {}
+    paths = sorted(glob.glob(pattern))
+    for path in paths:
+        with open(path, encoding="utf-8") as log_file:
+            for line in log_file:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if event.get('event') == 'span':
+                    phases.setdefault(event['phase'], []).append(event)
+    
+    print(f"Span summary across {len(paths)} run logs ({pattern})")
+    print("-" * 78)
+    print(f"{'phase':<22}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p50 calls':>11}{'p95 calls':>11}{'failed':>8}")
+    for phase, events in sorted(phases.items()):
+        durations = [event['duration_ms'] for event in events]
+        calls = [event.get('webdriver_calls', 0) for event in events]
+        failed = sum(1 for event in events if not event.get('ok', True))
+        print(f"{phase:<22}{len(events):>7}{percentile(durations, 0.5):>10.0f}{percentile(durations, 0.95):>10.0f}"
+              f"{percentile(calls, 0.5):>11}{percentile(calls, 0.95):>11}{failed:>8}")
+    return phases
+
+class WebDriverProfiler:
+    """Count and time chromedriver commands, attributed to the LinkedInJobBot method that issued them.
+    Helpers such as WaitEngine, the generic bot helpers in PROFILE_HELPER_METHODS and lambdas or
+    comprehensions are skipped while walking the stack, so their calls land on the bot method that
+    used them. Shared by pool workers."""
     def __init__(self):
-        self.setup_driver()
+        self.lock = threading.Lock()
+        self.stats = {}  # (method, command) -> [calls, seconds]
+    
+    def caller(self, frame):
+        while frame is not None:
+            name = frame.f_code.co_name
+            if (name not in PROFILE_HELPER_METHODS and not name.startswith("<")
+                    and isinstance(frame.f_locals.get('self'), LinkedInJobBot)):
+                return name
+            frame = frame.f_back
+        return "<outside bot>"
+    
+    def record(self, frame, command, seconds):
+        key = (self.caller(frame), command)
+        with self.lock:
+            entry = self.stats.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+    
+    def report(self):
+        """Per-method totals, slowest first: [(method, calls, seconds, {command: (calls, seconds)})]"""
+        methods = {}
+        with self.lock:
+            items = list(self.stats.items())
+        for (method, command), (calls, seconds) in items:
+            total = methods.setdefault(method, [0, 0.0, {}])
+            total[0] += calls
+            total[1] += seconds
+            total[2][command] = (calls, seconds)
+        return sorted(((method, calls, seconds, commands) for method, (calls, seconds, commands) in methods.items()),
+                      key=lambda row: row[2], reverse=True)
+    
+    def print_report(self, rows=PROFILE_REPORT_ROWS):
+        report = self.report()
+        total_calls = sum(row[1] for row in report)
+        total_seconds = sum(row[2] for row in report)
+        print(f"\nWebDriver hot spots: {total_calls} commands, {total_seconds:.1f}s in chromedriver")
+        print("-" * 78)
+        print(f"{'method':<36}{'calls':>8}{'seconds':>10}{'share':>8}  top commands")
+        for method, calls, seconds, commands in report[:rows]:
+            top = sorted(commands.items(), key=lambda item: item[1][1], reverse=True)[:3]
+            share = seconds / total_seconds * 100 if total_seconds else 0
+            print(f"{method:<36}{calls:>8}{seconds:>10.2f}{share:>7.0f}%  "
+                  + ", ".join(f"{command} x{count}" for command, (count, _) in top))
+        return report
+
+class RateGovernor:
+    """Token buckets per action class, shared by every browser of a run. acquire() blocks until the class
+    has a token; the time spent working since the previous action already counts towards the interval,
+    so pacing never stacks on top of slow pages and throughput settles at the configured budget.
+    Waits are jittered around their scheduled slot, and report() divides a class's rate after slow
+    responses or error pages until responses are normal again."""
+    def __init__(self, budgets=None, jitter=RATE_JITTER):
+        self.budgets = budgets or RATE_BUDGETS
+        self.jitter = jitter
+        self.lock = threading.Lock()
+        now = time.monotonic()
+        self.buckets = {action: {'tokens': float(burst), 'updated': now, 'backoff': 1.0}
+                        for action, (_, burst) in self.budgets.items()}
+        self.stats = {action: {'actions': 0, 'waited': 0.0, 'backoffs': 0} for action in self.budgets}
+    
+    def rate(self, action):
+        """Tokens per second for an action class, after backoff"""
+        return self.budgets[action][0] / 60 / self.buckets[action]['backoff']
+    
+    def acquire(self, action):
+        """Block until an action of this class may run; returns the seconds waited"""
+        if action not in self.budgets:
+            return 0.0
+        with self.lock:
+            bucket = self.buckets[action]
+            rate = self.rate(action)
+            now = time.monotonic()
+            bucket['tokens'] = min(self.budgets[action][1], bucket['tokens'] + (now - bucket['updated']) * rate)
+            bucket['updated'] = now
+            # Take the token now; a negative balance is this caller's place in the schedule
+            bucket['tokens'] -= 1
+            wait = -bucket['tokens'] / rate if bucket['tokens'] < 0 else 0.0
+            if wait > 0:
+                # The bucket keeps the schedule, so jitter moves single actions without changing the mean rate
+                wait = max(0.0, wait + random.uniform(-self.jitter, self.jitter) / rate)
+            self.stats[action]['actions'] += 1
+            self.stats[action]['waited'] += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def report(self, action, seconds, error=False):
+        """Feed back how long an action's response took. Returns True when it triggered a backoff."""
+        if action not in self.budgets:
+            return False
+        with self.lock:
+            bucket = self.buckets[action]
+            if error or seconds > RATE_SLOW_RESPONSE:
+                bucket['backoff'] = min(RATE_MAX_BACKOFF, bucket['backoff'] * RATE_BACKOFF_FACTOR)
+                self.stats[action]['backoffs'] += 1
+                return True
+            bucket['backoff'] = max(1.0, bucket['backoff'] * RATE_RECOVERY)
+            return False
+    
+    def summary(self):
+        with self.lock:
+            return {action: dict(stats, backoff=self.buckets[action]['backoff'])
+                    for action, stats in self.stats.items() if stats['actions']}
+
+class WaitEngine:
+    """Poll a readiness condition until the page reaches a state, instead of sleeping for a worst-case guess.
+    Conditions are JavaScript snippets from PAGE_STATE_CONDITIONS or callables taking the driver.
+    This is separate from pacing, which is the rate governor's policy."""
+    def __init__(self, driver, timeout=WAIT_TIMEOUT, min_poll=WAIT_MIN_POLL, max_poll=WAIT_MAX_POLL):
+        self.driver = driver
+        self.timeout = timeout
+        self.min_poll = min_poll
+        self.max_poll = max_poll
+        self.timings = {}  # state -> list of (seconds waited, condition met)
+        
+    def check(self, condition, args):
+        try:
+            if callable(condition):
+                return condition(self.driver)
+            return self.driver.execute_script(condition, *args)
+        except Exception:
+            # Navigation in progress or stale elements simply mean "not ready yet"
+            return False
+        
+    def until(self, state, *args, condition=None, timeout=None):
+        """Wait for a page state; returns the truthy condition result, or False on timeout"""
+        condition = condition or PAGE_STATE_CONDITIONS[state]
+        timeout = min(timeout or self.timeout, self.timeout)
+        start = time.perf_counter()
+        deadline = start + timeout
+        interval = self.min_poll
+        
+        while True:
+            result = self.check(condition, args)
+            now = time.perf_counter()
+            if result or now >= deadline:
+                self.timings.setdefault(state, []).append((now - start, bool(result)))
+                return result or False
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 1.5, self.max_poll)
+            
+    def summary(self):
+        """Per-state wait statistics: count, average, worst case and timeouts"""
+        report = {}
+        for state, samples in self.timings.items():
+            durations = [seconds for seconds, _ in samples]
+            report[state] = {
+                'count': len(samples),
+                'avg': sum(durations) / len(durations),
+                'max': max(durations),
+                'timeouts': sum(1 for _, met in samples if not met)
+            }
+        return report
+
+class CompanySiteLane:
+    """Background lane for company-site applications. The LinkedIn loop only captures the external URL
+    and submits it here; lane workers, each with its own browser, fill the forms meanwhile.
+    Lane workers never prompt: fields nobody can fill leave the job in the needs-input list."""
+    def __init__(self, owner, size=None):
+        self.owner = owner
+        self.size = size or COMPANY_SITE_WORKERS
+        self.jobs = queue.Queue()
+        self.lock = threading.Lock()
+        self.workers = []
+        self.threads = []
+        self.submitted = 0
+    
+    def submit(self, job_data):
+        with self.lock:
+            if not self.threads:
+                self.start()
+            self.submitted += 1
+        self.jobs.put(job_data)
+    
+    def start(self):
+        for lane_id in range(1, self.size + 1):
+            worker = self.owner.spawn_worker(lane_id, prefix="C", copy_session=False)
+            worker.interactive = False
+            self.workers.append(worker)
+            thread = threading.Thread(target=self.work, args=(worker,), name=f"company-site-{lane_id}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        self.owner.log(f"Started company-site lane with {self.size} browser(s)", "COMPANY")
+    
+    def work(self, worker):
+        while True:
+            job_data = self.jobs.get()
+            if job_data is None:
+                break
+            worker.log(f" Company site application: {job_data['title']} at {job_data['company']}", "COMPANY")
+            try:
+                worker.load_page(job_data['site_url'], 'company_site')
+                worker.waits.until('page_ready', timeout=worker.site_profiles.page_timeout(site_key(job_data['site_url'])))
+                worker.handle_cookies_popup()
+                success, reason = worker.complete_company_site_application(
+                    job_data['title'], job_data['company'], job_data['url'])
+            except Exception as e:
+                success, reason = False, str(e)
+            if not success:
+                worker.log(f" Company site application failed: {job_data['title']} - {reason}", "WARNING")
+                worker.record_failure(job_data, reason)
+    
+    def close(self, wait=True):
+        """Let the lane finish every queued application, then close its browsers.
+        With wait=False (interrupted runs) the browsers are closed straight away."""
+        for _ in self.threads:
+            self.jobs.put(None)
+        for thread in self.threads if wait else []:
+            thread.join()
+        for worker in self.workers:
+            try:
+                worker.driver.quit()
+            except:
+                pass
+        return self.submitted
+
+class RunCheckpoint:
+    """Run state for --resume: the keyword position, every discovered job with its status, how many
+    result pages of the current keyword were read, and the result lists. Every save goes through a temp
+    file and os.replace, so a crash leaves either the previous checkpoint or the new one, never a torn one."""
+    def __init__(self, owner, path=CHECKPOINT_FILE, state=None):
+        self.owner = owner
+        self.path = path
+        self.lock = threading.Lock()
+        self.state = state or {
+            'started_at': datetime.now().isoformat(),
+            'keyword_index': 0,
+            'pages_read': 0,
+            'crawl_done': False,
+            'jobs': {},  # url -> title, job_id, keyword_index, status (pending, queued, applied, failed)
+            'completed': False
+        }
+    
+    @classmethod
+    def load(cls, owner, path=CHECKPOINT_FILE):
+        """The checkpoint of the last run, or None when there is none or that run completed"""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as checkpoint_file:
+            state = json.load(checkpoint_file)
+        if state.get('completed'):
+            return None
+        return cls(owner, path, state)
+    
+    def restore(self):
+        """Put the saved result lists back on the owner bot"""
+        with self.owner.results_lock:
+            self.owner.applied_jobs.extend(self.state.get('applied_jobs', []))
+            self.owner.failed_jobs.extend(self.state.get('failed_jobs', []))
+            self.owner.company_site_jobs.extend(self.state.get('company_site_jobs', []))
+            self.owner.applied_signatures.update(job['signature'] for job in self.state.get('applied_jobs', [])
+                                                 if job.get('signature'))
+    
+    def start_keyword(self, keyword_index):
+        """Move to a later keyword; going back over earlier keywords on resume keeps the saved position"""
+        with self.lock:
+            if keyword_index <= self.state['keyword_index']:
+                return
+            self.state.update(keyword_index=keyword_index, pages_read=0, crawl_done=False)
+        self.save()
+    
+    def jobs_found(self, jobs):
+        with self.lock:
+            for job in jobs:
+                self.state['jobs'].setdefault(job['url'], {
+                    'title': job['title'],
+                    'job_id': job.get('job_id'),
+                    'keyword_index': self.state['keyword_index'],
+                    'status': 'pending'
+                })
+    
+    def page_read(self, page, crawl_done=False):
+        with self.lock:
+            self.state['pages_read'] = page + 1
+            self.state['crawl_done'] = crawl_done
+        self.save()
+    
+    def job_status(self, job_url, status):
+        with self.lock:
+            if job_url not in self.state['jobs']:
+                return
+            self.state['jobs'][job_url]['status'] = status
+        self.save()
+    
+    def resume_plan(self, keyword_index):
+        """What is left of a keyword: its unfinished jobs (queued company-site jobs included, since the
+        lane died with the run), the job IDs already seen, and where its crawl continues"""
+        with self.lock:
+            jobs = [(url, job) for url, job in self.state['jobs'].items() if job['keyword_index'] == keyword_index]
+            current = keyword_index == self.state['keyword_index']
+            return {
+                'jobs': [{'url': url, 'title': job['title'], 'job_id': job['job_id']}
+                         for url, job in jobs if job['status'] in ('pending', 'queued')],
+                'seen_jobs': {job['job_id'] or url for url, job in jobs},
+                'start_page': self.state['pages_read'] if current else 0,
+                'crawl_done': self.state['crawl_done'] if current else keyword_index < self.state['keyword_index'],
+                'remaining': MAX_JOBS_PER_KEYWORD - len(jobs)
+            }
+    
+    def totals(self):
+        """(jobs found, jobs finished, jobs applied) over the whole checkpoint"""
+        with self.lock:
+            statuses = [job['status'] for job in self.state['jobs'].values()]
+        return len(statuses), sum(1 for status in statuses if status in ('applied', 'failed')), statuses.count('applied')
+    
+    def save(self, completed=False):
+        with self.owner.results_lock:
+            results = {
+                'applied_jobs': list(self.owner.applied_jobs),
+                'failed_jobs': list(self.owner.failed_jobs),
+                'company_site_jobs': list(self.owner.company_site_jobs)
+            }
+        with self.lock:
+            if completed:
+                self.state['completed'] = True
+            self.state.update(results, saved_at=datetime.now().isoformat())
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+                json.dump(self.state, checkpoint_file, default=str)
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(temp_path, self.path)
+
+class JobPrefetcher:
+    """Keeps the current job and the next `depth` jobs loading in named background tabs opened from
+    the listing tab (the hub), so a job page is usually ready by the time it is reached. The company
+    name and apply kind of every loaded tab are read from the hub in one script, together with each
+    tab's JS heap and DOM size for the memory report."""
+    def __init__(self, owner, depth=PREFETCH_JOBS):
+        self.owner = owner
+        self.depth = depth
+        self.hub = None  # Window handle of the listing tab; never closed
+        self.tabs = {}  # job url -> tab name
+        self.handles = {}  # tab name -> window handle; switching by name walks every open window
+        self.opened_at = {}  # job url -> perf_counter() when its tab was opened
+        self.current = None  # Window handle (or tab name) of the job being applied to
+        self.counter = itertools.count(1)
+        self.opened = 0
+        self.hits = 0  # Jobs that found their page already loaded
+        self.memory = []  # (heap MB, DOM nodes) of every tab when its job was reached
+
+    @property
+    def active(self):
+        return self.hub is not None
+
+    def iterate(self, job_links, limit=None):
+        """Yield the jobs in order, with tabs open for the yielded job and the `depth` after it.
+        The next jobs are pulled (and a crawl may navigate) only from the hub. No more than `limit` jobs
+        are pulled, so no tab is opened for a job the caller will never reach."""
+        self.hub = self.owner.driver.current_window_handle
+        jobs = iter(job_links) if limit is None else itertools.islice(job_links, limit)
+        upcoming = deque()
+        while True:
+            while len(upcoming) <= self.depth:
+                job = next(jobs, None)
+                if job is None:
+                    break
+                upcoming.append(job)
+            if not upcoming:
+                return
+            self.fill(upcoming)
+            yield upcoming.popleft()
+
+    def fill(self, jobs):
+        """Open a tab for every job that has none; each one counts as a paced page load, and without
+        the rate governor consecutive opens are spaced by random_delay like any other navigation"""
+        opened = 0
+        for job in jobs:
+            url = job['url']
+            if url in self.tabs or self.owner.is_job_id_already_applied(url):
+                continue
+            name = f"prefetch-{next(self.counter)}"
+            if opened:
+                self.owner.random_delay()
+            self.owner.pace('page_load')
+            try:
+                before = set(self.owner.driver.window_handles)
+                self.owner.driver.execute_script(PREFETCH_OPEN_JS, [[name, url]])
+                new_handles = set(self.owner.driver.window_handles) - before
+            except Exception as e:
+                self.owner.log(f"Could not prefetch {url}: {e}", "DEBUG")
+                continue
+            if len(new_handles) == 1:
+                self.handles[name] = new_handles.pop()
+            self.tabs[url] = name
+            self.opened_at[url] = time.perf_counter()
+            self.opened += 1
+            opened += 1
+
+    def read(self):
+        """Summaries of every open tab, read from the hub in one call"""
+        try:
+            return self.owner.driver.execute_script(PREFETCH_SUMMARY_JS, list(self.tabs.values()),
+                                                    COMPANY_NAME_SELECTORS) or {}
+        except Exception:
+            return {}
+
+    def take(self, job_url):
+        """Switch to the job's tab and wait for it like load_page would: error pages and the load time
+        are reported to the rate governor and the page stats are recorded. Returns the tab's summary
+        ({} when it could not be read yet), or None when the job has no tab and must be loaded in the
+        current one."""
+        name = self.tabs.get(job_url)
+        if not name:
+            return None
+        summary = self.read().get(name) or {}
+        del self.tabs[job_url]
+        opened_at = self.opened_at.pop(job_url)
+        window = self.handles.pop(name, name)
+        try:
+            self.owner.driver.switch_to.window(window)
+        except Exception:
+            return None
+        self.current = window
+        loaded = self.owner.waits.until('job_page_loaded')
+        self.report_load(opened_at, loaded)
+        self.owner.record_page_stats("job")
+        if summary:
+            self.hits += 1
+            if summary.get('heap_mb') is not None:
+                self.memory.append((summary['heap_mb'], summary['dom_nodes']))
+                self.owner.log(f"Prefetch tab {name}: {summary['heap_mb']:.1f} MB JS heap, "
+                               f"{summary['dom_nodes']} DOM nodes", "DEBUG")
+        return summary
+
+    def report_load(self, opened_at, loaded):
+        """Feed the current tab's load back to the rate governor; a tab that never loaded counts like
+        a driver.get timeout"""
+        if not self.owner.governor:
+            return
+        if not loaded:
+            self.owner.report_page_load('page_load', time.perf_counter() - opened_at, "Prefetched page did not load")
+            return
+        try:
+            load = self.owner.driver.execute_script(PREFETCH_LOAD_JS)
+        except Exception as e:
+            self.owner.log(f"Could not check the prefetched page: {e}", "DEBUG")
+            return
+        seconds = load['load_ms'] / 1000 if load['load_ms'] else time.perf_counter() - opened_at
+        self.owner.report_page_load('page_load', seconds, load['problem'])
+
+    def release(self):
+        """Close the finished job's tab and go back to the hub"""
+        driver = self.owner.driver
+        if self.current:
+            try:
+                driver.switch_to.window(self.current)
+                driver.close()
+            except Exception:
+                pass
+            self.current = None
+        try:
+            driver.switch_to.window(self.hub)
+        except Exception as e:
+            self.owner.log(f"Could not return to the listing tab: {e}", "WARNING")
+
+    def close(self):
+        """Close the tabs of jobs that were never reached and leave the hub as the current tab"""
+        if not self.active:
+            return
+        driver = self.owner.driver
+        for name in list(self.tabs.values()):
+            try:
+                driver.switch_to.window(self.handles.get(name, name))
+                driver.close()
+            except Exception:
+                pass
+        self.tabs.clear()
+        self.handles.clear()
+        self.opened_at.clear()
+        self.current = None
+        driver.switch_to.window(self.hub)
+        self.hub = None
+
+    def summary(self):
+        heaps = [heap for heap, _ in self.memory]
+        return {
+            'opened': self.opened,
+            'hits': self.hits,
+            'avg_heap_mb': sum(heaps) / len(heaps) if heaps else 0.0,
+            'max_heap_mb': max(heaps, default=0.0),
+            'avg_dom_nodes': sum(nodes for _, nodes in self.memory) / len(self.memory) if self.memory else 0
+        }
+
+class LinkedInJobBot:
+    def __init__(self, headless=False, applied_store=None, answer_bank=None, lean=None, event_log=None,
+                 profiler=None, manual_inputs=None, form_plans=None, governor=None, site_profiles=None,
+                 resume_path=None):
+        self.started_at = time.perf_counter()
+        self.webdriver_calls = 0  # Every chromedriver command this bot has sent, for span accounting
+        self.profiler = profiler or (WebDriverProfiler() if PROFILE_WEBDRIVER else None)
+        self.start_mode = "cold"
+        self.first_search_logged = False
+        self.log_prefix = ""  # Set on pool workers so interleaved output stays readable
+        self.page_stats = []  # Transfer size and load time of every recorded page
+        self.setup_driver(headless, LEAN_BROWSER_PROFILE if lean is None else lean)
         self.wait = WebDriverWait(self.driver, 15)
+        self.waits = WaitEngine(self.driver)
+        self.base_url = LINKEDIN_BASE_URL
         self.applied_jobs = []
         self.failed_jobs = []
         self.company_site_jobs = []  # Track jobs that require company site application
+        self.needs_input_jobs = []  # Company-site jobs left with required fields nobody could fill
+        self.interactive = True  # False on lane workers: never stop on input()
+        self.unfilled_fields = []  # Descriptors of required company-site fields left for manual input
+        self.site_apply_selector = None  # Company-site apply selector that led to the form, for the domain profile
+        self.company_site_lane = None  # Set by run() when ASYNC_COMPANY_SITES is on
+        self.results_lock = threading.Lock()  # Shared with pool workers that append to the lists above
+        self.applied_signatures = set()  # Signatures applied to during this run
+        self.applied_store = applied_store or AppliedJobStore(APPLIED_JOBS_DB)
+        self.page_loads_saved = 0  # Job pages triage decided not to open
+        self.answer_bank = answer_bank or AnswerBank(ANSWER_BANK_DB)
+        self.manual_inputs = manual_inputs or ManualInputQueue(MANUAL_INPUT_DB)
+        self.form_plans = form_plans or FormPlanStore(FORM_PLANS_DB)
+        self.site_profiles = site_profiles or SiteProfileStore(SITE_PROFILES_DB)
+        self.current_job_url = None  # Recorded with screening questions queued for review
+        self.resume_path = RESUME_PATH if resume_path is None else resume_path  # Uploaded to every resume field
+        self.event_log = event_log or EventLog(LOG_FILE, enabled=SAVE_EVENT_LOG)
+        self.checkpoint = None  # RunCheckpoint set by run() when SAVE_CHECKPOINTS is on
+        self.governor = governor or (RateGovernor() if USE_RATE_GOVERNOR else None)
+        self.resume_index = None  # Keyword index the resumed checkpoint stopped at
+        self.prefetcher = JobPrefetcher(self) if PREFETCH_JOBS > 0 else None
         
-    def setup_driver(self):
-        """Setup Chrome driver with ChromeDriverManager for automatic driver management"""
+    def setup_driver(self, headless=False, lean=False):
+        """Setup Chrome driver with ChromeDriverManager for automatic driver management.
+        The lean profile runs headless in a small window and never downloads images, fonts or media."""
         options = Options()
-        options.add_argument("--start-maximized")
+        if lean:
+            options.add_argument(f"--window-size={LEAN_WINDOW_SIZE}")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+            if EAGER_PAGE_LOAD:
+                # driver.get returns at DOMContentLoaded; the readiness waits cover the rest
+                options.page_load_strategy = "eager"
+        else:
+            options.add_argument("--start-maximized")
+        if headless or lean:
+            options.add_argument("--headless=new")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
@@ -77,35 +1881,216 @@ class LinkedInJobBot:
         # Add user agent to avoid detection
         options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
         
+        def start_chrome(driver_path):
+            return webdriver.Chrome(service=Service(driver_path) if driver_path else Service(), options=options)
+        
         try:
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+            driver_path, cached = self.resolve_driver_path()
+            try:
+                self.driver = start_chrome(driver_path)
+            except WebDriverException as e:
+                if not cached:
+                    raise
+                # After a Chrome update the cached driver no longer matches: forget it and resolve once more
+                self.log(f"Cached chromedriver {driver_path} failed to start ({e.msg}), resolving it again", "WARNING")
+                os.remove(DRIVER_CACHE_FILE)
+                driver_path, _ = self.resolve_driver_path()
+                self.driver = start_chrome(driver_path)
             self.log("Chrome driver initialized successfully")
         except Exception as e:
             self.log(f"Chrome driver setup failed: {e}", "ERROR")
             raise
             
+        # Count every command (WebElement calls route through the driver too) for span accounting,
+        # and time it per calling method when profiling is on
+        send_command = self.driver.execute
+        
+        def counted_execute(driver_command, params=None):
+            self.webdriver_calls += 1
+            if not self.profiler:
+                return send_command(driver_command, params)
+            start = time.perf_counter()
+            try:
+                return send_command(driver_command, params)
+            finally:
+                self.profiler.record(sys._getframe(1), driver_command, time.perf_counter() - start)
+        self.driver.execute = counted_execute
+        
         # Remove webdriver property to avoid detection
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.driver.implicitly_wait(10)
+        self.driver.implicitly_wait(IMPLICIT_WAIT)
+        
+        if lean:
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+                self.log(f"Lean profile: blocking {len(LEAN_BLOCKED_URLS)} image/font/media URL patterns")
+            except Exception as e:
+                self.log(f"Could not block resource URLs: {e}", "WARNING")
+    
+    @contextmanager
+    def span(self, phase, **fields):
+        """Time a phase of the current job and emit it with its WebDriver call count.
+        The yielded dict can be updated with extra fields; ok is False if the block raised."""
+        details = dict(fields)
+        start = time.perf_counter()
+        calls_before = self.webdriver_calls
+        ok = True
+        try:
+            yield details
+        except Exception:
+            ok = False
+            raise
+        finally:
+            self.event_log.emit(
+                'span', phase=phase, job_id=parse_job_id(self.current_job_url), worker=self.log_prefix.strip() or None,
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+                webdriver_calls=self.webdriver_calls - calls_before, ok=details.pop('ok', ok), **details)
+    
+    def resolve_driver_path(self):
+        """Pinned CHROMEDRIVER_PATH, then the path cached by an earlier run, then ChromeDriverManager.
+        Returns (path, whether it came from the cache); the path is None when nothing resolves, which
+        leaves it to Selenium Manager."""
+        if CHROMEDRIVER_PATH and os.path.exists(CHROMEDRIVER_PATH):
+            return CHROMEDRIVER_PATH, False
+        if WARM_START and os.path.exists(DRIVER_CACHE_FILE):
+            with open(DRIVER_CACHE_FILE) as cache:
+                cached_path = cache.read().strip()
+            if cached_path and os.path.exists(cached_path):
+                return cached_path, True
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            self.log(f"ChromeDriverManager unavailable ({e}), falling back to Selenium Manager", "WARNING")
+            return None, False
+        with open(DRIVER_CACHE_FILE, "w") as cache:
+            cache.write(driver_path)
+        return driver_path, False
+    
+    def session_cipher(self):
+        """Fernet cipher keyed from the LinkedIn password, or None if encryption is unavailable"""
+        if Fernet is None or not PASSWORD:
+            return None
+        key = hashlib.pbkdf2_hmac("sha256", PASSWORD.encode("utf-8"), USERNAME.encode("utf-8"), 200000)
+        return Fernet(base64.urlsafe_b64encode(key))
+    
+    def save_session(self):
+        """Encrypt the current LinkedIn cookies to SESSION_FILE for the next warm start"""
+        cipher = self.session_cipher()
+        if cipher is None:
+            self.log("Install 'cryptography' to keep the LinkedIn session between runs", "DEBUG")
+            return False
+        try:
+            token = cipher.encrypt(json.dumps(self.driver.get_cookies()).encode("utf-8"))
+            with open(os.open(SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as session_file:
+                session_file.write(token)
+            return True
+        except Exception as e:
+            self.log(f"Could not save session: {str(e)}", "WARNING")
+            return False
+    
+    def restore_session(self):
+        """Load saved cookies and check them with one lightweight request; True if still logged in"""
+        cipher = self.session_cipher()
+        if cipher is None or not os.path.exists(SESSION_FILE):
+            return False
+        try:
+            with open(SESSION_FILE, "rb") as session_file:
+                cookies = json.loads(cipher.decrypt(session_file.read()))
+        except (InvalidToken, ValueError, OSError) as e:
+            self.log(f"Saved session unreadable, logging in again: {str(e)}", "WARNING")
+            return False
+        
+        # Cookies can only be set for the loaded domain; robots.txt is the cheapest page on it
+        self.load_page(f"{self.base_url}/robots.txt")
+        for cookie in cookies:
+            try:
+                self.driver.add_cookie(cookie)
+            except Exception:
+                continue
+        
+        # A logged-out /feed/ request redirects to the login wall; a valid session answers 200
+        status = self.driver.execute_script(
+            "return fetch('/feed/', {credentials: 'include', redirect: 'manual'})"
+            ".then(response => response.type === 'opaqueredirect' ? 0 : response.status)"
+            ".catch(() => 0);")
+        return status == 200
+    
+    def warm_start_login(self):
+        """Reuse the saved session when it is still valid, otherwise run the full login"""
+        if WARM_START and self.restore_session():
+            self.start_mode = "warm"
+            self.log("Restored saved LinkedIn session, skipping login", "SUCCESS")
+            return
+        self.start_mode = "cold"
+        self.login()
+        if WARM_START:
+            self.save_session()
+    
+    def record_page_stats(self, label=""):
+        """Record bytes transferred and load time of the current page from the Performance API"""
+        if not REPORT_PAGE_STATS:
+            return None
+        try:
+            stats = self.driver.execute_script(PAGE_STATS_JS)
+        except Exception as e:
+            self.log(f"Page stats unavailable: {str(e)}", "DEBUG")
+            return None
+        stats['label'] = label
+        self.page_stats.append(stats)
+        self.log(f"Page {label or stats['url']}: {stats['transfer_bytes'] / 1024:.0f} KB transferred ("
+                 f"{stats['resources']} resources: {stats['cache_hits']} from cache, {stats['opaque']} cross-origin "
+                 f"and not measured), loaded in {stats['load_ms']:.0f} ms", "DEBUG")
+        return stats
         
     def log(self, msg, level="INFO"):
         """Enhanced logging with timestamps"""
         timestamp = datetime.now().strftime("%H:%M")
         icons = {"INFO": "🔹", "SUCCESS": "✅", "ERROR": "❌", "WARNING": "⚠️", "DEBUG": "🔍", "COMPANY": "🏢", "EASY": "⚡"}
-        print(f"[{timestamp}] {icons.get(level, '🔹')} {msg}")
+        print(f"[{timestamp}] {icons.get(level, '🔹')} {self.log_prefix}{msg}")
         
     def random_delay(self, min_delay=None, max_delay=None):
-        """Add random delay to avoid detection"""
+        """Add random delay to avoid detection. With the rate governor the following action is paced by
+        its bucket instead, so these fixed pauses are skipped rather than stacked on top."""
+        if self.governor:
+            return
         min_d = min_delay or MIN_DELAY
         max_d = max_delay or MAX_DELAY
         delay = random.uniform(min_d, max_d)
         time.sleep(delay)
+    
+    def pace(self, action):
+        """Ask the rate governor for permission to perform an action of this class"""
+        if self.governor:
+            self.governor.acquire(action)
+    
+    def load_page(self, url, action='page_load'):
+        """driver.get paced by the rate governor. The response time and error pages are reported back,
+        so a slow or throttling site lowers the rate of that action class."""
+        if not self.governor:
+            self.driver.get(url)
+            return
+        self.governor.acquire(action)
+        start = time.perf_counter()
+        try:
+            self.driver.get(url)
+            problem = self.driver.execute_script(ERROR_PAGE_JS)
+        except TimeoutException:
+            self.governor.report(action, time.perf_counter() - start, error=True)
+            raise
+        self.report_page_load(action, time.perf_counter() - start, problem)
+    
+    def report_page_load(self, action, seconds, problem=None):
+        """Report a page's response time and error page (if any) to the rate governor"""
+        if self.governor.report(action, seconds, error=bool(problem)):
+            self.log(f"{problem or f'Slow response ({seconds:.1f}s)'} on {action}, slowing down to "
+                     f"{self.governor.rate(action) * 60:.1f}/min", "WARNING")
         
     def login(self):
         """Login to LinkedIn"""
         try:
             self.log("Navigating to LinkedIn login page...")
-            self.driver.get("https://www.linkedin.com/login")
+            self.load_page(f"{self.base_url}/login")
             
             self.log("Entering username...")
             username_field = WebDriverWait(self.driver, 15).until(
@@ -127,10 +2112,11 @@ class LinkedInJobBot:
             login_button = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']"))
             )
+            self.pace('submit')
             login_button.click()
             
             self.log("Waiting for login to complete...")
-            time.sleep(5)
+            self.waits.until('login_complete')
             
             current_url = self.driver.current_url
             if "login" not in current_url.lower():
@@ -155,26 +2141,37 @@ class LinkedInJobBot:
         except Exception as e:
             raise Exception(f"Login failed: {str(e)}")
     
+    def build_search_url(self, keyword, location=None, start=0):
+        """LinkedIn search URL with Easy Apply filter; start selects the result page offset"""
+        search_url = f"{self.base_url}/jobs/search/?keywords={keyword.replace(' ', '%20')}"
+        
+        # Add location if specified
+        if location:
+            search_url += f"&location={location.replace(' ', '%20')}"
+            
+        # Add Easy Apply filter and other filters
+        search_url += "&f_AL=true"  
+        search_url += "&f_E=2,3"    
+        search_url += "&f_TPR=r86400"  
+        
+        if start:
+            search_url += f"&start={start}"
+        return search_url
+    
     def search_jobs(self, keyword, location=None):
         """Navigate to jobs page for the given keyword"""
         try:
             self.log(f"Searching for jobs with keyword: '{keyword}'...")
             
-            # Create LinkedIn search URL with Easy Apply filter
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword.replace(' ', '%20')}"
-            
-            # Add location if specified
-            if location:
-                search_url += f"&location={location.replace(' ', '%20')}"
-                
-            # Add Easy Apply filter and other filters
-            search_url += "&f_AL=true"  
-            search_url += "&f_E=2,3"    
-            search_url += "&f_TPR=r86400"  
+            search_url = self.build_search_url(keyword, location)
             
             self.log(f"Navigating to: {search_url}")
-            self.driver.get(search_url)
-            time.sleep(5)
+            self.load_page(search_url, 'search')
+            self.waits.until('listing_loaded')
+            self.record_page_stats("search")
+            if not self.first_search_logged:
+                self.first_search_logged = True
+                self.log(f"Startup to first search: {time.perf_counter() - self.started_at:.1f}s ({self.start_mode} start)", "INFO")
             
             # Verify page loaded successfully
             page_title = self.driver.title.lower()
@@ -188,16 +2185,39 @@ class LinkedInJobBot:
             # Fallback: try basic search
             try:
                 self.log("Trying fallback search method...", "WARNING")
-                fallback_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword}&f_AL=true"
-                self.driver.get(fallback_url)
-                time.sleep(3)
+                fallback_url = f"{self.base_url}/jobs/search/?keywords={keyword}&f_AL=true"
+                self.load_page(fallback_url, 'search')
+                self.waits.until('listing_loaded')
                 self.log("Used fallback search method", "SUCCESS")
             except Exception as fallback_error:
                 raise Exception(f"All search methods failed for '{keyword}': {str(fallback_error)}")
     
-    def get_job_links_from_listing_page(self):
+    def get_job_links_from_snapshot(self, target_only=True):
+        """Extract all job cards with one execute_script call and filter them in Python.
+        Returns None when the snapshot script itself fails."""
+        try:
+            cards = self.driver.execute_script(JOB_CARD_SNAPSHOT_JS) or []
+        except Exception as e:
+            self.log(f"Job card snapshot failed: {str(e)}", "DEBUG")
+            return None
+        
+        job_links = []
+        for card in cards:
+            title = card.get('title') or ""
+            if len(title) > 3 and (self.is_target_role(title) or not target_only):
+                card['job_id'] = card.get('job_id') or parse_job_id(card['url'])
+                job_links.append(card)
+        
+        self.log(f"Snapshot read {len(cards)} job cards, {len(job_links)} match target roles", "DEBUG")
+        return job_links
+    
+    def get_job_links_from_listing_page(self, use_snapshot=None):
         """Extract job links from the job listing page"""
         job_links = []
+        if use_snapshot is None:
+            use_snapshot = USE_DOM_SNAPSHOT
+        
+        snapshot_links = self.get_job_links_from_snapshot() if use_snapshot else None
         
         # LinkedIn-specific selectors for job cards
         link_selectors = [
@@ -218,6 +2238,11 @@ class LinkedInJobBot:
             ".job-card-container__primary-description"
         ]
         
+        # A successful snapshot already holds every card, so the per-element walk is skipped
+        if snapshot_links is not None:
+            job_links = snapshot_links
+            link_selectors = []
+        
         for selector in link_selectors:
             try:
                 elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
@@ -231,9 +2256,9 @@ class LinkedInJobBot:
                         try:
                             title = element.text.strip()
                             if not title:
-                                # Try to find title in child elements
-                                title_child = element.find_element(By.CSS_SELECTOR, ".job-card-list__title, h3, span")
-                                title = title_child.text.strip() if title_child else ""
+                                # Try to find title in child elements (find_elements returns at once on a miss)
+                                title_children = element.find_elements(By.CSS_SELECTOR, ".job-card-list__title, h3, span")
+                                title = title_children[0].text.strip() if title_children else ""
                         except:
                             title = "Unknown Title"
                         
@@ -273,10 +2298,14 @@ class LinkedInJobBot:
             try:
                 self.log("No jobs found, trying to scroll and reload...", "WARNING")
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
+                self.waits.until('listing_loaded')
                 
-                # Try again with basic selector
-                elements = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/jobs/view/']")
+                if snapshot_links is not None:
+                    job_links = self.get_job_links_from_snapshot() or []
+                    elements = []
+                else:
+                    # Try again with basic selector
+                    elements = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/jobs/view/']")
                 for element in elements[:MAX_JOBS_PER_KEYWORD]:
                     try:
                         href = element.get_attribute("href")
@@ -306,40 +2335,130 @@ class LinkedInJobBot:
             
         return job_links
     
-    def is_target_role(self, job_title):
-        """Check if job title matches target roles"""
-        title_lower = job_title.lower()
-        target_keywords = [
-            "data analyst", "data analysis", "data science", "data scientist", 
-            "python developer", "python", "data engineer", "machine learning",
-            "business analyst", "analytics", "bi analyst", "sql"
-        ]
+    def crawl_job_listings(self, keyword, location=None, max_jobs=None, incremental=True, start_page=0, seen_jobs=None):
+        """Yield eligible jobs for a keyword while scrolling the result list and following &start= pages.
+        Stops as soon as max_jobs eligible jobs have been yielded.
         
-        return any(keyword in title_lower for keyword in target_keywords)
-    
-    def handle_cookies_popup(self):
+        With incremental=True jobs are yielded after every scroll batch, so the caller must not navigate
+        this browser between yields (the pool collector). With incremental=False each page is read to the
+        end first, so the caller may open jobs in the same browser between yields.
+        A resumed crawl passes the first unread page and the job IDs its checkpoint already holds."""
+        max_jobs = max_jobs or MAX_JOBS_PER_KEYWORD
+        seen_jobs = set(seen_jobs or ())
+        found = 0
+        
+        # Skip counts add up over every scroll batch and page and are reported once for the keyword,
+        # also when the caller stops early
+        triaged = {}
         try:
-            cookie_selectors = [
-            # Common XPath selectors
-            "//button[contains(translate(text(),'ACCEPT','accept'),'accept')]",
-            "//button[contains(translate(text(),'ALLOW','allow'),'allow')]",
-            "//button[contains(translate(text(),'OK','ok'),'ok')]",
-            "//button[contains(translate(text(),'AGREE','agree'),'agree')]",
-            "//button[contains(translate(text(),'CONTINUE','continue'),'continue')]",
-            "//a[contains(translate(text(),'ACCEPT','accept'),'accept')]",
-
-            # Common CSS selectors
-            "button[id*='accept']",
-            "button[class*='accept']",
-            "button[id*='cookie']",
-            "button[class*='cookie']",
-            ".cookie-accept",
-            ".accept-cookies",
-            "#cookie-accept",
-            "#accept-cookies"
-        ]
-
-            for selector in cookie_selectors:
+            for page in range(start_page, MAX_LISTING_PAGES):
+                page_url = self.build_search_url(keyword, location, start=page * LISTING_PAGE_SIZE)
+                if page > 0 or "/jobs/search" not in self.driver.current_url:
+                    self.load_page(page_url, 'search')
+                    if self.waits.until('listing_loaded') in (False, 'empty'):
+                        self.log(f"Result page {page + 1} has no job cards, crawl finished", "DEBUG")
+                        return
+                
+                page_jobs = []
+                new_on_page = 0
+                while found < max_jobs:
+                    cards = self.get_job_links_from_snapshot(target_only=False) or []
+                    # Tracking parameters differ between pages, so dedupe on the job ID
+                    new_cards = [card for card in cards if (card['job_id'] or card['url']) not in seen_jobs]
+                    seen_jobs.update(card['job_id'] or card['url'] for card in new_cards)
+                    new_on_page += len(new_cards)
+                    
+                    batch = [card for card in new_cards if self.is_target_role(card['title'])]
+                    if TRIAGE_JOB_CARDS:
+                        batch, skipped = self.triage_job_cards(batch, report=False)
+                        for reason, count in skipped.items():
+                            triaged[reason] = triaged.get(reason, 0) + count
+                    batch = batch[:max_jobs - found]
+                    found += len(batch)
+                    if self.checkpoint:
+                        self.checkpoint.jobs_found(batch)
+                    
+                    if incremental:
+                        yield from batch
+                    else:
+                        page_jobs.extend(batch)
+                    
+                    # Scroll the inner list; stop when it no longer grows
+                    link_count = self.driver.execute_script(SCROLL_JOB_LIST_JS)
+                    if not self.waits.until('more_cards_loaded', link_count, timeout=3):
+                        break
+                
+                self.log(f"Crawled result page {page + 1}: {new_on_page} new cards, {found} eligible so far", "DEBUG")
+                # An exhausted search repeats or empties its last page
+                crawl_done = found >= max_jobs or new_on_page == 0
+                if self.checkpoint:
+                    self.checkpoint.page_read(page, crawl_done)
+                yield from page_jobs
+                
+                if crawl_done:
+                    return
+        finally:
+            self.report_triage(triaged, keyword)
+    
+    def is_target_role(self, job_title):
+        """Check if job title matches target roles"""
+        title_lower = job_title.lower()
+        target_keywords = [
+            "data analyst", "data analysis", "data science", "data scientist", 
+            "python developer", "python", "data engineer", "machine learning",
+            "business analyst", "analytics", "bi analyst", "sql"
+        ]
+        
+        return any(keyword in title_lower for keyword in target_keywords)
+    
+    def find_present(self, selectors, state="visible"):
+        """One hit dict (selector, element, text) or None per selector, from a single script"""
+        return self.driver.execute_script(FIND_PRESENT_JS, list(selectors), state)
+    
+    def extract_company_name(self, batched=None):
+        """Company name from the job page's top card, or "Unknown Company" """
+        if BATCHED_LOOKUPS if batched is None else batched:
+            hits = self.find_present(COMPANY_NAME_SELECTORS, "present")
+            return next((hit['text'] for hit in hits if hit and hit['text']), "Unknown Company")
+        for selector in COMPANY_NAME_SELECTORS:
+            try:
+                elem = self.driver.find_element(By.CSS_SELECTOR, selector)
+                if elem.text.strip():
+                    return elem.text.strip()
+            except:
+                continue
+        return "Unknown Company"
+    
+    def handle_cookies_popup(self, batched=None):
+        """Dismiss a cookie-consent banner, if the page shows one, with the single CONSENT_JS script.
+        The handler that worked is remembered per domain and tried first on the next visit."""
+        if BATCHED_LOOKUPS if batched is None else batched:
+            try:
+                domain = urlsplit(self.driver.current_url).netloc
+                site = site_key(self.driver.current_url)
+                # The document-wide text XPaths also match form buttons such as "Continue"
+                fallback = [selector for selector in COOKIE_BUTTON_SELECTORS if not selector.startswith("//")]
+                preferred = self.site_profiles.consent_handler(domain)
+                profile = self.site_profiles.profile(site)
+                if profile and profile['cookie_banner'] == 0:
+                    # No banner on the last visit: one check instead of polling for a late one
+                    result = self.driver.execute_script(CONSENT_JS, preferred, fallback)
+                else:
+                    result = self.waits.until('consent_dismissed', preferred, fallback,
+                                              condition=CONSENT_JS, timeout=COOKIE_BANNER_WAIT)
+                self.site_profiles.update_profile(site, cookie_banner=int(bool(result)))
+                if not result:
+                    self.log(" No cookie popup detected or clickable.")
+                    return False
+                self.site_profiles.learn_consent(domain, result['handler'])
+                self.log(f"Dismissed cookie banner on {domain} with the {result['handler']} handler ({result['text']})")
+                return True
+            except Exception as e:
+                self.log(f"Error handling cookies: {str(e)}", "ERROR")
+                return False
+        
+        try:
+            for selector in COOKIE_BUTTON_SELECTORS:
                 try:
                     if selector.startswith("//"):
                         # XPath selector
@@ -400,7 +2519,7 @@ class LinkedInJobBot:
                 # For input fields, try typing "India"
                 field_element.clear()
                 field_element.send_keys("India")
-                time.sleep(1)
+                self.waits.until('dropdown_open', timeout=2)
                 
                 # Check if dropdown appeared
                 try:
@@ -468,46 +2587,73 @@ class LinkedInJobBot:
             self.log(f" Failed to handle phone country code: {str(e)}", "ERROR")
             return False
     
+    def complete_company_site_application(self, job_title, company, job_url):
+        """Fill and submit the company-site form open in this browser and record the outcome.
+        Returns (success, reason) like apply_to_single_job."""
+        self.current_job_url = job_url
+        self.unfilled_fields = []
+        self.site_apply_selector = None
+        domain = site_key(self.driver.current_url)
+        try:
+            site = self.driver.execute_script(SITE_CHECK_JS)
+        except Exception:
+            site = {'login_wall': False, 'load_ms': None}
+        if site['login_wall']:
+            self.site_profiles.record_visit(domain, success=False, login_wall=True, load_ms=site['load_ms'])
+            return False, f"{domain} requires signing in"
+        
+        with self.span('company_site') as site_span:
+            success = self.handle_company_site_application(job_title, company)
+            site_span['ok'] = bool(success)
+        self.site_profiles.record_visit(domain, success=None if self.unfilled_fields else bool(success),
+                                        apply_selector=self.site_apply_selector, load_ms=site['load_ms'])
+        
+        if self.unfilled_fields:
+            job = {'title': job_title, 'company': company, 'url': job_url, 'site_url': self.driver.current_url,
+                   'fingerprint': form_fingerprint(self.driver.execute_script(FORM_INVENTORY_JS, None)),
+                   'fields': self.unfilled_fields}
+            with self.results_lock:
+                self.needs_input_jobs.append(job)
+            self.manual_inputs.add(job)
+            return False, f"Needs manual input: {', '.join(field_question(field) for field in self.unfilled_fields)}"
+        if not success:
+            return False, "Company site application failed"
+        
+        job_data = {
+        'title': job_title,
+        'company': company,
+        'url': job_url,
+        'job_id': parse_job_id(job_url),
+        'applied_at': datetime.now().isoformat(),
+        'signature': f"{job_title.lower()}_{company.lower()}",
+        'application_type': 'company_site'
+        }
+        self.record_applied(job_data)
+        return True, "Applied successfully on company site"
+    
     def handle_company_site_application(self, job_title, company):
         """Handle application process on company website"""
         try:
             self.log(f" Processing company site application for: {job_title}", "COMPANY")
             
             # Wait for page to load
-            time.sleep(5)
-            
-            # Look for application form or apply buttons on company site
-            company_apply_selectors = [
-                "//button[contains(translate(text(),'APPLY','apply'),'apply')]",
-                "//a[contains(translate(text(),'APPLY','apply'),'apply')]",
-                "//input[contains(translate(@value,'APPLY','apply'),'apply')]",
-                "//button[contains(translate(text(),'Easy Apply','Easy Apply'),'Easy Apply')]",
-                "//a[contains(translate(text(),'Easy Apply','Easy Apply'),'Easy Apply')]",
-                "//input[contains(translate(@value,'Easy Apply','Easy Apply'),'Easy Apply')]",
-                "//button[contains(text(),'Submit Application')]",
-                "//button[contains(text(),'Join Us')]",
-                "//a[contains(text(),'Career')]",
-                "//a[contains(text(),'Jobs')]",
-                "//button[contains(text(),'Get Started')]",
-                
-                # Generic form submissions
-                "//button[@type='submit']",
-                "//input[@type='submit']"
-            ]
+            self.waits.until('page_ready')
+            
+            if BATCHED_LOOKUPS:
+                return self.apply_on_company_site()
             
             # Try to find and click apply button on company site
-            for selector in company_apply_selectors:
+            for selector in COMPANY_APPLY_SELECTORS:
                 try:
                     elements = self.driver.find_elements(By.XPATH, selector)
                     for element in elements:
                         if element.is_displayed() and element.is_enabled():
                             # Scroll to element
                             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                            time.sleep(1)
                             
                             element.click()
                             self.log(f"Clicked company site button: {element.text}", "COMPANY")
-                            time.sleep(3)
+                            self.waits.until('page_ready')
                             
                             # Handle any forms that appear
                             form_handled = self.handle_company_site_form()
@@ -526,58 +2672,227 @@ class LinkedInJobBot:
             self.log(f"Company site application error: {str(e)}", "ERROR")
             return False
     
+    def apply_on_company_site(self):
+        """Click through the company site's apply controls and fill the form. The selector that worked on
+        this domain before goes first, and all of them are checked in one script; a domain whose form is
+        on the landing page skips the sweep. Sets site_apply_selector for the domain profile."""
+        learned = (self.site_profiles.profile(site_key(self.driver.current_url)) or {}).get('apply_selector')
+        if learned == '':
+            self.site_apply_selector = ''
+            return self.handle_company_site_form()
+        
+        selectors = [learned] + [selector for selector in COMPANY_APPLY_SELECTORS if selector != learned] \
+            if learned else COMPANY_APPLY_SELECTORS
+        for hit in filter(None, self.find_present(selectors, "clickable")):
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView(true);", hit['element'])
+                hit['element'].click()
+                self.log(f"Clicked company site button: {hit['text']}", "COMPANY")
+                self.waits.until('page_ready')
+                if self.handle_company_site_form():
+                    self.site_apply_selector = hit['selector']
+                    return True
+            except Exception:
+                # The click navigated away and left the other hits stale
+                continue
+        
+        # No apply control led to a form: fill whatever form is on the page
+        self.site_apply_selector = ''
+        return self.handle_company_site_form()
+    
+    def discover_company_site_form(self):
+        """Fill a company-site form without a plan: resume upload, FIELD_RULES autofill, then the
+        required text fields from the answer bank (or deferred / prompted). Returns (file inputs, required inputs)."""
+        # Look for file upload inputs for resume
+        file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file']")
+        
+        if file_inputs and self.resume_path and os.path.exists(self.resume_path):
+            for file_input in file_inputs:
+                try:
+                    if file_input.is_displayed():
+                        file_input.send_keys(self.resume_path)
+                        self.log("Resume uploaded to company site", "COMPANY")
+                        self.waits.until('upload_finished')
+                        break
+                except:
+                    continue
+        
+        # Fill common form fields automatically
+        self.fill_external_form_fields()
+        
+        # Look for required text fields that need manual input
+        text_inputs = self.driver.find_elements(By.XPATH, 
+            "//input[@type='text' and @required] | //input[@required and not(@type)] | //textarea[@required]")
+        
+        if text_inputs:
+            self.log(f"Found {len(text_inputs)} required fields on company site", "COMPANY")
+            self.log(" Manual input may be required for company site application", "WARNING")
+            # Labels for answer-bank lookups and the metadata saved with deferred fields
+            inventory = self.driver.execute_script(FORM_INVENTORY_JS, None)
+            
+            for i, input_field in enumerate(text_inputs[:5]):  # Limit to first 5 fields
+                try:
+                    field_name = (input_field.get_attribute("name") or 
+                                input_field.get_attribute("placeholder") or 
+                                input_field.get_attribute("id") or 
+                                f"Field {i+1}")
+                    
+                    if input_field.is_displayed() and not input_field.get_attribute("value"):
+                        # Try to auto-fill based on field name
+                        filled = self.auto_fill_field(input_field, field_name.lower())
+                        field = next((field for field in inventory if field['element'] == input_field), None)
+                        question = field_question(field) if field else field_name
+                        
+                        if not filled:
+                            # Answered earlier for this or an identical field, e.g. by --answer-manual-inputs
+                            answer = self.answer_bank.lookup(question)
+                            filled = self.fill_form_field(input_field, answer, question[:40]) if answer else False
+                        
+                        if not filled and (DEFER_MANUAL_INPUT or not self.interactive):
+                            # Never stop the run: the job is saved as a manual-input task
+                            if field and field not in self.unfilled_fields:
+                                self.unfilled_fields.append(field)
+                        elif not filled:
+                            print(f"\n COMPANY SITE INPUT REQUIRED:")
+                            print(f"Field: {field_name}")
+                            print(f"Current URL: {self.driver.current_url}")
+                            user_input = input(f"Enter value for '{field_name}' (or press Enter to skip): ")
+                            
+                            if user_input.strip():
+                                input_field.clear()
+                                input_field.send_keys(user_input)
+                                self.log(f"Filled field: {field_name}", "COMPANY")
+                
+                except Exception as e:
+                    continue
+        
+        return file_inputs, text_inputs
+    
+    def plan_value(self, source):
+        """Value of a plan step source: info:<PERSONAL_INFO key>, answer:<question>, option:<text> or text:<literal>"""
+        kind, _, detail = source.partition(":")
+        if kind == 'info':
+            return PERSONAL_INFO.get(detail) or None
+        if kind == 'answer':
+            return self.answer_bank.lookup(detail)
+        return detail
+    
+    def replay_form_plan(self):
+        """Fill the current form from the plan learned for its fingerprint: one fill script plus any uploads.
+        Returns (fingerprint, inventory before filling, replayed steps); steps is None when there is no
+        usable plan, and the caller should discover the form instead."""
+        try:
+            inventory = self.driver.execute_script(FORM_INVENTORY_JS, None) or []
+        except Exception as e:
+            self.log(f"Form inventory failed: {str(e)}", "WARNING")
+            return None, None, None
+        fingerprint = form_fingerprint(inventory)
+        form_key = form_url_key(self.driver.current_url)
+        plan = self.form_plans.get(fingerprint, form_key) if inventory else None
+        if not plan:
+            return fingerprint, inventory, None
+        
+        fills = []
+        for step in plan['steps']:
+            if step['action'] == 'upload':
+                continue
+            value = self.plan_value(step['source']) if step['source'] else None
+            if step['action'] != 'check' and not value:
+                # e.g. an answer no longer in the bank: rediscover rather than submit half a form
+                self.log(f"Form plan r{plan['revision']} has no value for {step['source']}, rediscovering", "COMPANY")
+                return fingerprint, inventory, None
+            fills.append({'selector': step['selector'], 'action': step['action'], 'value': value})
+        
+        try:
+            missing = self.driver.execute_script(FILL_PLAN_JS, fills)
+            uploads = [step for step in plan['steps'] if step['action'] == 'upload']
+            if not missing and uploads and self.resume_path and os.path.exists(self.resume_path):
+                for step in uploads:
+                    self.driver.find_element(By.CSS_SELECTOR, step['selector']).send_keys(self.resume_path)
+                self.waits.until('upload_finished')
+        except NoSuchElementException:
+            missing = ['upload']
+        if missing:
+            if plan['form_key'] == form_key:
+                # A plan borrowed from another company's copy of the template stays valid there
+                self.form_plans.invalidate(fingerprint, form_key)
+            self.log(f"Form plan r{plan['revision']} no longer matches this form, relearning", "COMPANY")
+            return fingerprint, inventory, None
+        
+        self.form_plans.used(fingerprint, plan['form_key'])
+        self.log(f"Filled form from learned plan r{plan['revision']} ({len(plan['steps'])} steps)", "COMPANY")
+        return fingerprint, inventory, plan['steps']
+    
+    def value_source(self, field):
+        """Where a discovered text value came from, so a plan can look it up again instead of copying it"""
+        rule = FIELD_MATCHER.match_field(field)
+        if rule and not rule[1].startswith('handler:') and str(PERSONAL_INFO.get(rule[1], '')) == field['value']:
+            return f"info:{rule[1]}"
+        question = field_question(field)
+        if question and self.answer_bank.lookup(question) == field['value']:
+            return f"answer:{question}"
+        return f"text:{field['value']}"
+    
+    def plan_step(self, before, after):
+        """Plan step that reproduces how one field changed during discovery.
+        None if it did not change, False if it changed but has no direct selector."""
+        if after['type'] in ('checkbox', 'radio'):
+            if not after['checked'] or before['checked']:
+                return None
+            action, source = 'check', None
+        elif after['type'] == 'file':
+            if not after['value'] or after['value'] == before['value']:
+                return None
+            action, source = 'upload', 'resume'
+        elif after['tag'] == 'select':
+            if after['selected_index'] < 0 or after['selected_index'] == before['selected_index']:
+                return None
+            action, source = 'select', f"option:{after['options'][after['selected_index']]}"
+        else:
+            if not after['value'] or after['value'] == before['value']:
+                return None
+            action, source = 'fill', self.value_source(after)
+        selector = field_selector(after)
+        return {'selector': selector, 'action': action, 'source': source} if selector else False
+    
+    def learn_form_plan(self, fingerprint, before):
+        """Store what discovery filled on this form as the plan for the next visit"""
+        try:
+            after = self.driver.execute_script(FORM_INVENTORY_JS, None) or []
+            form_url = self.driver.current_url
+        except Exception as e:
+            self.log(f"Could not read the filled form: {str(e)}", "WARNING")
+            return None
+        if len(after) != len(before) or form_fingerprint(after) != fingerprint:
+            # Fields appeared or changed while filling; there is no stable shape to learn
+            return None
+        
+        steps = [self.plan_step(old, new) for old, new in zip(before, after)]
+        if False in steps:
+            self.log("Form has filled fields without id or name, not learning a plan", "DEBUG")
+            return None
+        steps = [step for step in steps if step]
+        if not steps:
+            return None
+        revision = self.form_plans.learn(fingerprint, form_url_key(form_url), steps)
+        self.log(f"Learned fill plan r{revision} for {urlsplit(form_url).netloc} ({len(steps)} steps)", "COMPANY")
+        return revision
+    
     def handle_company_site_form(self):
         """Handle forms on company websites"""
         try:
-            # Look for file upload inputs for resume
-            file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file']")
-            
-            if file_inputs and RESUME_PATH and os.path.exists(RESUME_PATH):
-                for file_input in file_inputs:
-                    try:
-                        if file_input.is_displayed():
-                            file_input.send_keys(RESUME_PATH)
-                            self.log("Resume uploaded to company site", "COMPANY")
-                            time.sleep(2)
-                            break
-                    except:
-                        continue
-            
-            # Fill common form fields automatically
-            self.fill_external_form_fields()
-            
-            # Look for required text fields that need manual input
-            text_inputs = self.driver.find_elements(By.XPATH, 
-                "//input[@type='text' and @required] | //input[@required and not(@type)] | //textarea[@required]")
+            # A form seen before is filled from its learned plan with direct selectors
+            fingerprint, before, plan_steps = self.replay_form_plan() if USE_FORM_PLANS else (None, None, None)
+            if plan_steps:
+                file_inputs, text_inputs = [], plan_steps
+            else:
+                file_inputs, text_inputs = self.discover_company_site_form()
             
-            if text_inputs:
-                self.log(f"Found {len(text_inputs)} required fields on company site", "COMPANY")
-                self.log(" Manual input may be required for company site application", "WARNING")
-                
-                for i, input_field in enumerate(text_inputs[:5]):  # Limit to first 5 fields
-                    try:
-                        field_name = (input_field.get_attribute("name") or 
-                                    input_field.get_attribute("placeholder") or 
-                                    input_field.get_attribute("id") or 
-                                    f"Field {i+1}")
-                        
-                        if input_field.is_displayed() and not input_field.get_attribute("value"):
-                            # Try to auto-fill based on field name
-                            filled = self.auto_fill_field(input_field, field_name.lower())
-                            
-                            if not filled:
-                                print(f"\n COMPANY SITE INPUT REQUIRED:")
-                                print(f"Field: {field_name}")
-                                print(f"Current URL: {self.driver.current_url}")
-                                user_input = input(f"Enter value for '{field_name}' (or press Enter to skip): ")
-                                
-                                if user_input.strip():
-                                    input_field.clear()
-                                    input_field.send_keys(user_input)
-                                    self.log(f"Filled field: {field_name}", "COMPANY")
-                            
-                    except Exception as e:
-                        continue
+            if self.unfilled_fields:
+                self.log(f"Not submitting: {len(self.unfilled_fields)} required fields need manual input", "COMPANY")
+                return False
+            if fingerprint and not plan_steps:
+                self.learn_form_plan(fingerprint, before)
             
             # Look for submit buttons
             submit_buttons = self.driver.find_elements(By.XPATH, 
@@ -591,9 +2906,10 @@ class LinkedInJobBot:
                 try:
                     if btn.is_displayed() and btn.is_enabled():
                         # Auto-submit if we have basic info filled
+                        self.pace('submit')
                         btn.click()
                         self.log(f"Submitted company site application", "COMPANY")
-                        time.sleep(3)
+                        self.waits.until('site_submit_confirmed')
                         return True
                 except:
                     continue
@@ -609,53 +2925,64 @@ class LinkedInJobBot:
             self.log(f"Company site form handling error: {str(e)}", "WARNING")
             return False
     
+    def apply_field_rule(self, field_element, rule, field_name):
+        """Fill one element according to a FIELD_RULES entry"""
+        rule_name, target, _ = rule
+        if target == 'handler:country':
+            return self.handle_country_field(field_element)
+        if target == 'handler:phone_country':
+            return self.handle_phone_country_code(field_element)
+        return self.fill_form_field(field_element, PERSONAL_INFO.get(target, ''), field_name or rule_name)
+    
     def auto_fill_field(self, field_element, field_name):
         """Auto-fill form fields based on field name with enhanced country support"""
         try:
-            # Map field names to personal info (Updated with country support)
-            field_mappings = {
-                'first': PERSONAL_INFO['first_name'],
-                'fname': PERSONAL_INFO['first_name'],
-                'firstname': PERSONAL_INFO['first_name'],
-                'last': PERSONAL_INFO['last_name'],
-                'lname': PERSONAL_INFO['last_name'],
-                'lastname': PERSONAL_INFO['last_name'],
-                'email': PERSONAL_INFO['email'],
-                'phone': PERSONAL_INFO['phone_number'],  # Use phone without country code
-                'mobile': PERSONAL_INFO['phone_number'],
-                'city': PERSONAL_INFO['city'],
-                'location': PERSONAL_INFO['city'],
-                'state': PERSONAL_INFO['state'],
-                'postal': PERSONAL_INFO['postal_code'],
-                'zip': PERSONAL_INFO['postal_code'],
-                'experience': PERSONAL_INFO['experience_years'],
-                'company': PERSONAL_INFO['current_company']
-            }
-            
-            # Special handling for country fields
-            if any(keyword in field_name for keyword in ['country', 'nation']):
-                return self.handle_country_field(field_element)
-            
-            # Special handling for phone country code fields
-            if any(keyword in field_name for keyword in ['country_code', 'phone_country', 'code']):
-                return self.handle_phone_country_code(field_element)
-            
-            # Handle full phone number with country code
-            if 'phone' in field_name and 'full' in field_name:
-                return self.fill_form_field(field_element, PERSONAL_INFO['phone'], field_name)
-            
-            # Regular field mapping
-            for key, value in field_mappings.items():
-                if key in field_name and value:
-                    return self.fill_form_field(field_element, value, field_name)
-            
-            return False
+            rule = FIELD_MATCHER.match(field_name)
+            if not rule:
+                return False
+            return self.apply_field_rule(field_element, rule, field_name)
             
         except Exception as e:
             return False
     
-    def fill_external_form_fields(self):
+    def fill_fields_from_inventory(self, root_selector=None):
+        """Fill every control under root_selector that matches FIELD_RULES, using one inventory round-trip.
+        Text fields that already hold a value are left alone. Returns the number of fields filled."""
+        try:
+            inventory = self.driver.execute_script(FORM_INVENTORY_JS, root_selector) or []
+        except Exception as e:
+            self.log(f"Form inventory failed: {str(e)}", "WARNING")
+            return 0
+        
+        filled = 0
+        handled_rules = set()
+        for field in inventory:
+            # Textareas hold free-text answers (cover letters, screening questions), never a PERSONAL_INFO value
+            if not field['visible'] or not field['enabled'] or field['type'] in ('file', 'checkbox', 'radio') \
+                    or field['tag'] == 'textarea':
+                continue
+            rule = FIELD_MATCHER.match_field(field)
+            if not rule:
+                continue
+            is_handler = rule[1].startswith('handler:')
+            if not is_handler and field['tag'] == 'select':
+                continue
+            # Country pickers are set once per form; text fields only when still empty
+            if (is_handler and rule[0] in handled_rules) or (not is_handler and field['value']):
+                continue
+            if self.apply_field_rule(field['element'], rule, field['name'] or field['id'] or rule[0]):
+                filled += 1
+                handled_rules.add(rule[0])
+        return filled
+    
+    def fill_external_form_fields(self, use_matcher=None):
         """Fill form fields on external company websites with enhanced country support"""
+        if use_matcher is None:
+            use_matcher = USE_FIELD_MATCHER
+        if use_matcher:
+            self.fill_fields_from_inventory()
+            return
+        
         try:
             # Enhanced field mappings for external sites (Updated with country info)
             field_mappings = {
@@ -688,7 +3015,6 @@ class LinkedInJobBot:
                             for element in elements:
                                 if element.is_displayed() and element.is_enabled() and not element.get_attribute("value"):
                                     self.fill_form_field(element, value, field_name)
-                                    time.sleep(0.5)
                                     break
                         except:
                             continue
@@ -709,7 +3035,6 @@ class LinkedInJobBot:
                     for element in elements:
                         if element.is_displayed() and element.is_enabled():
                             self.handle_country_field(element)
-                            time.sleep(0.5)
                             break
                 except:
                     continue
@@ -730,7 +3055,6 @@ class LinkedInJobBot:
                     for element in elements:
                         if element.is_displayed() and element.is_enabled():
                             self.handle_phone_country_code(element)
-                            time.sleep(0.5)
                             break
                 except:
                     continue
@@ -742,17 +3066,17 @@ class LinkedInJobBot:
         """Handle different types of application forms that might appear on LinkedIn"""
         try:
             # Wait for any forms to load
-            time.sleep(2)
+            self.waits.until('page_ready')
             
             # Check for resume upload
             file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file']")
-            if file_inputs and RESUME_PATH and os.path.exists(RESUME_PATH):
+            if file_inputs and self.resume_path and os.path.exists(self.resume_path):
                 for file_input in file_inputs:
                     try:
                         if file_input.is_displayed():
-                            file_input.send_keys(RESUME_PATH)
+                            file_input.send_keys(self.resume_path)
+                            self.waits.until('upload_finished')
                             self.log("Resume uploaded successfully", "SUCCESS")
-                            self.random_delay(2, 3)
                             break
                     except:
                         continue
@@ -767,9 +3091,10 @@ class LinkedInJobBot:
             for btn in form_buttons:
                 try:
                     if btn.is_displayed() and btn.is_enabled():
+                        self.pace('submit')
                         btn.click()
                         self.log(f"Clicked form button: {btn.text}", "SUCCESS")
-                        time.sleep(2)
+                        self.waits.until('page_ready')
                         break
                 except:
                     continue
@@ -789,48 +3114,111 @@ class LinkedInJobBot:
         except Exception as e:
             self.log(f"Form handling error: {str(e)}", "WARNING")
     
-    def apply_to_jobs(self):
-        """Main job application method - gets job links and applies to each"""
+    def triage_job_cards(self, job_links, report=True):
+        """Drop jobs that cannot or should not be applied to, using only listing card data
+        and the application history. Returns (eligible jobs, skip counts by reason).
+        With report=False the caller logs the counts itself (the crawler, once per keyword)."""
+        eligible = []
+        skipped = {}
+        for job_data in job_links:
+            reason = None
+            job_id = job_data.get('job_id') or parse_job_id(job_data['url'])
+            company = job_data.get('company') or ""
+            
+            if job_data.get('applied'):
+                reason = "applied badge"
+            elif self.is_job_id_already_applied(job_data['url']):
+                reason = "in history"
+            elif company and self.is_job_already_applied(job_data['title'], company, job_data['url']):
+                reason = "same title and company in history"
+            elif job_data.get('easy_apply') is False and not HANDLE_COMPANY_SITES:
+                reason = "not Easy Apply"
+            
+            if reason:
+                skipped[reason] = skipped.get(reason, 0) + 1
+            else:
+                job_data['job_id'] = job_id
+                eligible.append(job_data)
+        
+        saved = sum(skipped.values())
+        if saved:
+            with self.results_lock:
+                self.page_loads_saved += saved
+        if report:
+            self.report_triage(skipped)
+        return eligible, skipped
+    
+    def report_triage(self, skipped, keyword=None):
+        """Log the page loads triage saved, by skip reason"""
+        saved = sum(skipped.values())
+        if not saved:
+            return
+        details = ", ".join(f"{count} {reason}" for reason, count in skipped.items())
+        scope = f" for '{keyword}'" if keyword else ""
+        self.log(f"Triage{scope} skipped {saved} jobs before opening them ({details})", "INFO")
+    
+    def apply_to_jobs(self, keyword=None, location=None, resume=None):
+        """Main job application method - gets job links and applies to each.
+        With a keyword and USE_LISTING_CRAWLER, jobs are streamed from crawl_job_listings.
+        With a resume plan from the checkpoint, its unfinished jobs come first and the crawl continues
+        from the first unread result page, or is skipped if it had already finished."""
         jobs_attempted = 0
         jobs_applied = 0
         
         try:
-            # Get all job links from the listing page
-            job_links = self.get_job_links_from_listing_page()
+            if resume is not None:
+                job_links = resume['jobs']
+                if keyword and not resume['crawl_done'] and resume['remaining'] > 0:
+                    job_links = itertools.chain(job_links, self.crawl_job_listings(
+                        keyword, location, max_jobs=resume['remaining'], incremental=False,
+                        start_page=resume['start_page'], seen_jobs=resume['seen_jobs']))
+            elif keyword and USE_LISTING_CRAWLER and USE_DOM_SNAPSHOT:
+                job_links = self.crawl_job_listings(keyword, location, incremental=False)
+            else:
+                # Get all job links from the listing page
+                job_links = self.get_job_links_from_listing_page()
+                
+                if not job_links:
+                    self.log("No relevant job links found on the listing page", "ERROR")
+                    return 0, 0
+                
+                if TRIAGE_JOB_CARDS:
+                    job_links, _ = self.triage_job_cards(job_links)
             
-            if not job_links:
-                self.log("No relevant job links found on the listing page", "ERROR")
-                return 0, 0
+            if self.prefetcher:
+                job_links = self.prefetcher.iterate(job_links, limit=MAX_JOBS_PER_KEYWORD)
             
             # Process each job
             for i, job_data in enumerate(job_links):
                 if jobs_attempted >= MAX_JOBS_PER_KEYWORD:
                     break
                 
+                # Add delay between applications (none before the first job)
+                if i > 0:
+                    self.random_delay(5, 8)  # Longer delay between job applications
+                
                 try:
-                    self.log(f"\n--- Processing Job {i+1}/{len(job_links)} ---", "INFO")
+                    self.log(f"\n--- Processing Job {i+1} ---", "INFO")
                     
                     success, reason = self.apply_to_single_job(job_data['url'], job_data['title'])
                     
                     if success:
                         jobs_applied += 1
                         self.log(f"Successfully applied to: {job_data['title']}", "SUCCESS")
+                    elif success is None:
+                        self.log(f" {reason}: {job_data['title']}", "COMPANY")
+                        if self.checkpoint:
+                            self.checkpoint.job_status(job_data['url'], 'queued')
                     else:
                         self.log(f" Failed to apply to: {job_data['title']} - {reason}", "WARNING")
-                        self.failed_jobs.append({
-                            'title': job_data['title'],
-                            'url': job_data['url'],
-                            'reason': reason
-                        })
+                        self.record_failure(job_data, reason)
                     
                     jobs_attempted += 1
                     
-                    # Add delay between applications
-                    if i < len(job_links) - 1:  # Don't delay after the last job
-                        self.random_delay(5, 8)  # Longer delay between job applications
-                    
                 except Exception as e:
                     self.log(f"Error processing job {i+1}: {str(e)}", "ERROR")
+                    if self.checkpoint:
+                        self.checkpoint.job_status(job_data['url'], 'failed')
                     jobs_attempted += 1
                     continue
             
@@ -839,14 +3227,53 @@ class LinkedInJobBot:
         except Exception as e:
             self.log(f" Error in apply_to_jobs: {str(e)}", "ERROR")
             return jobs_attempted, jobs_applied
+        finally:
+            if self.prefetcher:
+                self.prefetcher.close()
+    
+    def record_applied(self, job_data):
+        """Append a successful application to the shared results"""
+        self.event_log.emit('job_result', job_id=job_data.get('job_id'), title=job_data['title'],
+                            company=job_data['company'], success=True, application_type=job_data.get('application_type'))
+        with self.results_lock:
+            self.applied_jobs.append(job_data)
+            self.applied_signatures.add(job_data['signature'])
+            if job_data.get('application_type') == 'company_site':
+                self.company_site_jobs.append(job_data)
+        if SAVE_APPLIED_JOBS:
+            self.applied_store.add(job_data)
+        if self.checkpoint:
+            self.checkpoint.job_status(job_data['url'], 'applied')
+    
+    def record_failure(self, job_data, reason):
+        """Append a failed application to the shared results"""
+        self.event_log.emit('job_result', job_id=parse_job_id(job_data['url']), title=job_data['title'],
+                            success=False, reason=reason)
+        with self.results_lock:
+            self.failed_jobs.append({
+                'title': job_data['title'],
+                'url': job_data['url'],
+                'reason': reason
+            })
+        if self.checkpoint:
+            self.checkpoint.job_status(job_data['url'], 'failed')
     
-    def is_job_already_applied(self, job_title, company):
-        """Check if job was already applied to"""
+    def is_job_already_applied(self, job_title, company, job_url=None):
+        """Check if job was already applied to in this run or any earlier one"""
         if not SKIP_APPLIED_JOBS:
             return False
             
-        job_signature = f"{job_title.lower()}_{company.lower()}"
-        return any(job_signature in applied['signature'] for applied in self.applied_jobs)
+        signature = f"{job_title.lower()}_{company.lower()}"
+        with self.results_lock:
+            if signature in self.applied_signatures:
+                return True
+        return self.applied_store.contains(job_id=parse_job_id(job_url), signature=job_signature(job_title, company))
+    
+    def is_job_id_already_applied(self, job_url):
+        """Check the persistent history by job ID alone, before the job page is opened"""
+        if not SKIP_APPLIED_JOBS:
+            return False
+        return self.applied_store.contains(job_id=parse_job_id(job_url))
     
     def fill_form_field(self, field_element, value, field_name="field"):
         """Helper method to fill form fields safely"""
@@ -856,20 +3283,192 @@ class LinkedInJobBot:
             
             # Clear existing content
             field_element.clear()
-            time.sleep(0.5)
             
             # Type the value
             field_element.send_keys(str(value))
             self.log(f" Filled {field_name}: {value}", "SUCCESS")
-            time.sleep(0.5)
             return True
             
         except Exception as e:
             self.log(f" Failed to fill {field_name}: {str(e)}", "ERROR")
             return False
     
+    def get_step_inventory(self):
+        """Every visible control of the current Easy Apply step in one call: fields (type, name, id,
+        label, required, value, options), buttons and the step text"""
+        try:
+            return self.driver.execute_script(STEP_INVENTORY_JS, EASY_APPLY_MODAL_SELECTOR)
+        except Exception as e:
+            self.log(f"Step inventory failed: {str(e)}", "WARNING")
+            return {'fields': [], 'buttons': [], 'step_text': ''}
+    
+    def pick_option(self, options, keywords):
+        """Index of the first option (after the placeholder) whose text contains one of the keywords"""
+        for index, text in enumerate(options):
+            if index > 0 and any(keyword in text.lower() for keyword in keywords):
+                return index
+        return None
+    
+    def choose_step_button(self, buttons):
+        """Pick the Next/Continue/Submit/Review button the same way the old XPath order did"""
+        for needle in ('Next', 'Continue', 'Submit', 'Review'):
+            for button in buttons:
+                if needle in button['text']:
+                    return button
+        for needle in ('Continue', 'Submit'):
+            for button in buttons:
+                if needle in button['aria_label']:
+                    return button
+        for button in buttons:
+            if button['primary']:
+                return button
+        return None
+    
+    def screening_answer(self, question, field_type, options=None):
+        """Answer a screening question from the answer bank; unknown questions are queued for review"""
+        if not question:
+            return None
+        answer = self.answer_bank.lookup(question, options)
+        if answer is None:
+            self.answer_bank.queue_unknown(question, field_type, options, self.current_job_url)
+            self.log(f"No stored answer for '{question[:60]}', queued for review", "DEBUG")
+        return answer
+    
+    def plan_easy_apply_step(self, inventory):
+        """Decide every fill for a step from its inventory without touching the browser.
+        Returns (actions, button to click or None, questions of required fields left unanswered)."""
+        actions = []
+        unanswered = []
+        handled = set()
+        resume_ready = self.resume_path and os.path.exists(self.resume_path)
+        exp_years = PERSONAL_INFO.get('experience_years', '0')
+        
+        for field in inventory['fields']:
+            if not field['enabled']:
+                continue
+            label_text = field['label'].lower()
+            
+            if field['type'] == 'file':
+                if resume_ready and 'upload' not in handled:
+                    actions.append({'action': 'upload', 'field': field, 'value': self.resume_path})
+                    handled.add('upload')
+                continue
+            
+            if field['type'] == 'checkbox':
+                # Check boxes for terms, privacy, etc.
+                if not field['checked'] and any(word in label_text for word in CONSENT_CHECKBOX_WORDS):
+                    actions.append({'action': 'check', 'field': field, 'name': label_text[:50]})
+                continue
+            
+            if field['type'] == 'radio':
+                # Radio groups are screening questions; answer the group once from the answer bank
+                group_name = f"radio:{field['name'] or field['group_label']}"
+                if group_name in handled:
+                    continue
+                handled.add(group_name)
+                group = [other for other in inventory['fields'] if other['type'] == 'radio' and other['name'] == field['name']]
+                if any(radio['checked'] for radio in group):
+                    continue
+                answer = self.screening_answer(field['group_label'] or field['label'], 'radio', [radio['label'] for radio in group])
+                for radio in group:
+                    if answer and radio['label'] == answer:
+                        actions.append({'action': 'check', 'field': radio, 'name': f"{field['group_label'][:40]}: {answer}"})
+                        break
+                else:
+                    if any(radio['required'] for radio in group):
+                        unanswered.append(field['group_label'] or field['label'] or field['name'])
+                continue
+            
+            rule = FIELD_MATCHER.match_field(field) if field['tag'] != 'textarea' else None
+            if rule and rule[1].startswith('handler:'):
+                if rule[0] in handled:
+                    continue
+                handled.add(rule[0])
+                if field['tag'] == 'select':
+                    index = self.pick_option(field['options'], COUNTRY_OPTION_KEYWORDS[rule[0]])
+                    if index is not None and index != field['selected_index']:
+                        actions.append({'action': 'select', 'field': field, 'index': index, 'name': rule[0]})
+                else:
+                    actions.append({'action': 'rule', 'field': field, 'rule': rule, 'name': rule[0]})
+                continue
+            
+            question = field['label'] or field['aria_label'] or field['placeholder']
+            
+            if field['tag'] == 'select':
+                # Dropdowns (experience, education, ...) that are still on their placeholder
+                if len(field['options']) > 1 and field['selected_index'] <= 0:
+                    answer = self.screening_answer(question, 'select', field['options'][1:])
+                    if answer:
+                        index = field['options'].index(answer)
+                    elif GUESS_UNKNOWN_ANSWERS:
+                        index = next((i for i, text in enumerate(field['options']) 
+                                      if i > 0 and (exp_years in text or 'year' in text.lower())), 1)
+                    else:
+                        if field['required']:
+                            unanswered.append(question or field['name'])
+                        continue
+                    actions.append({'action': 'select', 'field': field, 'index': index, 'name': field['name'] or 'dropdown'})
+                continue
+            
+            if field['tag'] == 'textarea':
+                placeholder = field['placeholder'].lower()
+                if ("cover" in placeholder or "message" in placeholder) and field['value'] != PERSONAL_INFO['cover_letter']:
+                    actions.append({'action': 'fill', 'field': field, 'value': PERSONAL_INFO['cover_letter'], 'name': 'cover letter'})
+                elif not field['value']:
+                    answer = self.screening_answer(question, 'textarea')
+                    if answer or GUESS_UNKNOWN_ANSWERS:
+                        actions.append({'action': 'fill', 'field': field, 'value': answer or DEFAULT_TEXTAREA_ANSWER, 'name': 'additional info'})
+                    elif field['required']:
+                        unanswered.append(question or field['name'])
+                continue
+            
+            if field['value']:
+                continue
+            answer = self.answer_bank.lookup(question) if question else None
+            if answer:
+                actions.append({'action': 'fill', 'field': field, 'value': answer, 'name': question[:40]})
+            elif rule:
+                actions.append({'action': 'fill', 'field': field, 'value': PERSONAL_INFO.get(rule[1], ''), 'name': rule[0]})
+            elif field['required']:
+                if question:
+                    self.screening_answer(question, field['type'])
+                unanswered.append(question or field['name'])
+        
+        return actions, self.choose_step_button(inventory['buttons']), unanswered
+    
+    def apply_step_plan(self, actions):
+        """Carry out planned step actions; returns True if anything was filled"""
+        form_filled = False
+        for action in actions:
+            element = action['field']['element']
+            try:
+                if action['action'] == 'fill':
+                    form_filled = self.fill_form_field(element, action['value'], action['name']) or form_filled
+                elif action['action'] == 'rule':
+                    form_filled = self.apply_field_rule(element, action['rule'], action['name']) or form_filled
+                elif action['action'] == 'select':
+                    self.driver.execute_script(SELECT_OPTION_JS, element, action['index'])
+                    self.log(f"Selected dropdown option: {action['field']['options'][action['index']]}", "EASY")
+                    form_filled = True
+                elif action['action'] == 'upload':
+                    with self.span('upload'):
+                        element.send_keys(action['value'])
+                        self.waits.until('upload_finished')
+                    self.log("Resume uploaded successfully", "EASY")
+                    form_filled = True
+                elif action['action'] == 'check':
+                    element.click()
+                    self.log(f"Checked checkbox: {action['name']}...", "EASY")
+                    form_filled = True
+            except Exception as e:
+                self.log(f" Failed to {action['action']} {action.get('name', 'field')}: {str(e)}", "WARNING")
+        return form_filled
+    
     def handle_easy_apply_form(self):
-        """Handle LinkedIn Easy Apply form with multiple steps and enhanced country support"""
+        """Handle LinkedIn Easy Apply form with multiple steps and enhanced country support.
+        Returns (submitted, reason); submitted is True only once LinkedIn confirmed the application.
+        A step with required questions nobody could answer is not sent: the modal is discarded and the
+        questions wait in the answer bank's review queue, so a later run can retry the job."""
         try:
             self.log("Looking for Easy Apply form...", "EASY")
             
@@ -880,222 +3479,48 @@ class LinkedInJobBot:
                 current_step += 1
                 self.log(f" Processing form step {current_step}", "EASY")
                 
-                # Wait for form to load
-                time.sleep(3)
-                
-                # Look for form fields and fill them
-                form_filled = False
+                # Wait for the modal step to render
+                self.waits.until('modal_step_rendered')
                 
-                # Fill basic contact information
-                contact_fields = {
-                    'firstName': PERSONAL_INFO['first_name'],
-                    'lastName': PERSONAL_INFO['last_name'],
-                    'email': PERSONAL_INFO['email'],
-                    'phone': PERSONAL_INFO['phone_number']  # Phone without country code for LinkedIn
-                }
+                with self.span('form_step', step=current_step) as step_span:
+                    # Read the whole step once, plan the fills in Python, then apply them in one pass
+                    inventory = self.get_step_inventory()
+                    actions, button, unanswered = self.plan_easy_apply_step(inventory)
+                    step_span['actions'] = len(actions)
+                    if unanswered:
+                        step_span['unanswered'] = len(unanswered)
+                        self.log(f" Required questions without an answer: {'; '.join(q[:60] for q in unanswered)}", "WARNING")
+                        self.discard_easy_apply()
+                        return False, f"Needs review: {', '.join(q[:60] for q in unanswered)}"
+                    self.apply_step_plan(actions)
                 
-                for field_name, value in contact_fields.items():
-                    try:
-                        # Multiple selectors for different field naming conventions
-                        field_selectors = [
-                            f"input[name='{field_name}']",
-                            f"input[id*='{field_name}']",
-                            f"input[placeholder*='{field_name}']",
-                            f"input[aria-label*='{field_name}']"
-                        ]
+                    button_found = False
+                    if button:
+                        button_text = button['text'] or button['aria_label'] or 'Button'
+                        step_text = inventory['step_text']
+                        if any(action['action'] in ('upload', 'check') for action in actions):
+                            # Uploads and checkboxes change the step's text themselves
+                            step_text = self.driver.execute_script(f"const modal = {EASY_APPLY_MODAL_JS}; return modal ? modal.innerText : '';")
+                        try:
+                            self.driver.execute_script("arguments[0].scrollIntoView(true);", button['element'])
+                            if 'submit' in button_text.lower():
+                                self.pace('submit')
+                            button['element'].click()
+                            self.log(f" Clicked button: {button_text}", "EASY")
+                            button_found = True
                         
-                        for selector in field_selectors:
-                            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            for element in elements:
-                                if element.is_displayed() and element.is_enabled():
-                                    if self.fill_form_field(element, value, field_name):
-                                        form_filled = True
-                                    break
-                            if form_filled:
-                                break
-                    except:
-                        continue
-                
-                # Handle country fields in Easy Apply forms
-                try:
-                    country_selectors = [
-                        "select[name*='country']",
-                        "select[id*='country']",
-                        "input[name*='country']",
-                        "input[id*='country']"
-                    ]
-                    
-                    for selector in country_selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled():
-                                if self.handle_country_field(element):
-                                    form_filled = True
-                                break
-                except:
-                    pass
-                
-                # Handle phone country code in Easy Apply forms
-                try:
-                    phone_country_selectors = [
-                        "select[name*='phoneCountry']",
-                        "select[name*='phone-country']",
-                        "select[id*='phoneCountry']",
-                        "select[id*='phone-country']"
-                    ]
-                    
-                    for selector in phone_country_selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled():
-                                if self.handle_phone_country_code(element):
-                                    form_filled = True
-                                break
-                except:
-                    pass
-                
-                # Handle city/location fields
-                try:
-                    location_selectors = [
-                        "input[name*='city']",
-                        "input[id*='city']",
-                        "input[name*='location']",
-                        "input[id*='location']"
-                    ]
-                    
-                    for selector in location_selectors:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled() and not element.get_attribute("value"):
-                                if self.fill_form_field(element, PERSONAL_INFO['city'], 'city'):
-                                    form_filled = True
-                                break
-                except:
-                    pass
-                
-                # Handle file upload (Resume)
-                try:
-                    file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file']")
-                    for file_input in file_inputs:
-                        if file_input.is_displayed() and RESUME_PATH and os.path.exists(RESUME_PATH):
-                            file_input.send_keys(RESUME_PATH)
-                            self.log("Resume uploaded successfully", "EASY")
-                            form_filled = True
-                            time.sleep(2)
-                            break
-                except:
-                    pass
-                
-                # Handle dropdown fields (Experience, Education, etc.)
-                try:
-                    select_elements = self.driver.find_elements(By.TAG_NAME, "select")
-                    for select_elem in select_elements:
-                        if select_elem.is_displayed():
-                            # Skip if it's a country or phone country field (already handled above)
-                            elem_name = (select_elem.get_attribute("name") or "").lower()
-                            elem_id = (select_elem.get_attribute("id") or "").lower()
-                            
-                            if any(keyword in elem_name or keyword in elem_id 
-                                   for keyword in ['country', 'phone']):
-                                continue
-                            
-                            select_obj = Select(select_elem)
-                            options = select_obj.options
-                            
-                            # Try to select relevant experience level
-                            if len(options) > 1:
-                                # Look for options that match experience years
-                                exp_years = PERSONAL_INFO.get('experience_years', '0')
-                                for option in options[1:]:  # Skip first option (usually "Select...")
-                                    if exp_years in option.text or 'year' in option.text.lower():
-                                        select_obj.select_by_visible_text(option.text)
-                                        self.log(f"Selected dropdown option: {option.text}", "EASY")
-                                        form_filled = True
-                                        break
-                                else:
-                                    # If no matching option, select second option
-                                    select_obj.select_by_index(1)
-                                    form_filled = True
-                except:
-                    pass
-                
-                # Handle text areas (Cover letter, additional info)
-                try:
-                    text_areas = self.driver.find_elements(By.TAG_NAME, "textarea")
-                    for textarea in text_areas:
-                        if textarea.is_displayed() and textarea.is_enabled():
-                            placeholder = textarea.get_attribute("placeholder") or ""
-                            if "cover" in placeholder.lower() or "message" in placeholder.lower():
-                                self.fill_form_field(textarea, PERSONAL_INFO['cover_letter'], "cover letter")
-                                form_filled = True
-                            elif not textarea.get_attribute("value"):
-                                # Fill with generic message if empty
-                                self.fill_form_field(textarea, "I am very interested in this position and believe my skills and experience make me a great fit.", "additional info")
-                                form_filled = True
-                except:
-                    pass
-                
-                # Handle checkboxes and radio buttons
-                try:
-                    # Check required checkboxes (like terms and conditions)
-                    checkboxes = self.driver.find_elements(By.XPATH, "//input[@type='checkbox']")
-                    for checkbox in checkboxes:
-                        if checkbox.is_displayed() and not checkbox.is_selected():
-                            label_text = ""
-                            try:
-                                # Get associated label text
-                                label = self.driver.find_element(By.XPATH, f"//label[@for='{checkbox.get_attribute('id')}']")
-                                label_text = label.text.lower()
-                            except:
-                                pass
-                            
-                            # Check boxes for terms, privacy, etc.
-                            if any(word in label_text for word in ['term', 'privacy', 'agree', 'consent']):
-                                checkbox.click()
-                                self.log(f"Checked checkbox: {label_text[:50]}...", "EASY")
-                                form_filled = True
-                                time.sleep(0.5)
-                except:
-                    pass
-                
-                # Look for Next/Continue/Submit buttons
-                button_found = False
-                button_selectors = [
-                    "//button[contains(text(), 'Next')]",
-                    "//button[contains(text(), 'Continue')]",
-                    "//button[contains(text(), 'Submit')]",
-                    "//button[contains(text(), 'Review')]",
-                    "//button[contains(@aria-label, 'Continue')]",
-                    "//button[contains(@aria-label, 'Submit')]",
-                    "//button[contains(@class, 'artdeco-button--primary')]"
-                ]
-                
-                for selector in button_selectors:
-                    try:
-                        buttons = self.driver.find_elements(By.XPATH, selector)
-                        for button in buttons:
-                            if button.is_displayed() and button.is_enabled():
-                                button_text = button.text or button.get_attribute('aria-label') or 'Button'
-                                
-                                # Scroll to button
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                                time.sleep(1)
-                                
-                                # Click the button
-                                button.click()
-                                self.log(f" Clicked button: {button_text}", "EASY")
-                                button_found = True
-                                time.sleep(3)
-                                
-                                # If this was a submit button, we're done
-                                if 'submit' in button_text.lower():
-                                    return True
-                                
-                                break
-                        if button_found:
-                            break
-                    except Exception as e:
-                        continue
+                            # If this was a submit button, we're done once LinkedIn confirms it
+                            if 'submit' in button_text.lower():
+                                with self.span('submit') as submit_span:
+                                    submit_span['ok'] = bool(self.waits.until('submit_confirmed'))
+                                if submit_span['ok']:
+                                    return True, "Applied successfully via Easy Apply"
+                                self.discard_easy_apply()
+                                return False, "Easy Apply submission was not confirmed"
+                        
+                            self.waits.until('modal_step_changed', step_text)
+                        except Exception as e:
+                            self.log(f" Could not click {button_text}: {str(e)}", "WARNING")
                 
                 # If no button found or no form fields, we might be done
                 if not button_found:
@@ -1103,104 +3528,158 @@ class LinkedInJobBot:
                     break
                 
                 # Check if we've reached the final confirmation page
-                if any(text in self.driver.page_source.lower() for text in ['application submitted', 'thank you', 'application received']):
+                if self.waits.check(PAGE_STATE_CONDITIONS['submit_confirmed'], ()):
                     self.log(" Application submitted successfully!", "EASY")
-                    return True
+                    return True, "Applied successfully via Easy Apply"
             
-            return True
+            self.discard_easy_apply()
+            if current_step >= max_steps:
+                return False, f"Easy Apply not submitted after {max_steps} steps"
+            return False, "Easy Apply form has no button to continue"
             
         except Exception as e:
             self.log(f" Error handling Easy Apply form: {str(e)}", "ERROR")
-            return False
+            return False, "Easy Apply form submission failed"
+    
+    def discard_easy_apply(self):
+        """Close an unfinished Easy Apply modal so nothing half-filled is left open or sent"""
+        try:
+            if self.driver.execute_script(DISMISS_EASY_APPLY_JS):
+                self.waits.until('discard_confirmed', condition=CONFIRM_DISCARD_JS, timeout=2)
+                self.log(" Discarded the unfinished Easy Apply application", "EASY")
+        except Exception as e:
+            self.log(f" Could not close the Easy Apply modal: {str(e)}", "DEBUG")
 
+    def classify_apply_button(self):
+        """Find every apply control on the job page and classify the job in one round-trip.
+        Returns {'kind', 'element', 'text'}; kind is easy_apply, company_site, applied, closed or none,
+        and element is the control to click (None for the last three)."""
+        try:
+            return self.driver.execute_script(APPLY_CONTROL_JS)
+        except Exception as e:
+            self.log(f"Apply control classification failed: {str(e)}", "WARNING")
+            return {'kind': 'none', 'element': None, 'text': ''}
+    
+    def find_apply_button_by_xpath(self):
+        """Selector-cascade fallback for classify_apply_button, with the same result shape.
+        It cannot recognise applied or closed jobs; those come back as none."""
+        apply_button_selectors = [
+            "//button[contains(@class, 'jobs-apply-button') and contains(text(), 'Easy Apply')]",
+            "//button[contains(text(), 'Easy Apply')]",
+            "//a[contains(text(), 'Easy Apply')]",
+            "//button[contains(@class, 'jobs-apply-button')]",
+            "//button[contains(text(), 'Apply')]",
+            "//a[contains(text(), 'Apply')]",
+            "//button[contains(text(), 'Apply on company website')]",
+            "//a[contains(text(), 'Apply on company website')]",
+            "//span[contains(translate(text(),'APPLY','apply'),'apply')]",
+            "//input[contains(translate(@value,'APPLY','apply'),'apply')]"
+            ]
+        
+        for selector in apply_button_selectors:
+            try:
+                elements = self.driver.find_elements(By.XPATH, selector)
+                for element in elements:
+                    if element.is_displayed() and element.is_enabled():
+                        button_text = element.text.lower() or (element.get_attribute("aria-label") or "").lower()
+                        kind = 'none'
+                        if "easy apply" in button_text:
+                            kind = 'easy_apply'
+                        elif "company" in button_text or "external" in button_text:
+                            kind = 'company_site'
+                        return {'kind': kind, 'element': element, 'text': button_text}
+            except:
+                continue
+        return {'kind': 'none', 'element': None, 'text': ''}
+    
     def apply_to_single_job(self, job_url, job_title):
+        """Open a job and apply to it. Returns (success, reason); success is None when the
+        application was handed to the company-site lane."""
+        preloaded = None
         try:
+            if self.is_job_id_already_applied(job_url):
+                self.log(" Already applied to this job in an earlier run, skipping...", "WARNING")
+                return False, "Already applied"
+            
             self.log(f" Opening job: {job_title}", "INFO")
-            self.driver.get(job_url)
-            time.sleep(3)
+            self.current_job_url = job_url
+            with self.span('navigation'):
+                if self.prefetcher and self.prefetcher.active:
+                    preloaded = self.prefetcher.take(job_url)
+                if preloaded is None:
+                    self.load_page(job_url)
+                self.waits.until('job_page_loaded')
+                if preloaded is None:
+                    self.record_page_stats("job")
 
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                )
 
             # Extract company name
-            company = "Unknown Company"
-            try:
-                company_selectors = [
-                ".jobs-unified-top-card__company-name a",
-                ".jobs-unified-top-card__company-name",
-                ".topcard__org-name-link",
-                ".job-details-jobs-unified-top-card__company-name"
-                 ]
-                for selector in company_selectors:
-                    try:
-                        elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if elem.text.strip():
-                            company = elem.text.strip()
-                            break
-                    except:
-                        continue
-            except:
-                pass
+            with self.span('company_extraction'):
+                try:
+                    company = (preloaded or {}).get('company') or self.extract_company_name()
+                except Exception:
+                    company = "Unknown Company"
 
             self.log(f"Company: {company}", "INFO")
 
-            if self.is_job_already_applied(job_title, company):
+            if self.is_job_already_applied(job_title, company, job_url):
                 self.log(" Already applied to this job, skipping...", "WARNING")
                 return False, "Already applied"
 
-            # Apply button detection
-            apply_button_selectors = [
-                "//button[contains(@class, 'jobs-apply-button') and contains(text(), 'Easy Apply')]",
-                "//button[contains(text(), 'Easy Apply')]",
-                "//a[contains(text(), 'Easy Apply')]",
-                "//button[contains(@class, 'jobs-apply-button')]",
-                "//button[contains(text(), 'Apply')]",
-                "//a[contains(text(), 'Apply')]",
-                "//button[contains(text(), 'Apply on company website')]",
-                "//a[contains(text(), 'Apply on company website')]",
-                "//span[contains(translate(text(),'APPLY','apply'),'apply')]",
-                "//input[contains(translate(@value,'APPLY','apply'),'apply')]"
-                ]
-
-            apply_button = None
-            is_easy_apply = False
-            is_company_site = False
-
-            for selector in apply_button_selectors:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            button_text = element.text.lower() or element.get_attribute("aria-label", "").lower()
-                            if "easy apply" in button_text:
-                                is_easy_apply = True
-                            elif "company" in button_text or "external" in button_text:
-                                is_company_site = True
-
-                            apply_button = element
-                            self.log(f"Found apply button: {button_text}", "SUCCESS")
-                            break
-                    if apply_button:
-                        break
-                except:
-                    continue
+            with self.span('apply_button_search') as search:
+                if (preloaded or {}).get('kind') in ('applied', 'closed'):
+                    # Read in the background tab; there is nothing to click
+                    apply_control = {'kind': preloaded['kind'], 'text': preloaded['text'], 'element': None}
+                elif CLASSIFY_APPLY_BUTTON:
+                    apply_control = self.classify_apply_button()
+                else:
+                    apply_control = self.find_apply_button_by_xpath()
+                search['kind'] = apply_control['kind']
+                search['ok'] = apply_control['element'] is not None
+            
+            if apply_control['kind'] == 'applied':
+                self.log(f" LinkedIn shows this job as already applied ({apply_control['text']}), skipping...", "WARNING")
+                if SAVE_APPLIED_JOBS:
+                    # Keep it in the history so later runs skip it from the listing card
+                    self.applied_store.add({'title': job_title, 'company': company, 'url': job_url,
+                                            'job_id': parse_job_id(job_url), 'application_type': 'linkedin_history',
+                                            'applied_at': datetime.now().isoformat()})
+                return False, "Already applied"
+            if apply_control['kind'] == 'closed':
+                self.log(" Job is no longer accepting applications, skipping...", "WARNING")
+                return False, "No longer accepting applications"
+            
+            apply_button = apply_control['element']
+            is_easy_apply = apply_control['kind'] == 'easy_apply'
+            is_company_site = apply_control['kind'] == 'company_site'
 
             # No apply button found
             if not apply_button:
                 self.log(" No apply button found on the job page", "WARNING")
                 return False, "No apply button found"
+            self.log(f"Found apply button: {apply_control['text']} ({apply_control['kind']})", "SUCCESS")
+            
+            # A company whose site keeps failing is skipped before any tab opens
+            blocked = self.site_profiles.blocked_reason(company=company) if is_company_site else None
+            if blocked:
+                self.log(f" Skipping company site application: {blocked}", "COMPANY")
+                return False, f"Skipped: {blocked}"
 
             # Scroll and click apply button
             self.driver.execute_script("arguments[0].scrollIntoView(true);", apply_button)
-            time.sleep(1)
 
             original_window = self.driver.current_window_handle
             original_windows = self.driver.window_handles
 
             self.driver.execute_script("arguments[0].click();", apply_button)
             self.log("Clicked apply button", "SUCCESS")
-            time.sleep(3)
+            self.waits.until('apply_opened', condition=lambda driver: (
+                len(driver.window_handles) > len(original_windows) or
+                driver.execute_script(f"return !!{EASY_APPLY_MODAL_JS};")
+            ))
 
             new_windows = self.driver.window_handles
 
@@ -1210,46 +3689,53 @@ class LinkedInJobBot:
                     if win not in original_windows:
                         self.driver.switch_to.window(win)
                         break
+                
+                self.waits.until('popup_navigated', condition=lambda driver: driver.current_url not in ("", "about:blank"))
+                site_url = self.driver.current_url
+                domain = site_key(site_url)
+                if company != "Unknown Company":
+                    self.site_profiles.link_company(company, domain)
+                blocked = self.site_profiles.blocked_reason(domain=domain)
+                if blocked:
+                    self.driver.close()
+                    self.driver.switch_to.window(original_window)
+                    self.log(f" Skipping company site application: {blocked}", "COMPANY")
+                    return False, f"Skipped: {blocked}"
+
+                if self.company_site_lane:
+                    # Only the external URL is needed here; a lane browser fills the form
+                    self.driver.close()
+                    self.driver.switch_to.window(original_window)
+                    self.company_site_lane.submit({'title': job_title, 'company': company, 'url': job_url, 'site_url': site_url})
+                    self.log(f" Queued company site application: {site_url}", "COMPANY")
+                    return None, "Queued for the company-site lane"
 
                 self.log(" Switched to company website", "INFO")
-                time.sleep(3)
+                self.waits.until('page_ready', timeout=self.site_profiles.page_timeout(domain))
                 self.handle_cookies_popup()
 
-                success = self.handle_company_site_application(job_title, company)
+                success, reason = self.complete_company_site_application(job_title, company, job_url)
                 self.driver.switch_to.window(original_window)
-
-                if success:
-                    job_data = {
-                    'title': job_title,
-                    'company': company,
-                    'url': job_url,
-                    'applied_at': datetime.now().isoformat(),
-                    'signature': f"{job_title.lower()}_{company.lower()}",
-                    'application_type': 'company_site'
-                    }
-                    self.applied_jobs.append(job_data)
-                    self.company_site_jobs.append(job_data)
-                    return True, "Applied successfully on company site"
-                else:
-                    return False, "Company site application failed"
+                return success, reason
 
             # Handle Easy Apply
             elif is_easy_apply:
-                success = self.handle_easy_apply_form()
+                success, reason = self.handle_easy_apply_form()
 
                 if success:
                     job_data = {
                     'title': job_title,
                     'company': company,
                     'url': job_url,
+                    'job_id': parse_job_id(job_url),
                     'applied_at': datetime.now().isoformat(),
                     'signature': f"{job_title.lower()}_{company.lower()}",
                     'application_type': 'easy_apply'
                     }
-                    self.applied_jobs.append(job_data)
-                    return True, "Applied successfully via Easy Apply"
+                    self.record_applied(job_data)
+                    return True, reason
                 else:
-                    return False, "Easy Apply form submission failed"
+                    return False, reason
 
             else:
                 self.log(" Unknown application type, skipping...", "WARNING")
@@ -1258,9 +3744,164 @@ class LinkedInJobBot:
         except Exception as e:
             self.log(f"Unexpected error during apply: {str(e)}", "ERROR")
             return False, str(e)
+        finally:
+            if preloaded is not None:
+                self.prefetcher.release()
 
-    def run(self):
-        """Main execution method"""
+    def spawn_worker(self, worker_id, prefix="W", copy_session=True):
+        """Start a headless browser that shares this bot's result lists and, unless copy_session is False,
+        its authenticated LinkedIn session"""
+        worker = LinkedInJobBot(headless=WORKER_HEADLESS, applied_store=self.applied_store,
+                                answer_bank=self.answer_bank, event_log=self.event_log, profiler=self.profiler,
+                                manual_inputs=self.manual_inputs, form_plans=self.form_plans,
+                                site_profiles=self.site_profiles, resume_path=self.resume_path)
+        worker.base_url = self.base_url
+        worker.log_prefix = f"[{prefix}{worker_id}] "
+        worker.applied_jobs = self.applied_jobs
+        worker.failed_jobs = self.failed_jobs
+        worker.company_site_jobs = self.company_site_jobs
+        worker.needs_input_jobs = self.needs_input_jobs
+        worker.results_lock = self.results_lock
+        worker.applied_signatures = self.applied_signatures
+        worker.company_site_lane = self.company_site_lane
+        worker.checkpoint = self.checkpoint
+        worker.governor = self.governor
+        if not copy_session:
+            return worker
+        
+        # Cookies can only be set for the domain currently loaded
+        worker.load_page(self.base_url)
+        for cookie in self.driver.get_cookies():
+            try:
+                worker.driver.add_cookie(cookie)
+            except Exception as e:
+                worker.log(f"Could not copy cookie {cookie.get('name')}: {str(e)}", "DEBUG")
+        return worker
+    
+    def apply_worker_loop(self, worker, job_queue, apply_slots, counters):
+        """Take jobs from the queue until the collector sends the stop sentinel"""
+        while True:
+            job_data = job_queue.get()
+            if job_data is None:
+                break
+            
+            try:
+                with apply_slots:
+                    success, reason = worker.apply_to_single_job(job_data['url'], job_data['title'])
+            except Exception as e:
+                success, reason = False, str(e)
+            
+            if success:
+                worker.log(f"Successfully applied to: {job_data['title']}", "SUCCESS")
+            elif success is None:
+                worker.log(f" {reason}: {job_data['title']}", "COMPANY")
+                if worker.checkpoint:
+                    worker.checkpoint.job_status(job_data['url'], 'queued')
+            else:
+                worker.log(f" Failed to apply to: {job_data['title']} - {reason}", "WARNING")
+                worker.record_failure(job_data, reason)
+            
+            with self.results_lock:
+                counters['attempted'] += 1
+                counters['applied'] += 1 if success else 0
+            
+            worker.random_delay(*WORKER_PACING)
+    
+    def run_worker_pool(self, keywords, location=None, pool_size=None):
+        """Collect job cards for every keyword on this browser and apply to them from a pool of workers.
+        Returns (attempted, applied) like apply_to_jobs."""
+        pool_size = pool_size or WORKER_POOL_SIZE
+        job_queue = queue.Queue()
+        apply_slots = threading.BoundedSemaphore(MAX_CONCURRENT_APPLIES)
+        counters = {'attempted': 0, 'applied': 0}
+        workers = []
+        threads = []
+        
+        try:
+            for worker_id in range(1, pool_size + 1):
+                worker = self.spawn_worker(worker_id)
+                workers.append(worker)
+                thread = threading.Thread(target=self.apply_worker_loop, name=f"apply-worker-{worker_id}",
+                                          args=(worker, job_queue, apply_slots, counters), daemon=True)
+                thread.start()
+                threads.append(thread)
+            self.log(f"Started {pool_size} apply workers (max {MAX_CONCURRENT_APPLIES} concurrent)", "SUCCESS")
+            
+            # Collector stage: feed the queue while the workers are already applying
+            queued_urls = set()
+            for keyword_index, keyword in enumerate(keywords):
+                resume = self.resume_plan(keyword_index)
+                if resume is not None and not resume['jobs'] and resume['crawl_done']:
+                    continue
+                if self.checkpoint:
+                    self.checkpoint.start_keyword(keyword_index)
+                try:
+                    new_jobs = 0
+                    if resume is not None:
+                        job_links = resume['jobs']
+                        if not resume['crawl_done'] and resume['remaining'] > 0:
+                            job_links = itertools.chain(job_links, self.crawl_job_listings(
+                                keyword, location, max_jobs=resume['remaining'], incremental=True,
+                                start_page=resume['start_page'], seen_jobs=resume['seen_jobs']))
+                    elif USE_LISTING_CRAWLER and USE_DOM_SNAPSHOT:
+                        self.search_jobs(keyword, location)
+                        # Workers start applying while later scroll batches are still being read
+                        job_links = self.crawl_job_listings(keyword, location, incremental=True)
+                    else:
+                        self.search_jobs(keyword, location)
+                        job_links = self.get_job_links_from_listing_page()
+                        if TRIAGE_JOB_CARDS:
+                            job_links, _ = self.triage_job_cards(job_links)
+                    for job_data in job_links:
+                        if job_data['url'] in queued_urls:
+                            continue
+                        queued_urls.add(job_data['url'])
+                        job_queue.put({'title': job_data['title'], 'url': job_data['url']})
+                        new_jobs += 1
+                    self.log(f"Queued {new_jobs} jobs for '{keyword}'", "INFO")
+                except Exception as keyword_error:
+                    self.log(f"Error collecting jobs for '{keyword}': {str(keyword_error)}", "ERROR")
+                
+                if keyword_index < len(keywords) - 1:
+                    self.random_delay(*KEYWORD_PACING)
+        finally:
+            for _ in threads:
+                job_queue.put(None)
+            for thread in threads:
+                thread.join()
+            for worker in workers:
+                try:
+                    worker.driver.quit()
+                except:
+                    pass
+        
+        return counters['attempted'], counters['applied']
+    
+    def resume_plan(self, keyword_index):
+        """The checkpoint's remaining work for a keyword when resuming, None to process it from scratch"""
+        if self.resume_index is None or keyword_index > self.resume_index:
+            return None
+        return self.checkpoint.resume_plan(keyword_index)
+    
+    def start_checkpoint(self, resume=False):
+        """Create the run checkpoint, or restore the last one when resuming. Returns True if restored."""
+        if resume:
+            try:
+                self.checkpoint = RunCheckpoint.load(self, CHECKPOINT_FILE)
+            except Exception as e:
+                self.log(f" Could not read checkpoint {CHECKPOINT_FILE}: {str(e)}", "WARNING")
+            if self.checkpoint:
+                self.checkpoint.restore()
+                self.resume_index = self.checkpoint.state['keyword_index']
+                return True
+            self.log(f" No unfinished run in {CHECKPOINT_FILE}, starting a new run", "WARNING")
+        self.checkpoint = RunCheckpoint(self, CHECKPOINT_FILE)
+        self.checkpoint.save()
+        return False
+    
+    def run(self, resume=False):
+        """Main execution method. With resume=True the last checkpoint is restored first: its unfinished
+        jobs are applied to and the interrupted keyword continues from its first unread result page."""
         total_attempted = 0
         total_applied = 0
         
@@ -1277,50 +3918,133 @@ class LinkedInJobBot:
             self.log(f" Country: {PERSONAL_INFO['country']} ({PERSONAL_INFO['country_code']})", "INFO")
             self.log(f"Phone: {PERSONAL_INFO['phone']}", "INFO")
             
-            if RESUME_PATH and os.path.exists(RESUME_PATH):
-                self.log(f" Resume file found: {os.path.basename(RESUME_PATH)}", "SUCCESS")
+            if self.resume_path and os.path.exists(self.resume_path):
+                self.log(f" Resume file found: {os.path.basename(self.resume_path)}", "SUCCESS")
             else:
                 self.log(" No resume file specified or file not found", "WARNING")
             
-            # Login
-            self.login()
+            # Login (or reuse the saved session)
+            self.warm_start_login()
             
-            # Process each keyword
-            for keyword_index, keyword in enumerate(JOB_KEYWORDS):
-                try:
-                    self.log(f"\n{'='*60}", "INFO")
-                    self.log(f" PROCESSING KEYWORD {keyword_index + 1}/{len(JOB_KEYWORDS)}: '{keyword.upper()}'", "SUCCESS")
-                    self.log(f"{'='*60}", "INFO")
+            if HANDLE_COMPANY_SITES and ASYNC_COMPANY_SITES:
+                self.company_site_lane = CompanySiteLane(self)
+            
+            if (SAVE_CHECKPOINTS or resume) and self.start_checkpoint(resume):
+                # Recovery ends here: the next action is the first unfinished job, with no listing reloads
+                recovery_seconds = time.perf_counter() - self.started_at
+                found, finished, applied = self.checkpoint.totals()
+                self.log(f" Resuming run saved at {self.checkpoint.state['saved_at']}: keyword "
+                         f"{self.resume_index + 1}/{len(JOB_KEYWORDS)}, {found - finished} of {found} jobs unfinished, "
+                         f"{self.checkpoint.state['pages_read']} result pages not reloaded, "
+                         f"recovered in {recovery_seconds:.1f}s", "SUCCESS")
+                self.event_log.emit('resume', keyword_index=self.resume_index, jobs_found=found,
+                                    jobs_finished=finished, jobs_applied=applied,
+                                    pages_skipped=self.checkpoint.state['pages_read'],
+                                    recovery_seconds=round(recovery_seconds, 3))
+            
+            if WORKER_POOL_SIZE > 1:
+                self.log(f" Worker pool mode: {WORKER_POOL_SIZE} browser sessions", "INFO")
+                total_attempted, total_applied = self.run_worker_pool(JOB_KEYWORDS, LOCATION)
+            else:
+                # Process each keyword
+                for keyword_index, keyword in enumerate(JOB_KEYWORDS):
+                    resume_plan = self.resume_plan(keyword_index)
+                    if resume_plan is not None and not resume_plan['jobs'] and resume_plan['crawl_done']:
+                        continue  # Finished before the checkpoint
+                    if self.checkpoint:
+                        self.checkpoint.start_keyword(keyword_index)
+                    try:
+                        self.log(f"\n{'='*60}", "INFO")
+                        self.log(f" PROCESSING KEYWORD {keyword_index + 1}/{len(JOB_KEYWORDS)}: '{keyword.upper()}'", "SUCCESS")
+                        self.log(f"{'='*60}", "INFO")
                     
-                    # Search for jobs with current keyword
-                    self.search_jobs(keyword, LOCATION)
+                        # Search for jobs with current keyword (a resumed keyword goes straight to its jobs)
+                        if resume_plan is None:
+                            self.search_jobs(keyword, LOCATION)
                     
-                    # Apply to jobs for this keyword
-                    attempted, applied = self.apply_to_jobs()
-                    total_attempted += attempted
-                    total_applied += applied
+                        # Apply to jobs for this keyword
+                        attempted, applied = self.apply_to_jobs(keyword, LOCATION, resume=resume_plan)
+                        total_attempted += attempted
+                        total_applied += applied
                     
-                    self.log(f"Keyword '{keyword}' completed: {attempted} attempted, {applied} applied", "INFO")
+                        self.log(f"Keyword '{keyword}' completed: {attempted} attempted, {applied} applied", "INFO")
                     
-                    # Add delay between different keyword searches
-                    if keyword_index < len(JOB_KEYWORDS) - 1:  # Don't delay after last keyword
-                        self.log(f" Waiting before next keyword search...", "INFO")
-                        self.random_delay(8, 15)  # Longer delay between keyword searches
+                        # Add delay between different keyword searches
+                        if keyword_index < len(JOB_KEYWORDS) - 1:  # Don't delay after last keyword
+                            self.log(f" Waiting before next keyword search...", "INFO")
+                            self.random_delay(*KEYWORD_PACING)  # Longer delay between keyword searches
                         
-                except Exception as keyword_error:
-                    self.log(f"Error processing keyword '{keyword}': {str(keyword_error)}", "ERROR")
-                    continue
+                    except Exception as keyword_error:
+                        self.log(f"Error processing keyword '{keyword}': {str(keyword_error)}", "ERROR")
+                        continue
+            
+            if self.company_site_lane:
+                self.log(" Waiting for the company-site lane to finish...", "COMPANY")
+                queued = self.company_site_lane.close()
+                self.log(f" Company-site lane: {queued} queued, {len(self.company_site_jobs)} applied, "
+                         f"{len(self.needs_input_jobs)} need manual input", "COMPANY")
+                self.company_site_lane = None
+            if self.needs_input_jobs:
+                self.log(f" {len(self.needs_input_jobs)} company-site forms are waiting for manual input "
+                         f"(answer them with: python bot.py --answer-manual-inputs)", "COMPANY")
+                for job in self.needs_input_jobs[-3:]:
+                    fields = ', '.join(field_question(field) for field in job['fields'])
+                    self.log(f"   {job['title']} at {job['company']}: {fields}", "COMPANY")
+            if self.checkpoint:
+                self.checkpoint.save(completed=True)
             
             # Final summary
             self.log(f"\n SESSION COMPLETE! ", "SUCCESS")
             self.log(f" Total jobs attempted: {total_attempted}", "INFO")
             self.log(f" Total applications submitted: {total_applied}", "SUCCESS")
             self.log(f"Total failed applications: {len(self.failed_jobs)}", "INFO")
+            self.log(f" Application history: {self.applied_store.count()} jobs in {self.applied_store.path}", "INFO")
+            if TRIAGE_JOB_CARDS:
+                self.log(f" Page loads saved by triage: {self.page_loads_saved}", "INFO")
+            if self.page_stats:
+                total_kb = sum(stats['transfer_bytes'] for stats in self.page_stats) / 1024
+                cache_hits = sum(stats['cache_hits'] for stats in self.page_stats)
+                opaque = sum(stats['opaque'] for stats in self.page_stats)
+                avg_ms = sum(stats['load_ms'] for stats in self.page_stats) / len(self.page_stats)
+                self.log(f" Pages loaded: {len(self.page_stats)}, {total_kb:.0f} KB transferred ({cache_hits} resources "
+                         f"from cache, {opaque} cross-origin resources not measured), avg load {avg_ms:.0f} ms", "INFO")
             
             if total_attempted > 0:
                 success_rate = (total_applied/total_attempted*100)
                 self.log(f" Overall success rate: {success_rate:.1f}%", "INFO")
             
+            # Show how long each page state actually took to become ready
+            wait_summary = self.waits.summary()
+            if wait_summary:
+                self.log(f"\n Page readiness waits:", "DEBUG")
+                for state, stats in wait_summary.items():
+                    self.log(f"   {state}: {stats['count']} waits, avg {stats['avg']:.2f}s, "
+                             f"max {stats['max']:.2f}s, {stats['timeouts']} timeouts", "DEBUG")
+            
+            # How long pacing held each action class back
+            if self.governor:
+                for action, stats in self.governor.summary().items():
+                    self.log(f" Rate governor {action}: {stats['actions']} actions, waited {stats['waited']:.0f}s, "
+                             f"{stats['backoffs']} backoffs", "DEBUG")
+                    self.event_log.emit('rate_governor', action=action, actions=stats['actions'],
+                                        waited=round(stats['waited'], 3), backoffs=stats['backoffs'])
+            
+            # How often the next job page was already loaded, and what each background tab cost
+            if self.prefetcher and self.prefetcher.opened:
+                stats = self.prefetcher.summary()
+                self.log(f" Prefetch: {stats['hits']} of {stats['opened']} prefetched job pages were ready when reached, "
+                         f"{stats['avg_heap_mb']:.1f} MB JS heap per tab (max {stats['max_heap_mb']:.1f}), "
+                         f"{stats['avg_dom_nodes']:.0f} DOM nodes", "INFO")
+                self.event_log.emit('prefetch', depth=self.prefetcher.depth, opened=stats['opened'], hits=stats['hits'],
+                                    avg_heap_mb=round(stats['avg_heap_mb'], 1), max_heap_mb=round(stats['max_heap_mb'], 1),
+                                    avg_dom_nodes=round(stats['avg_dom_nodes']))
+            
+            # Which bot methods spent the most time in chromedriver round-trips
+            if self.profiler:
+                for method, calls, seconds, commands in self.profiler.print_report():
+                    self.event_log.emit('webdriver_profile', method=method, calls=calls, seconds=round(seconds, 3),
+                                        commands={command: count for command, (count, _) in commands.items()})
+            
             # Show applied jobs summary by type
             if self.applied_jobs:
                 self.log(f"\n Applied Jobs Summary:", "SUCCESS")
@@ -1366,15 +4090,589 @@ class LinkedInJobBot:
         except KeyboardInterrupt:
             self.log("\n Script interrupted by user", "WARNING")
             self.log(" Saving partial results...", "INFO")
+            if self.checkpoint:
+                self.checkpoint.save()
+                self.log(f" Checkpoint saved to {self.checkpoint.path} (continue with: python bot.py --resume)", "INFO")
 
         except Exception as main_error:
             self.log(f" Script failed: {str(main_error)}", "ERROR")
         finally:
             self.log("Closing browser...")
+            if self.company_site_lane:
+                self.company_site_lane.close(wait=False)
             try:
                 self.driver.quit()
             except:
                 pass
+            self.applied_store.close()
+            self.answer_bank.close()
+            self.manual_inputs.close()
+            self.form_plans.close()
+            self.site_profiles.close()
+            self.event_log.close()
+
+class QuietFixtureHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not print a line for every request.
+    /_synthetic/<kb>/<name> returns <kb> KB of filler bytes, typed by the name's extension,
+    so fixture pages can carry heavy images, fonts and media without binary files in the repo."""
+    def do_GET(self):
+        match = re.match(r"^/_synthetic/(\d+)/([\w.\-]+)", self.path)
+        if not match:
+            return super().do_GET()
+        body = b"\0" * (int(match.group(1)) * 1024)
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(match.group(2)))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+REPLAY_FIRST_JOB_ID = 4100000000
+REPLAY_JOB_MIX = ["easy_apply", "easy_apply", "company_site", "easy_apply", "applied", "easy_apply", "closed", "easy_apply"]
+REPLAY_TITLES = ["Data Analyst", "Senior Data Scientist", "Python Developer", "Business Intelligence Analyst",
+                 "Data Engineer", "SQL Analyst", "Machine Learning Engineer"]
+REPLAY_COMPANIES = ["Acme Analytics", "Globex", "Initech", "Umbrella Data", "Hooli", "Stark Insights", "Wayne Metrics",
+                    "Soylent Labs", "Vandelay Industries"]
+REPLAY_LOCATIONS = ["Hyderabad, Telangana, India (On-site)", "Hyderabad, Telangana, India (Hybrid)", "India (Remote)"]
+REPLAY_CARDS_PER_SCROLL = 10
+# What LinkedIn shows instead of cards when a search (or a result page past the end) has no jobs
+REPLAY_NO_RESULTS = ('<div class="jobs-search-no-results-banner"><h2>No matching jobs found.</h2>'
+                     '<p>Try shortening or rephrasing your search.</p></div>')
+REPLAY_APPLY_CONTROLS = {
+    'easy_apply': (
+        '<button class="jobs-apply-button artdeco-button artdeco-button--3 artdeco-button--primary" type="button" '
+        'aria-label="Easy Apply to $title at $company" data-replay-apply="easy">'
+        '<span class="artdeco-button__text">Easy Apply</span></button>'),
+    'company_site': (
+        '<button class="jobs-apply-button artdeco-button artdeco-button--3 artdeco-button--primary" type="button" '
+        'role="link" aria-label="Apply to $title on company website" data-replay-apply="company">'
+        '<span class="artdeco-button__text">Apply</span></button>'),
+    'applied': (
+        '<div class="artdeco-inline-feedback artdeco-inline-feedback--success">'
+        '<span class="artdeco-inline-feedback__message">Applied 2 days ago</span></div>'
+        '<a class="jobs-s-apply__application-link" href="#">See application</a>'),
+    'closed': (
+        '<div class="artdeco-inline-feedback artdeco-inline-feedback--error">'
+        '<span class="artdeco-inline-feedback__message">No longer accepting applications</span></div>')
+}
+# Stored answers for the replay modal's screening questions, so unattended runs can finish every step
+REPLAY_SCREENING_ANSWERS = {
+    "How many years of work experience do you have with Python?": "3",
+    "Are you legally authorized to work in India?": "Yes",
+    "Will you now or in the future require sponsorship for employment visa status?": "No",
+    "How did you hear about this job?": "LinkedIn"
+}
+
+def replay_job(index):
+    """The index-th job of the replay catalogue; the same index always gives the same job"""
+    return {
+        'job_id': str(REPLAY_FIRST_JOB_ID + index),
+        'kind': REPLAY_JOB_MIX[index % len(REPLAY_JOB_MIX)],
+        'title': REPLAY_TITLES[index % len(REPLAY_TITLES)],
+        'company': REPLAY_COMPANIES[index % len(REPLAY_COMPANIES)],
+        'location': REPLAY_LOCATIONS[index % len(REPLAY_LOCATIONS)]
+    }
+
+class ReplayHandler(QuietFixtureHandler):
+    """LinkedIn-like routes over the fixtures, for driving the real bot methods offline:
+    /jobs/search/ (paged with &start=, lazily extended while scrolling), /jobs/view/<id>/ (Easy Apply,
+    company site, already applied or closed), /careers/<id>/apply (external form; POST confirms it) and
+    /_replay/ping, which the fixture scripts fetch before every modal step and upload.
+    Every request first waits the server's latency; all other paths are served as static files."""
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        job_match = re.match(r"^/(jobs/view|careers)/(\d+)", url.path)
+        
+        if url.path.rstrip("/") == "/jobs/search":
+            return self.send_html(self.render_listing(query.get('keywords', [""])[0], int(query.get('start', ["0"])[0])))
+        if url.path == "/_replay/ping":
+            return self.send_html("ok")
+        if job_match:
+            job = self.server.jobs_by_id.get(job_match.group(2))
+            if not job:
+                return self.send_error(404, "Unknown replay job")
+            if job_match.group(1) == "careers":
+                return self.send_html(self.read_fixture("company_form.html"))
+            return self.send_html(self.render_template("replay/job.html", job, apply_controls=Template(
+                REPLAY_APPLY_CONTROLS[job['kind']]).substitute(job)))
+        return super().do_GET()
+    
+    def do_POST(self):
+        time.sleep(self.server.latency)
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not re.match(r"^/careers/\d+/apply", self.path):
+            return self.send_error(404, "Only company forms accept posts")
+        self.send_html(self.read_fixture("replay/submitted.html"))
+    
+    def read_fixture(self, name):
+        with open(os.path.join(self.directory, name), encoding="utf-8") as fixture:
+            return fixture.read()
+    
+    def render_template(self, name, *mappings, **fields):
+        return Template(self.read_fixture(name)).substitute(*mappings, **fields)
+    
+    def render_listing(self, keywords, start):
+        jobs = self.server.jobs[start:start + LISTING_PAGE_SIZE]
+        cards = [self.render_template("replay/card.html", job, position=start + offset,
+                                      footer=self.card_footer(job['kind']))
+                 for offset, job in enumerate(jobs)]
+        return self.render_template("replay/listing.html", keywords=keywords.title(),
+                                    cards="".join(cards[:REPLAY_CARDS_PER_SCROLL]),
+                                    more_cards="".join(cards[REPLAY_CARDS_PER_SCROLL:]),
+                                    no_results="" if cards else REPLAY_NO_RESULTS)
+    
+    def card_footer(self, kind):
+        if kind == 'easy_apply':
+            return '<li class="job-card-container__apply-method job-card-container__footer-item">Easy Apply</li>'
+        if kind == 'applied':
+            return '<li class="job-card-container__footer-job-state">Applied</li>'
+        return ""
+    
+    def send_html(self, html, status=200):
+        body = html.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class FixtureServer:
+    """Serve the local HTML fixtures over HTTP so benchmarks never hit LinkedIn.
+    Also answers the LinkedIn-like replay routes for a catalogue of jobs replay_job(0..jobs-1),
+    each request delayed by latency_ms."""
+    def __init__(self, directory=FIXTURES_DIR, port=0, latency_ms=0, jobs=REPLAY_JOB_COUNT):
+        handler = partial(ReplayHandler, directory=directory)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.latency = latency_ms / 1000
+        self.httpd.jobs = [replay_job(index) for index in range(jobs)]
+        self.httpd.jobs_by_id = {job['job_id']: job for job in self.httpd.jobs}
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        
+    def url(self, path=""):
+        return f"http://127.0.0.1:{self.httpd.server_port}/{path.lstrip('/')}"
+
+@contextmanager
+def count_webdriver_calls(driver):
+    """Count chromedriver round-trips per command while the block runs.
+    WebElement methods route through their parent driver, so element calls are counted too."""
+    counts = {}
+    original_execute = driver.execute
+    
+    def counting_execute(driver_command, params=None):
+        counts[driver_command] = counts.get(driver_command, 0) + 1
+        return original_execute(driver_command, params)
+    
+    driver.execute = counting_execute
+    try:
+        yield counts
+    finally:
+        driver.execute = original_execute
+
+def measure_webdriver_calls(driver, func, rounds=3, setup=None):
+    """Run func rounds times and return (last result, round-trips per round, average seconds).
+    setup runs before every round and is not measured."""
+    timings = []
+    for _ in range(rounds):
+        if setup:
+            setup()
+        with count_webdriver_calls(driver) as counts:
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+    return result, sum(counts.values()), sum(timings) / len(timings)
+
+def print_benchmark(title, results):
+    print(f"\n{title}")
+    print("-" * 60)
+    for label, result in results.items():
+        print(f"{label:<14} " + " ".join(f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                                          for key, value in result.items()))
+
+def benchmark_listing_extraction(rounds=3, fixture="linkedin_listing.html"):
+    """Compare per-element and snapshot job card extraction against a saved listing page"""
+    bot = LinkedInJobBot(headless=True)
+    results = {}
+    try:
+        with FixtureServer() as server:
+            bot.driver.get(server.url(fixture))
+            for label, use_snapshot in (("per-element", False), ("snapshot", True)):
+                job_links, round_trips, seconds = measure_webdriver_calls(
+                    bot.driver, lambda: bot.get_job_links_from_listing_page(use_snapshot=use_snapshot), rounds)
+                results[label] = {'jobs': len(job_links), 'round_trips': round_trips, 'avg_ms': seconds * 1000}
+    finally:
+        bot.driver.quit()
+    
+    print_benchmark(f"Listing extraction benchmark ({fixture}, {rounds} rounds)", results)
+    return results
+
+def benchmark_form_filling(rounds=3, fixture="company_form.html"):
+    """Compare the selector-sweep and compiled-matcher form autofill paths on a saved application form"""
+    bot = LinkedInJobBot(headless=True)
+    # Without this every missing selector in the sweep blocks for the full implicit wait
+    bot.driver.implicitly_wait(0)
+    results = {}
+    try:
+        with FixtureServer() as server:
+            form_url = server.url(fixture)
+            for label, use_matcher in (("selector-sweep", False), ("matcher", True)):
+                _, round_trips, seconds = measure_webdriver_calls(
+                    bot.driver, lambda: bot.fill_external_form_fields(use_matcher=use_matcher), rounds,
+                    setup=lambda: bot.driver.get(form_url))
+                filled = bot.driver.execute_script(
+                    "return Array.from(document.querySelectorAll('input, select, textarea')).filter(el => el.value).length;")
+                results[label] = {'fields_with_value': filled, 'round_trips': round_trips, 'avg_ms': seconds * 1000}
+            
+            # Learn a plan from one full discovery pass, then time replaying it on a fresh copy of the form
+            bot.form_plans = FormPlanStore(":memory:")
+            bot.driver.get(form_url)
+            fingerprint, before, _ = bot.replay_form_plan()
+            bot.discover_company_site_form()
+            bot.learn_form_plan(fingerprint, before)
+            plan, round_trips, seconds = measure_webdriver_calls(
+                bot.driver, bot.replay_form_plan, rounds, setup=lambda: bot.driver.get(form_url))
+            filled = bot.driver.execute_script(
+                "return Array.from(document.querySelectorAll('input, select, textarea')).filter(el => el.value).length;")
+            results['learned-plan'] = {'fields_with_value': filled, 'steps': len(plan[2] or []),
+                                       'round_trips': round_trips, 'avg_ms': seconds * 1000}
+            
+            # Pure matching cost on this form's field descriptors, with a cold cache
+            inventory = bot.driver.execute_script(FORM_INVENTORY_JS, None)
+            matcher = FieldMatcher(FIELD_RULES)
+            start = time.perf_counter()
+            for field in inventory:
+                matcher.cache.clear()
+                matcher.match_field(field)
+            per_field = (time.perf_counter() - start) / max(len(inventory), 1)
+            results['match-only'] = {'fields': len(inventory), 'avg_us_per_field': per_field * 1e6}
+    finally:
+        bot.driver.quit()
+    
+    print_benchmark(f"Form autofill benchmark ({fixture}, {rounds} rounds)", results)
+    return results
+
+def review_pending_questions(path=ANSWER_BANK_DB):
+    """Answer queued screening questions offline so later runs can reuse the answers"""
+    bank = AnswerBank(path)
+    pending = bank.pending()
+    print(f"{len(pending)} screening questions waiting for an answer (Enter skips, 'q' stops)")
+    try:
+        for item in pending:
+            print(f"\nQuestion ({item['field_type']}, seen {item['times_seen']}x): {item['question']}")
+            if item['options']:
+                print(f"Options: {' | '.join(item['options'])}")
+            if item['job_url']:
+                print(f"First seen on: {item['job_url']}")
+            answer = input("Answer: ").strip()
+            if answer.lower() == 'q':
+                break
+            if answer:
+                bank.add(item['question'], answer)
+    finally:
+        bank.close()
+
+def answer_manual_inputs(replay=True):
+    """Answer every field the pending manual-input tasks are waiting on in one sitting, then replay
+    the tasks whose fields all have answers. Identical fields across forms are asked once, and fields
+    the answer bank already knows are not asked at all."""
+    tasks = ManualInputQueue(MANUAL_INPUT_DB)
+    bank = AnswerBank(ANSWER_BANK_DB)
+    try:
+        pending = tasks.pending()
+        questions = {}  # question key -> [question, field descriptor, forms using it]
+        for task in pending:
+            for field in task['fields']:
+                question = field_question(field)
+                if bank.lookup(question) is None:
+                    questions.setdefault(normalize_question(question), [question, field, 0])[2] += 1
+        
+        print(f"{len(pending)} company-site forms wait for input; {len(questions)} distinct fields need an answer "
+              f"(Enter skips, 'q' stops)")
+        for question, field, uses in sorted(questions.values(), key=lambda item: item[2], reverse=True):
+            print(f"\nField ({field['type']}, on {uses} forms): {question}")
+            if field['options']:
+                print(f"Options: {' | '.join(field['options'])}")
+            answer = input("Answer: ").strip()
+            if answer.lower() == 'q':
+                break
+            if answer:
+                bank.add(question, answer)
+        
+        if replay:
+            replay_manual_inputs(tasks, bank)
+    finally:
+        tasks.close()
+        bank.close()
+
+def replay_manual_inputs(tasks, bank):
+    """Reopen each fully answered task's form and submit it through the normal company-site path"""
+    ready = [task for task in tasks.pending()
+             if all(bank.lookup(field_question(field)) is not None for field in task['fields'])]
+    print(f"\nReplaying {len(ready)} forms with answers for every field")
+    if not ready:
+        return
+    
+    bot = LinkedInJobBot(headless=WORKER_HEADLESS, answer_bank=bank, manual_inputs=tasks)
+    bot.interactive = False
+    try:
+        for task in ready:
+            try:
+                bot.load_page(task['site_url'], 'company_site')
+                bot.waits.until('page_ready')
+                bot.handle_cookies_popup()
+                success, reason = bot.complete_company_site_application(task['title'], task['company'], task['job_url'])
+            except Exception as e:
+                success, reason = False, str(e)
+            if not bot.unfilled_fields:
+                tasks.set_status(task['job_url'], 'applied' if success else 'failed')
+            print(f"{'Applied' if success else 'Not applied'}: {task['title']} at {task['company']} - {reason}")
+    finally:
+        bot.driver.quit()
+        bot.applied_store.close()
+        bot.form_plans.close()
+        bot.event_log.close()
+
+def benchmark_answer_lookup(count=20000, lookups=2000):
+    """Time exact, fuzzy and missing answer-bank lookups against count stored questions"""
+    rng = random.Random(42)
+    skills = ["python", "sql", "excel", "tableau", "power bi", "spark", "aws", "r", "java", "statistics",
+              "pandas", "airflow", "docker", "looker", "snowflake", "hadoop", "scala", "kafka", "dbt", "sas"]
+    templates = ["How many years of work experience do you have with {0} and {1} in project {2}?",
+                 "Have you used {0} for {1} reporting at client {2}?",
+                 "Rate your {0} skills for {1} team number {2}",
+                 "Are you comfortable working with {0} and {1} on shift {2}?"]
+    bank = AnswerBank(":memory:")
+    questions = []
+    for index in range(count):
+        question = rng.choice(templates).format(rng.choice(skills), rng.choice(skills), index)
+        questions.append(question)
+        bank.index(normalize_question(question), str(rng.randint(0, 10)))
+    
+    samples = {
+        'exact': [rng.choice(questions) for _ in range(lookups)],
+        'reworded': [rng.choice(questions).replace("How many", "how MANY").rstrip("?") + " please?" for _ in range(lookups)],
+        'fuzzy': [rng.choice(questions).rstrip("?") + " currently?" for _ in range(lookups)],
+        'miss': [f"Describe your favourite {rng.choice(skills)} library number {rng.randint(count, count * 2)}"
+                 for _ in range(lookups)]
+    }
+    results = {}
+    for label, queries in samples.items():
+        start = time.perf_counter()
+        hits = sum(1 for query in queries if bank.lookup(query) is not None)
+        elapsed = time.perf_counter() - start
+        results[label] = {'hits': hits, 'lookups': len(queries), 'avg_us': elapsed / len(queries) * 1e6}
+    bank.close()
+    
+    print_benchmark(f"Answer bank lookup benchmark ({count} stored questions)", results)
+    return results
+
+def benchmark_rate_governor(per_minute=240, actions=40, work=(0.05, 0.2), slow_every=5):
+    """Throughput of simulated actions taking `work` seconds each against a per_minute budget: fixed
+    pauses stacked after the work, the governor, and the governor with every slow_every-th response slow"""
+    interval = 60 / per_minute
+    
+    def simulate(governor=None, slow=False):
+        start = time.perf_counter()
+        backoffs = 0
+        for index in range(actions):
+            if governor:
+                governor.acquire('page_load')
+            seconds = random.uniform(*work)
+            time.sleep(seconds)
+            if governor:
+                backoffs += governor.report('page_load', seconds, error=slow and index % slow_every == slow_every - 1)
+            else:
+                time.sleep(random.uniform(interval * 0.8, interval * 1.2))  # The old random_delay pattern
+        elapsed = time.perf_counter() - start
+        return {'seconds': elapsed, 'per_min': actions / elapsed * 60,
+                'of_budget_pct': actions / elapsed * 60 / per_minute * 100, 'backoffs': backoffs}
+    
+    budgets = {'page_load': (per_minute, 1)}
+    results = {
+        'fixed-delay': simulate(),
+        'governor': simulate(RateGovernor(budgets)),
+        'governor-slow': simulate(RateGovernor(budgets), slow=True)
+    }
+    print_benchmark(f"Rate governor benchmark ({actions} actions, budget {per_minute}/min)", results)
+    return results
+
+def benchmark_browser_profile(rounds=5, fixture="linkedin_job.html"):
+    """Compare transfer size and load time of a job page with the full and lean browser profiles"""
+    results = {}
+    with FixtureServer() as server:
+        for label, lean in (("full", False), ("lean", True)):
+            bot = LinkedInJobBot(headless=True, lean=lean)
+            samples = []
+            try:
+                # Every round must hit the network, as a new job page would
+                bot.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+                for _ in range(rounds):
+                    start = time.perf_counter()
+                    bot.driver.get(server.url(fixture))
+                    bot.waits.until('job_page_loaded')
+                    stats = bot.driver.execute_script(PAGE_STATS_JS)
+                    stats['ready_ms'] = (time.perf_counter() - start) * 1000
+                    samples.append(stats)
+            finally:
+                bot.driver.quit()
+            results[label] = {
+                'avg_kb': sum(stats['transfer_bytes'] for stats in samples) / len(samples) / 1024,
+                'avg_load_ms': sum(stats['load_ms'] for stats in samples) / len(samples),
+                'avg_ready_ms': sum(stats['ready_ms'] for stats in samples) / len(samples)
+            }
+    
+    print_benchmark(f"Browser profile benchmark ({fixture}, {rounds} loads each)", results)
+    return results
+
+def benchmark_negative_lookups(pages=("linkedin_job.html", "company_form.html"), old_implicit_wait=10):
+    """Time the cookie-banner check and company-name extraction on fixture pages that have no cookie banner,
+    with the old lookups (implicit wait, one 5 s WebDriverWait per cookie selector) and the batched ones.
+    The old path is slow on purpose: up to 70 s of cookie waits per page plus the implicit wait per missing
+    company selector."""
+    bot = LinkedInJobBot(headless=True)
+    results = {}
+    try:
+        with FixtureServer() as server:
+            for page in pages:
+                bot.driver.get(server.url(page))
+                bot.waits.until('page_ready')
+                for label, batched, implicit_wait in (("old", False, old_implicit_wait), ("batched", True, 0)):
+                    bot.driver.implicitly_wait(implicit_wait)
+                    calls_before = bot.webdriver_calls
+                    start = time.perf_counter()
+                    bot.handle_cookies_popup(batched=batched)
+                    cookie_seconds = time.perf_counter() - start
+                    start = time.perf_counter()
+                    company = bot.extract_company_name(batched=batched)
+                    results[f"{page} {label}"] = {
+                        'cookie_s': cookie_seconds,
+                        'company_s': time.perf_counter() - start,
+                        'company': company,
+                        'round_trips': bot.webdriver_calls - calls_before
+                    }
+    finally:
+        bot.driver.quit()
+    
+    print_benchmark("Negative-path lookup benchmark (pages without a cookie banner)", results)
+    return results
+
+def load_span_events(path):
+    """Span events of one event log, grouped by phase"""
+    phases = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as log_file:
+            for line in log_file:
+                event = json.loads(line)
+                if event.get('event') == 'span':
+                    phases.setdefault(event['phase'], []).append(event)
+    return phases
+
+def compare_replay_results(result, path=REPLAY_RESULTS_FILE):
+    """Print the change against the last stored run with the same latency and catalogue size"""
+    previous = None
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as results_file:
+            for line in results_file:
+                stored = json.loads(line)
+                if stored['latency_ms'] == result['latency_ms'] and stored['jobs_listed'] == result['jobs_listed']:
+                    previous = stored
+    if not previous:
+        print("\nNo earlier replay run with these settings to compare against")
+        return None
+    
+    print(f"\nCompared with {previous['recorded_at']} ({previous.get('label') or 'unlabelled'})")
+    for key in ('jobs_per_minute', 'webdriver_calls_per_job', 'seconds', 'applied'):
+        print(f"  {key:<26}{previous[key]:>10} -> {result[key]:<10}")
+    for phase, stats in result['phases'].items():
+        before = previous['phases'].get(phase)
+        if before:
+            print(f"  {phase + ' p50 ms':<26}{before['p50_ms']:>10} -> {stats['p50_ms']:<10}")
+    return previous
+
+def benchmark_replay(latency_ms=REPLAY_LATENCY_MS, jobs=REPLAY_JOB_COUNT, keyword="data analyst", label=None):
+    """Search, crawl and apply end to end with the real bot methods against the replay server.
+    Reports jobs per minute, WebDriver calls per job and time per phase, stores the result in
+    REPLAY_RESULTS_FILE and compares it with the previous run. Pacing delays are skipped: they are
+    policy, not cost. History, answers, manual-input tasks, form plans and site profiles live in memory,
+    so real runs are never affected."""
+    with tempfile.TemporaryDirectory() as workdir:
+        resume_path = os.path.join(workdir, "resume.pdf")
+        with open(resume_path, "wb") as resume:
+            resume.write(b"%PDF-1.4\n% replay benchmark resume\n")
+        event_path = os.path.join(workdir, "events.jsonl")
+        event_log = EventLog(event_path)
+        answer_bank = AnswerBank(":memory:")
+        for question, answer in REPLAY_SCREENING_ANSWERS.items():
+            answer_bank.add(question, answer)
+        
+        bot = LinkedInJobBot(headless=True, applied_store=AppliedJobStore(":memory:"), answer_bank=answer_bank,
+                             event_log=event_log, manual_inputs=ManualInputQueue(":memory:"),
+                             form_plans=FormPlanStore(":memory:"), site_profiles=SiteProfileStore(":memory:"),
+                             resume_path=resume_path)
+        bot.random_delay = lambda *args, **kwargs: None
+        bot.governor = None
+        bot.interactive = False
+        try:
+            with FixtureServer(latency_ms=latency_ms, jobs=jobs) as server:
+                bot.base_url = server.url().rstrip("/")
+                calls_before = bot.webdriver_calls
+                start = time.perf_counter()
+                bot.search_jobs(keyword)
+                attempted, applied = bot.apply_to_jobs(keyword)
+                elapsed = time.perf_counter() - start
+                calls = bot.webdriver_calls - calls_before
+        finally:
+            bot.driver.quit()
+            event_log.close()
+            bot.applied_store.close()
+            bot.manual_inputs.close()
+            bot.form_plans.close()
+            answer_bank.close()
+        phases = load_span_events(event_path)
+    
+    result = {
+        'recorded_at': datetime.now().isoformat(timespec="seconds"),
+        'label': label,
+        'latency_ms': latency_ms,
+        'jobs_listed': jobs,
+        'attempted': attempted,
+        'applied': applied,
+        'seconds': round(elapsed, 2),
+        'jobs_per_minute': round(attempted / elapsed * 60, 2) if elapsed else 0.0,
+        'webdriver_calls_per_job': round(calls / max(attempted, 1), 1),
+        'phases': {phase: {'count': len(events),
+                           'p50_ms': percentile([event['duration_ms'] for event in events], 0.5),
+                           'total_ms': round(sum(event['duration_ms'] for event in events), 1),
+                           'calls': sum(event.get('webdriver_calls', 0) for event in events)}
+                   for phase, events in sorted(phases.items())}
+    }
+    
+    print_benchmark(f"Replay benchmark ({jobs} jobs listed, {latency_ms} ms latency): {attempted} attempted, "
+                    f"{applied} applied, {result['jobs_per_minute']} jobs/min, "
+                    f"{result['webdriver_calls_per_job']} WebDriver calls/job", result['phases'])
+    compare_replay_results(result)
+    with open(REPLAY_RESULTS_FILE, "a", encoding="utf-8") as results_file:
+        results_file.write(json.dumps(result) + "\n")
+    return result
+
+def prompt_credentials():
+    """Ask for the LinkedIn login and the resume path; importing the module never prompts"""
+    global USERNAME, PASSWORD, RESUME_PATH
+    USERNAME = input("Enter user mail:")
+    PASSWORD = input("Enter password:")
+    RESUME_PATH = input("Enter resume path:")
+    PERSONAL_INFO['email'] = USERNAME
 
 # Interactive setup function
 def setup_configuration():
@@ -1403,6 +4701,46 @@ def setup_configuration():
 
 # Run the bot
 if __name__ == "__main__":
+    if "--benchmark-listing" in sys.argv:
+        benchmark_listing_extraction()
+        sys.exit(0)
+    if "--benchmark-forms" in sys.argv:
+        benchmark_form_filling()
+        sys.exit(0)
+    if "--benchmark-answers" in sys.argv:
+        benchmark_answer_lookup()
+        sys.exit(0)
+    if "--benchmark-profile" in sys.argv:
+        benchmark_browser_profile()
+        sys.exit(0)
+    if "--benchmark-lookups" in sys.argv:
+        benchmark_negative_lookups()
+        sys.exit(0)
+    if "--benchmark-governor" in sys.argv:
+        # Optional budget in actions per minute
+        arguments = sys.argv[sys.argv.index("--benchmark-governor") + 1:]
+        benchmark_rate_governor(*(int(argument) for argument in arguments[:1]))
+        sys.exit(0)
+    if "--benchmark-replay" in sys.argv:
+        # Optional latency in milliseconds and a label stored with the result
+        arguments = sys.argv[sys.argv.index("--benchmark-replay") + 1:]
+        benchmark_replay(latency_ms=int(arguments[0]) if arguments else REPLAY_LATENCY_MS,
+                         label=arguments[1] if len(arguments) > 1 else None)
+        sys.exit(0)
+    if "--summarize-logs" in sys.argv:
+        # Optional glob after the flag selects which run logs to read
+        arguments = sys.argv[sys.argv.index("--summarize-logs") + 1:]
+        summarize_event_logs(*arguments[:1])
+        sys.exit(0)
+    if "--answer-manual-inputs" in sys.argv:
+        answer_manual_inputs()
+        sys.exit(0)
+    if "--review-questions" in sys.argv:
+        review_pending_questions()
+        sys.exit(0)
+    
+    prompt_credentials()
+    
     print(" Enhanced LinkedIn Job Bot - Data Roles Specialist")
     print("=" * 60)
     print(" Prioritizes: LinkedIn Easy Apply jobs for faster processing")
@@ -1439,4 +4777,4 @@ if __name__ == "__main__":
     
     bot = LinkedInJobBot()
 
-    bot.run()
+    bot.run(resume="--resume" in sys.argv[1:])
@@ -0,0 +1,496 @@
+"""Optional DevTools Protocol backend: Chrome driven over one asyncio websocket instead of chromedriver
+HTTP calls, with the bot's high-level job operations on each tab, and a throughput comparison against the
+Selenium backend on the replay server. The main run still uses Selenium (its answer bank, form plans and
+company-site flows work on WebElement references), so bot.py never imports this module.
+
+    python cdp_backend.py [latency_ms] [tabs]
+"""
+import asyncio
+import json
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+from bot import (APPLY_CONTROL_JS, COMPANY_NAME_SELECTORS, EASY_APPLY_MODAL_JS, JOB_CARD_SNAPSHOT_JS,
+                 JOB_SUMMARY_JS, LEAN_WINDOW_SIZE, LISTING_PAGE_SIZE, PAGE_STATE_CONDITIONS, PERSONAL_INFO,
+                 REPLAY_JOB_COUNT, REPLAY_LATENCY_MS, REPLAY_SCREENING_ANSWERS, SCROLL_JOB_LIST_JS, WAIT_MIN_POLL,
+                 WAIT_TIMEOUT, FixtureServer, LinkedInJobBot, print_benchmark)
+
+try:
+    import websockets
+except ImportError:  # Listed in environment.yml; without it only the Selenium half of the benchmark runs
+    websockets = None
+
+# Configuration
+CHROME_BINARY = None  # Chrome/Chromium executable for the CDP backend; None searches PATH
+CHROME_CANDIDATES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+CDP_TABS = 4  # Tabs the CDP backend drives concurrently in one browser process
+CDP_LAUNCH_TIMEOUT = 20  # Seconds to wait for Chrome to open its DevTools port
+
+# Resolve with a PAGE_STATE_CONDITIONS check's first truthy result, or false after arguments[1] ms.
+# The check reruns on every DOM mutation and every 100 ms (readyState changes are not mutations), so
+# the CDP backend waits inside the page instead of polling over the wire. /*CONDITION*/ is replaced.
+AWAIT_CONDITION_JS = """
+const [conditionArgs, timeoutMs] = arguments;
+const condition = function () { /*CONDITION*/ };
+return new Promise((resolve) => {
+    const check = () => {
+        try {
+            return condition.apply(null, conditionArgs);
+        } catch (e) {
+            return false;
+        }
+    };
+    let observer = null, timer = null, limit = null;
+    const finish = (value) => {
+        if (observer) observer.disconnect();
+        clearInterval(timer);
+        clearTimeout(limit);
+        resolve(value);
+    };
+    const first = check();
+    if (first) return finish(first);
+    const recheck = () => {
+        const result = check();
+        if (result) finish(result);
+    };
+    observer = new MutationObserver(recheck);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setInterval(recheck, 100);
+    limit = setTimeout(() => finish(false), timeoutMs);
+});
+"""
+
+# Click the job's Easy Apply control; returns "opened", or the kind of job when there is nothing to open
+OPEN_EASY_APPLY_JS = (
+    "const control = (function () {" + APPLY_CONTROL_JS + "})();\n"
+    "if (control.kind !== 'easy_apply' || !control.element) return control.kind;\n"
+    "control.element.click();\n"
+    "return 'opened';"
+)
+
+# Fill the open Easy Apply step's empty required fields and unchecked radio groups from the answers
+# planned on the Python side, click its primary button and resolve once the step has changed.
+# arguments[0]: answers keyed by lower-case label fragment, tried in order. Fields without an answer
+# are left empty, and a step with unanswered required fields is not sent (button null, nothing clicked).
+# Resolves {filled, unanswered, button, changed}; the step after a "Submit" button is the confirmation.
+FILL_STEP_JS = f"const modal = {EASY_APPLY_MODAL_JS};" + """
+const answers = arguments[0] || {};
+if (!modal) return {filled: 0, unanswered: 0, button: null, changed: false};
+const visible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const labelOf = (el) => {
+    const label = el.id ? modal.querySelector('label[for="' + CSS.escape(el.id) + '"]') : null;
+    const legend = el.closest("fieldset") ? el.closest("fieldset").querySelector("legend") : null;
+    return ((label || legend || {}).innerText || el.name || "").trim().toLowerCase();
+};
+const answerFor = (el) => {
+    const label = labelOf(el);
+    const key = Object.keys(answers).find((fragment) => label.includes(fragment));
+    return key ? String(answers[key]) : null;
+};
+const setValue = (el, value) => {
+    const proto = el.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+    el.dispatchEvent(new Event("input", {bubbles: true}));
+    el.dispatchEvent(new Event("change", {bubbles: true}));
+};
+let filled = 0, unanswered = 0;
+const radioGroups = new Set();
+for (const el of modal.querySelectorAll("input, select, textarea")) {
+    if (el.type === "radio") {
+        if (radioGroups.has(el.name)) continue;
+        radioGroups.add(el.name);
+        const group = Array.from(modal.querySelectorAll('input[type="radio"][name="' + CSS.escape(el.name) + '"]'));
+        if (group.some((radio) => radio.checked)) continue;
+        const answer = (answerFor(el) || "").toLowerCase();
+        const radio = answer && group.find((candidate) => candidate.value.toLowerCase() === answer);
+        if (radio) {
+            radio.click();
+            filled += 1;
+        } else if (group.some((candidate) => candidate.required)) {
+            unanswered += 1;
+        }
+    } else if (!el.required || !visible(el) || el.type === "file" || el.type === "checkbox") {
+        continue;
+    } else if (el.tagName === "SELECT") {
+        if (el.selectedIndex > 0) continue;
+        const answer = (answerFor(el) || "").toLowerCase();
+        const option = answer && Array.from(el.options).slice(1).find((o) => o.text.toLowerCase().includes(answer));
+        if (!option) {
+            unanswered += 1;
+            continue;
+        }
+        el.value = option.value;
+        el.dispatchEvent(new Event("change", {bubbles: true}));
+        filled += 1;
+    } else if (!el.value) {
+        const answer = answerFor(el);
+        if (answer === null) {
+            unanswered += 1;
+            continue;
+        }
+        setValue(el, answer);
+        filled += 1;
+    }
+}
+if (unanswered) return {filled: filled, unanswered: unanswered, button: null, changed: false};
+const button = Array.from(modal.querySelectorAll("footer button, button.artdeco-button--primary"))
+    .find((candidate) => visible(candidate) && !candidate.disabled);
+if (!button) return {filled: filled, unanswered: 0, button: null, changed: false};
+const buttonText = (button.innerText || button.getAttribute("aria-label") || "").trim();
+const before = modal.innerText;
+button.click();
+return new Promise((resolve) => {
+    const finish = (changed) => {
+        observer.disconnect();
+        clearTimeout(limit);
+        resolve({filled: filled, unanswered: 0, button: buttonText, changed: changed});
+    };
+    const observer = new MutationObserver(() => {
+        if (!modal.isConnected || modal.innerText !== before) finish(true);
+    });
+    observer.observe(modal, {childList: true, subtree: true, characterData: true});
+    const limit = setTimeout(() => finish(false), 10000);
+});
+"""
+
+class CDPConnection:
+    """One DevTools websocket shared by every tab. Commands carry the tab's sessionId (flattened target
+    sessions), so tabs are driven concurrently and commands can be pipelined without waiting in turn."""
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.next_id = 0
+        self.sent = 0
+        self.pending = {}  # command id -> future of its result
+        self.listeners = []
+        self.reader = asyncio.create_task(self.read())
+    
+    async def read(self):
+        try:
+            async for message in self.websocket:
+                data = json.loads(message)
+                if 'id' in data:
+                    future = self.pending.pop(data['id'], None)
+                    if future and not future.done():
+                        if 'error' in data:
+                            future.set_exception(Exception(f"CDP error: {data['error'].get('message')}"))
+                        else:
+                            future.set_result(data.get('result', {}))
+                else:
+                    for listener in list(self.listeners):
+                        listener(data)
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(Exception("DevTools connection closed"))
+            self.pending.clear()
+    
+    async def send(self, method, params=None, session_id=None):
+        self.next_id += 1
+        self.sent += 1
+        message = {'id': self.next_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message['id']] = future
+        try:
+            await self.websocket.send(json.dumps(message))
+            return await future
+        finally:
+            self.pending.pop(message['id'], None)
+    
+    def wait_event(self, method, session_id=None, predicate=None):
+        """Future of the next event's params; register it before the command that triggers the event.
+        The listener is removed as soon as the future is done, including when a timeout cancels it."""
+        future = asyncio.get_running_loop().create_future()
+        
+        def listener(data):
+            if not future.done() and data.get('method') == method and data.get('sessionId') == session_id and \
+                    (predicate is None or predicate(data.get('params', {}))):
+                future.set_result(data.get('params', {}))
+        self.listeners.append(listener)
+        future.add_done_callback(lambda _: self.listeners.remove(listener))
+        return future
+
+class CDPJobPage:
+    """One browser tab with the bot's high-level job operations (search, extract cards, open job,
+    start the application, fill a step) over the DevTools Protocol. Waits resolve inside the page on DOM
+    mutations or on Chrome's load / network-idle lifecycle events instead of polling."""
+    def __init__(self, connection, session_id, target_id):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+    
+    async def send(self, method, params=None):
+        return await self.connection.send(method, params, self.session_id)
+    
+    async def enable(self):
+        # Independent setup commands are pipelined: all are on the wire before the first reply
+        await asyncio.gather(self.send("Page.enable"), self.send("Page.setLifecycleEventsEnabled", {"enabled": True}))
+    
+    async def goto(self, url, until="load"):
+        """Navigate and wait for the load event, or for Chrome's networkIdle lifecycle event"""
+        navigation = {}
+        if until == "networkidle":
+            waiter = self.connection.wait_event(
+                "Page.lifecycleEvent", self.session_id,
+                lambda params: params.get('name') == 'networkIdle' and params.get('loaderId') == navigation.get('loaderId'))
+        else:
+            waiter = self.connection.wait_event("Page.loadEventFired", self.session_id)
+        navigation.update(await self.send("Page.navigate", {"url": url}))
+        await asyncio.wait_for(waiter, WAIT_TIMEOUT)
+    
+    async def evaluate(self, script, *args):
+        """Run a function-body script (the execute_script convention: `arguments`, `return`) and return its
+        JSON result; a returned promise is awaited"""
+        expression = f"(function () {{{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send("Runtime.evaluate", {"expression": expression, "returnByValue": True,
+                                                      "awaitPromise": True})
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            raise Exception(f"Script failed: {details.get('exception', {}).get('description') or details.get('text')}")
+        return result['result'].get('value')
+    
+    async def wait_for(self, state, *args, timeout=WAIT_TIMEOUT):
+        """Wait for a PAGE_STATE_CONDITIONS state; returns the truthy result, or False on timeout"""
+        script = AWAIT_CONDITION_JS.replace("/*CONDITION*/", PAGE_STATE_CONDITIONS[state])
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            try:
+                return await self.evaluate(script, list(args), int(remaining * 1000))
+            except Exception:
+                # A navigation replaced the document the wait was running in
+                await asyncio.sleep(WAIT_MIN_POLL)
+    
+    async def search(self, search_url):
+        await self.goto(search_url)
+        return await self.wait_for('listing_loaded')
+    
+    async def extract_cards(self, batch_timeout=1.5):
+        """Scroll the result list until no more cards load, then read every card in one script"""
+        while True:
+            link_count = await self.evaluate(SCROLL_JOB_LIST_JS)
+            if not await self.wait_for('more_cards_loaded', link_count, timeout=batch_timeout):
+                break
+        return await self.evaluate(JOB_CARD_SNAPSHOT_JS) or []
+    
+    async def open_job(self, job_url):
+        await self.goto(job_url)
+        await self.wait_for('job_page_loaded')
+        return await self.evaluate(JOB_SUMMARY_JS, COMPANY_NAME_SELECTORS)
+    
+    async def start_apply(self):
+        if await self.evaluate(OPEN_EASY_APPLY_JS) != "opened":
+            return False
+        return bool(await self.wait_for('modal_step_rendered'))
+    
+    async def fill_step(self, answers):
+        return await self.evaluate(FILL_STEP_JS, answers)
+    
+    async def close(self):
+        await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+
+class CDPBrowser:
+    """Chrome started with --remote-debugging-port and driven over the DevTools Protocol on asyncio,
+    without chromedriver. Needs the optional websockets package."""
+    def __init__(self, headless=True):
+        self.headless = headless
+        self.process = None
+        self.connection = None
+        self.profile_dir = None
+    
+    async def start(self):
+        if websockets is None:
+            raise Exception("The CDP backend needs the websockets package (pip install websockets)")
+        binary = CHROME_BINARY or next(filter(None, map(shutil.which, CHROME_CANDIDATES)), None)
+        if not binary:
+            raise Exception("No Chrome/Chromium executable found; set CHROME_BINARY")
+        self.profile_dir = tempfile.mkdtemp(prefix="cdp-profile-")
+        arguments = [binary, "--remote-debugging-port=0", f"--user-data-dir={self.profile_dir}", "--no-first-run",
+                     "--no-default-browser-check", "--no-sandbox", "--disable-gpu", "--disable-dev-shm-usage",
+                     "--disable-extensions", f"--window-size={LEAN_WINDOW_SIZE}", "about:blank"]
+        if self.headless:
+            arguments.insert(1, "--headless=new")
+        self.process = await asyncio.create_subprocess_exec(*arguments, stdout=asyncio.subprocess.DEVNULL,
+                                                            stderr=asyncio.subprocess.PIPE)
+        url = await asyncio.wait_for(self.devtools_url(), CDP_LAUNCH_TIMEOUT)
+        self.stderr_reader = asyncio.create_task(self.process.stderr.read())  # Keep the pipe from filling up
+        self.connection = CDPConnection(await websockets.connect(url, max_size=None))
+        return self
+    
+    async def devtools_url(self):
+        while True:
+            line = await self.process.stderr.readline()
+            if not line:
+                raise Exception("Chrome exited before opening its DevTools port")
+            match = re.search(rb"DevTools listening on (ws://\S+)", line)
+            if match:
+                return match.group(1).decode()
+    
+    async def new_page(self):
+        target = await self.connection.send("Target.createTarget", {"url": "about:blank"})
+        attached = await self.connection.send("Target.attachToTarget", {"targetId": target['targetId'], "flatten": True})
+        page = CDPJobPage(self.connection, attached['sessionId'], target['targetId'])
+        await page.enable()
+        return page
+    
+    async def close(self):
+        try:
+            if self.connection:
+                await asyncio.wait_for(self.connection.send("Browser.close"), 5)
+                await self.connection.websocket.close()
+        except Exception:
+            pass
+        finally:
+            if self.process and self.process.returncode is None:
+                self.process.kill()
+                await self.process.wait()
+            if self.profile_dir:
+                shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+class SeleniumJobPage:
+    """The CDPJobPage operations on a bot's classic WebDriver browser, with the same scripts, so the two
+    backends can be compared: every command here is a blocking chromedriver round-trip"""
+    def __init__(self, bot):
+        self.bot = bot
+        self.driver = bot.driver
+    
+    def search(self, search_url):
+        self.driver.get(search_url)
+        return self.bot.waits.until('listing_loaded')
+    
+    def extract_cards(self, batch_timeout=1.5):
+        while True:
+            link_count = self.driver.execute_script(SCROLL_JOB_LIST_JS)
+            if not self.bot.waits.until('more_cards_loaded', link_count, timeout=batch_timeout):
+                break
+        return self.driver.execute_script(JOB_CARD_SNAPSHOT_JS) or []
+    
+    def open_job(self, job_url):
+        self.driver.get(job_url)
+        self.bot.waits.until('job_page_loaded')
+        return self.driver.execute_script(JOB_SUMMARY_JS, COMPANY_NAME_SELECTORS)
+    
+    def start_apply(self):
+        if self.driver.execute_script(OPEN_EASY_APPLY_JS) != "opened":
+            return False
+        return bool(self.bot.waits.until('modal_step_rendered'))
+    
+    def fill_step(self, answers):
+        return self.driver.execute_script(FILL_STEP_JS, answers)
+
+def backend_answers():
+    """FILL_STEP_JS answers for the replay Easy Apply steps, most specific label fragment first"""
+    answers = {question.lower(): answer for question, answer in REPLAY_SCREENING_ANSWERS.items()}
+    answers.update({'phone country code': PERSONAL_INFO['country'], 'phone': PERSONAL_INFO['phone_number'],
+                    'first name': PERSONAL_INFO['first_name']})
+    return answers
+
+def backend_result(label, seconds, jobs, applied, commands, failed=0):
+    return {'seconds': seconds, 'jobs_per_min': jobs / seconds * 60 if seconds else 0.0, 'jobs': jobs,
+            'applied': applied, 'failed': failed, 'commands': commands,
+            'commands_per_job': commands / jobs if jobs else 0.0}
+
+def selenium_backend_run(search_urls, answers):
+    """Search, extract, open every job and apply to the Easy Apply ones on one Selenium browser"""
+    bot = LinkedInJobBot(headless=True)
+    bot.governor = None
+    page = SeleniumJobPage(bot)
+    try:
+        calls_before = bot.webdriver_calls
+        start = time.perf_counter()
+        job_urls = []
+        for search_url in search_urls:
+            page.search(search_url)
+            job_urls.extend(card['url'] for card in page.extract_cards())
+        applied = failed = 0
+        for job_url in job_urls:
+            try:
+                summary = page.open_job(job_url)
+                if summary['kind'] == 'easy_apply' and page.start_apply():
+                    for _ in range(8):
+                        step = page.fill_step(answers)
+                        if not step['changed'] or 'submit' in (step['button'] or '').lower():
+                            applied += bool(step['changed'])
+                            break
+            except Exception as e:
+                print(f"Selenium backend: {job_url} failed: {e}")
+                failed += 1
+        return backend_result("selenium", time.perf_counter() - start, len(job_urls), applied,
+                              bot.webdriver_calls - calls_before, failed)
+    finally:
+        bot.driver.quit()
+
+async def apply_on_pages(pages, job_urls, answers):
+    """Open every job and walk its Easy Apply steps, with the jobs spread over the CDP tabs in `pages`.
+    A job that fails or times out is counted and skipped; it must not abort the gather and the other
+    tabs' jobs. Returns (applied, failed)."""
+    jobs = asyncio.Queue()
+    for job_url in job_urls:
+        jobs.put_nowait(job_url)
+    applied = failed = 0
+    
+    async def work(page):
+        nonlocal applied, failed
+        while not jobs.empty():
+            job_url = jobs.get_nowait()
+            try:
+                summary = await page.open_job(job_url)
+                if summary['kind'] == 'easy_apply' and await page.start_apply():
+                    for _ in range(8):
+                        step = await page.fill_step(answers)
+                        if not step['changed'] or 'submit' in (step['button'] or '').lower():
+                            applied += bool(step['changed'])
+                            break
+            except Exception as e:
+                print(f"CDP backend: {job_url} failed: {e!r}")
+                failed += 1
+    
+    await asyncio.gather(*(work(page) for page in pages))
+    return applied, failed
+
+async def cdp_backend_run(search_urls, answers, tabs=1):
+    """The selenium_backend_run workload on one CDP browser, with jobs spread over `tabs` concurrent tabs"""
+    browser = await CDPBrowser().start()
+    try:
+        start = time.perf_counter()
+        pages = await asyncio.gather(*(browser.new_page() for _ in range(tabs)))
+        job_urls = []
+        for search_url in search_urls:
+            await pages[0].search(search_url)
+            job_urls.extend(card['url'] for card in await pages[0].extract_cards())
+        applied, failed = await apply_on_pages(pages, job_urls, answers)
+        return backend_result("cdp", time.perf_counter() - start, len(job_urls), applied, browser.connection.sent, failed)
+    finally:
+        await browser.close()
+
+def benchmark_driver_backends(latency_ms=REPLAY_LATENCY_MS, jobs=REPLAY_JOB_COUNT, tabs=CDP_TABS, keyword="data analyst"):
+    """Throughput of the same workload (search, extract cards, open every job, walk the Easy Apply steps)
+    on the replay server with the Selenium backend, the CDP backend on one tab, and the CDP backend on
+    `tabs` concurrent tabs of one browser. commands counts chromedriver calls or DevTools messages."""
+    answers = backend_answers()
+    results = {}
+    with FixtureServer(latency_ms=latency_ms, jobs=jobs) as server:
+        base_url = server.url().rstrip("/")
+        search_urls = [f"{base_url}/jobs/search/?keywords={keyword.replace(' ', '%20')}&start={start}"
+                       for start in range(0, jobs, LISTING_PAGE_SIZE)]
+        results['selenium'] = selenium_backend_run(search_urls, answers)
+        if websockets is None:
+            print("CDP backend skipped: pip install websockets")
+        else:
+            results['cdp-1-tab'] = asyncio.run(cdp_backend_run(search_urls, answers, tabs=1))
+            results[f'cdp-{tabs}-tabs'] = asyncio.run(cdp_backend_run(search_urls, answers, tabs=tabs))
+    
+    print_benchmark(f"Driver backend benchmark ({jobs} jobs, {latency_ms} ms latency)", results)
+    return results
+
+if __name__ == "__main__":
+    # Optional latency in milliseconds and number of CDP tabs
+    arguments = sys.argv[1:]
+    benchmark_driver_backends(latency_ms=int(arguments[0]) if arguments else REPLAY_LATENCY_MS,
+                              tabs=int(arguments[1]) if len(arguments) > 1 else CDP_TABS)
@@ -0,0 +1,10 @@
+// Shared behaviour of the consent fixtures: accept and reject controls record the choice on <body>
+// and hide the banner, so a check can tell which control the bot clicked.
+document.addEventListener("click", (event) => {
+  const control = event.target.closest("[data-consent]");
+  if (!control) return;
+  event.preventDefault();
+  document.body.dataset.consent = control.dataset.consent;
+  const banner = document.querySelector("[data-consent-banner]");
+  if (banner) banner.style.display = "none";
+});
@@ -0,0 +1,109 @@
+// Client-side behaviour of the replay fixtures: lazy listing batches, the multi-step Easy Apply modal
+// and the company-site popup. Every transition first fetches /_replay/ping, so it pays the server latency.
+(function () {
+  const CARDS_PER_BATCH = 10;
+  const ping = (what) => fetch("/_replay/ping?" + what, { cache: "no-store" });
+
+  // Listing page: reveal the next batch of cards when the result list is scrolled to the bottom
+  const list = document.querySelector(".jobs-search-results-list");
+  const moreCards = document.getElementById("replay-more-cards");
+  if (list && moreCards) {
+    let loading = false;
+    list.addEventListener("scroll", () => {
+      const atBottom = list.scrollTop + list.clientHeight >= list.scrollHeight - 20;
+      if (!atBottom || loading || !moreCards.content.children.length) return;
+      loading = true;
+      ping("cards").then(() => {
+        const container = list.querySelector("ul");
+        for (let i = 0; i < CARDS_PER_BATCH && moreCards.content.children.length; i++) {
+          container.appendChild(moreCards.content.children[0]);
+        }
+        loading = false;
+      });
+    });
+  }
+
+  const jobId = document.body.dataset.jobId;
+  const company = (document.querySelector(".job-details-jobs-unified-top-card__company-name") || {}).innerText || "";
+
+  const nextButton = (text, ariaLabel) =>
+    '<footer><button class="artdeco-button artdeco-button--2 artdeco-button--primary" type="button" ' +
+    'aria-label="' + ariaLabel + '" data-replay-next><span class="artdeco-button__text">' + text + "</span></button></footer>";
+
+  const steps = [
+    '<h3>Contact info</h3>' +
+    '<label for="replay-first-name">First name</label>' +
+    '<input type="text" id="replay-first-name" name="firstName" value="Replay" required>' +
+    '<label for="replay-phone-country">Phone country code</label>' +
+    '<select id="replay-phone-country" name="phoneCountryCode" required>' +
+    '<option>Select an option</option><option>United States (+1)</option><option>India (+91)</option></select>' +
+    '<label for="replay-phone">Mobile phone number</label>' +
+    '<input type="text" id="replay-phone" name="phoneNumber" required>' +
+    nextButton("Next", "Continue to next step"),
+
+    '<h3>Resume</h3>' +
+    '<label for="replay-resume">Upload resume</label>' +
+    '<input type="file" id="replay-resume" name="resume">' +
+    '<div class="replay-upload-status"></div>' +
+    nextButton("Next", "Continue to next step"),
+
+    '<h3>Additional questions</h3>' +
+    '<label for="replay-years">How many years of work experience do you have with Python?</label>' +
+    '<input type="text" id="replay-years" name="yearsPython" required>' +
+    '<label for="replay-authorized">Are you legally authorized to work in India?</label>' +
+    '<select id="replay-authorized" name="authorized" required>' +
+    '<option>Select an option</option><option>Yes</option><option>No</option></select>' +
+    '<fieldset><legend>Will you now or in the future require sponsorship for employment visa status?</legend>' +
+    '<label><input type="radio" name="sponsorship" value="Yes"> Yes</label>' +
+    '<label><input type="radio" name="sponsorship" value="No"> No</label></fieldset>' +
+    nextButton("Review", "Review your application"),
+
+    '<h3>Review your application</h3>' +
+    '<p>The employer will also receive a copy of your profile.</p>' +
+    '<label><input type="checkbox" name="followCompany"> Follow ' + company + ' to stay up to date with their page.</label>' +
+    nextButton("Submit application", "Submit application")
+  ];
+
+  const openModal = () => {
+    const modal = document.createElement("div");
+    modal.className = "jobs-easy-apply-modal artdeco-modal";
+    modal.setAttribute("role", "dialog");
+    document.body.appendChild(modal);
+    let step = 0;
+    const render = () => {
+      modal.innerHTML = '<h2>Apply to ' + company + '</h2><form class="jobs-easy-apply-content">' + steps[step] + "</form>";
+    };
+    modal.addEventListener("click", (event) => {
+      const button = event.target.closest("[data-replay-next]");
+      if (!button) return;
+      button.disabled = true;
+      ping("step=" + step).then(() => {
+        step += 1;
+        if (step < steps.length) {
+          render();
+        } else {
+          modal.innerHTML = "<h2>Application sent</h2><p>Your application was sent to " + company + "!</p>";
+        }
+      });
+    });
+    modal.addEventListener("change", (event) => {
+      if (event.target.type !== "file") return;
+      const status = modal.querySelector(".replay-upload-status");
+      status.innerHTML = '<div role="progressbar" class="artdeco-loader">Uploading...</div>';
+      ping("upload").then(() => {
+        status.textContent = event.target.files[0].name + " uploaded";
+      });
+    });
+    ping("modal").then(render);
+  };
+
+  document.addEventListener("click", (event) => {
+    const control = event.target.closest("[data-replay-apply]");
+    if (!control) return;
+    if (control.dataset.replayApply === "easy") {
+      openModal();
+    } else {
+      window.open("/careers/" + jobId + "/apply", "_blank");
+    }
+  });
+})();
@@ -0,0 +1,65 @@
+"""Shared test fixtures: the local fixture server and a headless bot whose stores all live in memory.
+Tests that need a browser are skipped when Chrome cannot be started."""
+import os
+
+import pytest
+
+import bot
+
+@pytest.fixture(scope="session", autouse=True)
+def run_directory(tmp_path_factory):
+    """Run from an empty directory, so event logs, driver caches and databases never land in the checkout"""
+    previous = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("run"))
+    yield
+    os.chdir(previous)
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    with bot.FixtureServer() as server:
+        yield server
+
+def make_bot(**overrides):
+    """A headless LinkedInJobBot with in-memory stores and no pacing"""
+    stores = {
+        'applied_store': bot.AppliedJobStore(":memory:"),
+        'answer_bank': bot.AnswerBank(":memory:"),
+        'manual_inputs': bot.ManualInputQueue(":memory:"),
+        'form_plans': bot.FormPlanStore(":memory:"),
+        'site_profiles': bot.SiteProfileStore(":memory:"),
+        'event_log': bot.EventLog(enabled=False)
+    }
+    stores.update(overrides)
+    try:
+        job_bot = bot.LinkedInJobBot(headless=True, **stores)
+    except Exception as e:
+        pytest.skip(f"Chrome is not available: {e}")
+    job_bot.governor = None
+    job_bot.random_delay = lambda *args, **kwargs: None
+    job_bot.interactive = False
+    return job_bot
+
+def close_bot(job_bot):
+    job_bot.driver.quit()
+    for store in (job_bot.applied_store, job_bot.answer_bank, job_bot.manual_inputs, job_bot.form_plans,
+                  job_bot.site_profiles, job_bot.event_log):
+        store.close()
+
+@pytest.fixture(scope="module")
+def job_bot():
+    job_bot = make_bot()
+    yield job_bot
+    close_bot(job_bot)
+
+@pytest.fixture
+def new_bot():
+    """Factory for bots a test sets up itself; they are closed when the test ends"""
+    bots = []
+    
+    def factory(**overrides):
+        bots.append(make_bot(**overrides))
+        return bots[-1]
+    
+    yield factory
+    for job_bot in bots:
+        close_bot(job_bot)
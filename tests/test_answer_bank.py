@@ -0,0 +1,40 @@
+"""AnswerBank option matching: a stored answer picks an option only when it names exactly one"""
+import pytest
+
+import bot
+
+EXPERIENCE = ["Select an option", "Less than 1 year", "1-2 years", "3-5 years", "6-9 years", "10+ years"]
+NOTICE = ["Immediately", "Up to 30 days", "More than 30 days"]
+YES_NO = ["Yes", "No", "Not sure"]
+
+@pytest.mark.parametrize("answer, options, expected", [
+    ("1", EXPERIENCE, "1-2 years"),
+    ("0", EXPERIENCE, "Less than 1 year"),
+    ("4 years", EXPERIENCE, "3-5 years"),
+    ("12", EXPERIENCE, "10+ years"),
+    ("30", NOTICE, "Up to 30 days"),
+    ("45", NOTICE, "More than 30 days"),
+    ("no", YES_NO, "No"),
+    ("NO", YES_NO, "No"),
+    ("India", ["United States (+1)", "India (+91)"], "India (+91)"),
+])
+def test_answer_names_one_option(answer, options, expected):
+    assert bot.match_option(answer, options) == expected
+
+@pytest.mark.parametrize("answer, options", [
+    ("7", ["1-3 years", "5+ years", "More than 6 years"]),  # Two ranges hold 7
+    ("15", ["1-3 years", "4-6 years"]),  # No range holds 15
+    ("maybe", YES_NO),
+    ("yes", ["Yes, I have a visa", "Yes, but I need sponsorship"]),
+    ("1", ["10", "100"]),
+])
+def test_ambiguous_or_missing_match_is_none(answer, options):
+    assert bot.match_option(answer, options) is None
+
+def test_lookup_maps_the_stored_answer_to_an_option():
+    bank = bot.AnswerBank(":memory:")
+    bank.add("How many years of experience do you have with SQL?", "1")
+    bank.add("Do you require sponsorship?", "no")
+    
+    assert bank.lookup("How many years of experience do you have with SQL?", EXPERIENCE) == "1-2 years"
+    assert bank.lookup("Do you require sponsorship?", ["Yes", "Not sure"]) is None
@@ -0,0 +1,43 @@
+"""APPLY_CONTROL_JS against the saved job pages and every kind of the replay catalogue"""
+import glob
+import os
+
+import pytest
+
+import bot
+
+# Expected apply-control kind of every fixtures/linkedin_job*.html page
+JOB_PAGE_KINDS = {
+    "linkedin_job.html": "easy_apply",
+    "linkedin_job_closed.html": "closed"
+}
+JOB_PAGES = sorted(os.path.basename(path) for path in glob.glob(os.path.join(bot.FIXTURES_DIR, "linkedin_job*.html")))
+REPLAY_KINDS = ["easy_apply", "company_site", "applied", "closed"]
+
+def open_job_page(job_bot, server, page):
+    job_bot.driver.get(server.url(page))
+    job_bot.waits.until('job_page_loaded')
+
+def test_every_job_page_has_an_expected_kind():
+    assert JOB_PAGES == sorted(JOB_PAGE_KINDS)
+
+@pytest.mark.parametrize("page", JOB_PAGES)
+def test_job_page_fixture(job_bot, fixture_server, page):
+    open_job_page(job_bot, fixture_server, page)
+    control = job_bot.classify_apply_button()
+    assert control['kind'] == JOB_PAGE_KINDS[page]
+
+@pytest.mark.parametrize("kind", REPLAY_KINDS)
+def test_replay_job_page(job_bot, fixture_server, kind):
+    job = bot.replay_job(bot.REPLAY_JOB_MIX.index(kind))
+    open_job_page(job_bot, fixture_server, f"jobs/view/{job['job_id']}/")
+    control = job_bot.classify_apply_button()
+    assert control['kind'] == kind
+    # Only the two apply paths have something to click
+    assert (control['element'] is not None) == (kind in ("easy_apply", "company_site"))
+
+def test_classification_is_one_round_trip(job_bot, fixture_server):
+    open_job_page(job_bot, fixture_server, "linkedin_job.html")
+    with bot.count_webdriver_calls(job_bot.driver) as counts:
+        job_bot.classify_apply_button()
+    assert sum(counts.values()) == 1
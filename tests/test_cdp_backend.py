@@ -0,0 +1,35 @@
+"""FILL_STEP_JS on the replay Easy Apply modal: only supplied answers are filled"""
+import pytest
+
+import bot
+from cdp_backend import SeleniumJobPage, backend_answers
+
+@pytest.fixture(scope="module")
+def replay_server():
+    with bot.FixtureServer(jobs=len(bot.REPLAY_JOB_MIX)) as server:
+        yield server
+
+@pytest.fixture
+def contact_step(new_bot, replay_server):
+    page = SeleniumJobPage(new_bot())
+    job = bot.replay_job(bot.REPLAY_JOB_MIX.index("easy_apply"))
+    summary = page.open_job(replay_server.url(f"jobs/view/{job['job_id']}/"))
+    assert summary['kind'] == 'easy_apply'
+    assert page.start_apply()
+    return page
+
+def test_step_without_answers_is_left_empty(contact_step):
+    step = contact_step.fill_step({})
+    
+    assert step == {'filled': 0, 'unanswered': 2, 'button': None, 'changed': False}
+    values = contact_step.driver.execute_script(
+        "return [document.getElementById('replay-phone-country').selectedIndex,"
+        " document.getElementById('replay-phone').value];")
+    assert values == [0, ""]
+
+def test_step_with_answers_moves_on(contact_step):
+    step = contact_step.fill_step(backend_answers())
+    
+    assert step['filled'] == 2
+    assert step['unanswered'] == 0
+    assert step['changed'] is True
@@ -0,0 +1,114 @@
+"""CDPConnection on a fake DevTools socket: replies matched by id, event listeners cleaned up, errors raised
+to the caller; and one job timing out in a CDP tab does not abort the others"""
+import asyncio
+import json
+
+import pytest
+
+from cdp_backend import CDPConnection, apply_on_pages
+
+class FakeSocket:
+    """Async-iterable websocket: sent messages are recorded, messages pushed by the test are received"""
+    def __init__(self):
+        self.sent = []
+        self.incoming = asyncio.Queue()
+    
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+    
+    def push(self, data):
+        self.incoming.put_nowait(json.dumps(data))
+    
+    def disconnect(self):
+        self.incoming.put_nowait(None)
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+async def sent_commands(socket, count):
+    while len(socket.sent) < count:
+        await asyncio.sleep(0)
+    return socket.sent
+
+def test_replies_resolve_their_own_command():
+    async def scenario():
+        socket = FakeSocket()
+        connection = CDPConnection(socket)
+        first = asyncio.ensure_future(connection.send("Page.navigate", {"url": "about:blank"}, "session-1"))
+        second = asyncio.ensure_future(connection.send("Runtime.evaluate"))
+        commands = await sent_commands(socket, 2)
+        
+        socket.push({'id': commands[1]['id'], 'result': {'value': 2}})
+        socket.push({'id': commands[0]['id'], 'result': {'frameId': "F1"}})
+        results = await asyncio.gather(first, second)
+        
+        assert commands[0]['sessionId'] == "session-1"
+        assert 'sessionId' not in commands[1]
+        assert results == [{'frameId': "F1"}, {'value': 2}]
+        assert connection.pending == {}
+        socket.disconnect()
+    
+    asyncio.run(scenario())
+
+def test_command_errors_and_closed_connection_are_raised():
+    async def scenario():
+        socket = FakeSocket()
+        connection = CDPConnection(socket)
+        failing = asyncio.ensure_future(connection.send("Page.navigate", {"url": "bad"}))
+        waiting = asyncio.ensure_future(connection.send("Page.enable"))
+        commands = await sent_commands(socket, 2)
+        
+        socket.push({'id': commands[0]['id'], 'error': {'code': -32000, 'message': "Cannot navigate to invalid URL"}})
+        with pytest.raises(Exception, match="CDP error: Cannot navigate to invalid URL"):
+            await failing
+        socket.disconnect()
+        with pytest.raises(Exception, match="DevTools connection closed"):
+            await waiting
+        assert connection.pending == {}
+    
+    asyncio.run(scenario())
+
+def test_event_listeners_are_removed_when_resolved_or_timed_out():
+    async def scenario():
+        socket = FakeSocket()
+        connection = CDPConnection(socket)
+        loaded = connection.wait_event("Page.loadEventFired", "session-1")
+        idle = connection.wait_event("Page.lifecycleEvent", "session-1", lambda params: params['name'] == "networkIdle")
+        
+        socket.push({'method': "Page.loadEventFired", 'sessionId': "session-2", 'params': {}})
+        socket.push({'method': "Page.lifecycleEvent", 'sessionId': "session-1", 'params': {'name': "load"}})
+        socket.push({'method': "Page.loadEventFired", 'sessionId': "session-1", 'params': {'timestamp': 1.5}})
+        assert await loaded == {'timestamp': 1.5}
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(idle, 0.05)
+        await asyncio.sleep(0)
+        
+        assert connection.listeners == []
+        socket.disconnect()
+    
+    asyncio.run(scenario())
+
+class FakePage:
+    """CDPJobPage stand-in: job urls containing "slow" time out like a tab whose load event never fires"""
+    async def open_job(self, job_url):
+        await asyncio.sleep(0)
+        if "slow" in job_url:
+            raise asyncio.TimeoutError()
+        return {'kind': 'easy_apply'}
+    
+    async def start_apply(self):
+        return True
+    
+    async def fill_step(self, answers):
+        return {'filled': 1, 'unanswered': 0, 'button': "Submit application", 'changed': True}
+
+def test_timed_out_job_does_not_abort_the_other_tabs():
+    job_urls = ["jobs/view/1/", "jobs/view/slow/", "jobs/view/3/", "jobs/view/4/"]
+    applied, failed = asyncio.run(apply_on_pages([FakePage(), FakePage()], job_urls, {}))
+    assert (applied, failed) == (3, 1)
@@ -0,0 +1,48 @@
+"""CONSENT_JS against the consent fixtures: each fixtures/consent/<handler>.html page carries the banner
+of the framework its name gives, and clicking its accept control sets body[data-consent] to "accepted"."""
+import glob
+import os
+from urllib.parse import urlsplit
+
+import pytest
+
+import bot
+
+CONSENT_PAGES = sorted(os.path.basename(path) for path in glob.glob(os.path.join(bot.FIXTURES_DIR, "consent", "*.html")))
+
+@pytest.fixture
+def consent_bot(job_bot):
+    """The module's bot with an empty site profile store, so no handler is known for the fixture domain"""
+    shared = job_bot.site_profiles
+    job_bot.site_profiles = bot.SiteProfileStore(":memory:")
+    yield job_bot
+    job_bot.site_profiles.close()
+    job_bot.site_profiles = shared
+
+def visit(job_bot, server, page):
+    """Load the page, dismiss its banner and return (dismissed, body[data-consent])"""
+    job_bot.driver.get(server.url(page))
+    job_bot.waits.until('page_ready')
+    dismissed = job_bot.handle_cookies_popup(batched=True)
+    return dismissed, job_bot.driver.execute_script("return document.body.dataset.consent || null;")
+
+def test_every_framework_has_a_handler():
+    handlers = {page[:-len(".html")] for page in CONSENT_PAGES}
+    assert handlers == {"onetrust", "cookiebot", "trustarc", "generic"}
+
+@pytest.mark.parametrize("page", CONSENT_PAGES)
+def test_banner_is_dismissed_and_handler_learned(consent_bot, fixture_server, page):
+    handler = page[:-len(".html")]
+    domain = urlsplit(fixture_server.url()).netloc
+    # First visit scans every handler
+    assert visit(consent_bot, fixture_server, f"consent/{page}") == (True, "accepted")
+    assert consent_bot.site_profiles.consent_handler(domain) == handler
+    # The repeat visit goes straight to the learned handler and must still accept
+    assert visit(consent_bot, fixture_server, f"consent/{page}") == (True, "accepted")
+    assert consent_bot.site_profiles.consent_handler(domain) == handler
+
+def test_page_without_banner(consent_bot, fixture_server):
+    domain = urlsplit(fixture_server.url()).netloc
+    assert visit(consent_bot, fixture_server, "company_form.html") == (False, None)
+    assert consent_bot.site_profiles.consent_handler(domain) is None
+    assert consent_bot.site_profiles.profile(domain)['cookie_banner'] == 0
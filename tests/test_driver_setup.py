@@ -0,0 +1,68 @@
+"""setup_driver with a chromedriver path cached by an earlier run that no longer matches Chrome"""
+import os
+
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+
+import bot
+
+class FakeDriver:
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+    
+    def execute_script(self, script, *args):
+        return None
+    
+    def implicitly_wait(self, seconds):
+        pass
+
+@pytest.fixture
+def drivers(monkeypatch, tmp_path):
+    """Paths of a stale cached driver and of the one ChromeDriverManager resolves; records every start"""
+    stale, fresh = tmp_path / "chromedriver-119", tmp_path / "chromedriver-120"
+    stale.write_text("")
+    fresh.write_text("")
+    started = []
+    
+    def chrome(service, options):
+        started.append(service.path)
+        if service.path == str(stale):
+            raise SessionNotCreatedException("This version of ChromeDriver only supports Chrome version 119")
+        return FakeDriver()
+    
+    monkeypatch.setattr(bot.webdriver, "Chrome", chrome)
+    monkeypatch.setattr(bot, "ChromeDriverManager", lambda: type("Manager", (), {"install": lambda self: str(fresh)})())
+    monkeypatch.setattr(bot, "CHROMEDRIVER_PATH", "")
+    monkeypatch.setattr(bot, "WARM_START", True)
+    yield str(stale), str(fresh), started
+    if os.path.exists(bot.DRIVER_CACHE_FILE):
+        os.remove(bot.DRIVER_CACHE_FILE)
+
+def bare_bot():
+    """A LinkedInJobBot with only what setup_driver needs"""
+    job_bot = bot.LinkedInJobBot.__new__(bot.LinkedInJobBot)
+    job_bot.log_prefix = ""
+    job_bot.profiler = None
+    job_bot.webdriver_calls = 0
+    return job_bot
+
+def test_stale_cached_driver_is_replaced_once(drivers):
+    stale, fresh, started = drivers
+    with open(bot.DRIVER_CACHE_FILE, "w") as cache:
+        cache.write(stale)
+    
+    job_bot = bare_bot()
+    job_bot.setup_driver(headless=True)
+    
+    assert started == [stale, fresh]
+    assert isinstance(job_bot.driver, FakeDriver)
+    with open(bot.DRIVER_CACHE_FILE) as cache:
+        assert cache.read() == fresh
+
+def test_freshly_resolved_driver_is_not_retried(drivers, monkeypatch):
+    stale, fresh, started = drivers
+    monkeypatch.setattr(bot, "ChromeDriverManager", lambda: type("Manager", (), {"install": lambda self: stale})())
+    
+    with pytest.raises(SessionNotCreatedException):
+        bare_bot().setup_driver(headless=True)
+    assert started == [stale]
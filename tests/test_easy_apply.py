@@ -0,0 +1,41 @@
+"""Easy Apply on the replay modal: only a confirmed submission counts as applied"""
+import pytest
+
+import bot
+
+@pytest.fixture(scope="module")
+def replay_server():
+    with bot.FixtureServer(jobs=len(bot.REPLAY_JOB_MIX)) as server:
+        yield server
+
+@pytest.fixture
+def replay_bot(new_bot, replay_server, tmp_path):
+    resume_path = tmp_path / "resume.pdf"
+    resume_path.write_bytes(b"%PDF-1.4\n% easy apply test resume\n")
+    job_bot = new_bot(resume_path=str(resume_path))
+    job_bot.base_url = replay_server.url().rstrip("/")
+    return job_bot
+
+def apply_to_replay_job(job_bot, server):
+    job = bot.replay_job(bot.REPLAY_JOB_MIX.index("easy_apply"))
+    return job_bot.apply_to_single_job(server.url(f"jobs/view/{job['job_id']}/"), job['title'])
+
+def test_unanswered_questions_are_not_recorded_as_applied(replay_bot, replay_server):
+    success, reason = apply_to_replay_job(replay_bot, replay_server)
+    
+    assert success is False
+    assert reason.startswith("Needs review")
+    assert replay_bot.applied_store.count() == 0
+    assert not replay_bot.applied_jobs
+    queued = {item['question'] for item in replay_bot.answer_bank.pending()}
+    assert "How many years of work experience do you have with Python?" in queued
+
+def test_answered_application_is_recorded(replay_bot, replay_server):
+    for question, answer in bot.REPLAY_SCREENING_ANSWERS.items():
+        replay_bot.answer_bank.add(question, answer)
+    
+    success, reason = apply_to_replay_job(replay_bot, replay_server)
+    
+    assert success is True, reason
+    assert replay_bot.applied_store.count() == 1
+    assert replay_bot.applied_jobs[0]['application_type'] == 'easy_apply'
@@ -0,0 +1,50 @@
+"""FIELD_RULES matching: whole tokens only, name and id before label text, questions left alone"""
+import pytest
+
+import bot
+
+def field(name="", id="", placeholder="", aria_label="", label="", tag="input"):
+    return {'name': name, 'id': id, 'placeholder': placeholder, 'aria_label': aria_label, 'label': label, 'tag': tag}
+
+def rule_name(descriptor):
+    rule = bot.FieldMatcher(bot.FIELD_RULES).match_field(descriptor)
+    return rule[0] if rule else None
+
+@pytest.mark.parametrize("descriptor, expected", [
+    (field(name="job_application[first_name]"), "first_name"),
+    (field(id="firstName"), "first_name"),
+    (field(name="phoneNumber"), "phone_number"),
+    (field(name="job_application[phone_country_code]"), "phone_country"),
+    (field(name="emailAddress"), "email"),
+    (field(name="zipcode"), "postal_code"),
+    (field(name="q_17", label="Postal code"), "postal_code"),
+    (field(name="q_18", label="Years of experience"), "experience_years"),
+    (field(name="q_19", label="Current company"), "current_company"),
+    (field(name="q_20", label="City *"), "city"),
+])
+def test_contact_fields(descriptor, expected):
+    assert rule_name(descriptor) == expected
+
+@pytest.mark.parametrize("descriptor", [
+    field(name="q_1", label="Are you open to relocation?"),
+    field(name="cover_letter_statement"),
+    field(name="q_2", label="Tell us about your experience"),
+    field(name="q_3", label="How did you hear about our company?"),
+    field(name="statement"),
+])
+def test_questions_and_partial_words_do_not_match(descriptor):
+    assert rule_name(descriptor) is None
+
+def test_name_wins_over_label_text():
+    # The label mentions a city, but the name says what the field is
+    assert rule_name(field(name="postal_code", label="City / Postal code")) == "postal_code"
+
+def test_inventory_fill_leaves_textareas_alone(job_bot, fixture_server):
+    job_bot.driver.get(fixture_server.url("company_form.html"))
+    job_bot.waits.until('page_ready')
+    assert job_bot.fill_fields_from_inventory() > 0
+    values = job_bot.driver.execute_script(
+        "return Object.fromEntries(Array.from(document.querySelectorAll('[id]'), el => [el.id, el.value]));")
+    assert values['first_name'] == bot.PERSONAL_INFO['first_name']
+    assert values['zip'] == bot.PERSONAL_INFO['postal_code']
+    assert values['cover_letter'] == ""
@@ -0,0 +1,52 @@
+"""FormPlanStore: a form template shared by several companies never replays one company's typed answers"""
+import sqlite3
+
+import bot
+
+ACME = "boards.greenhouse.io/acme/jobs/101"
+GLOBEX = "boards.greenhouse.io/globex/jobs/202"
+TYPED = [{'selector': "#first_name", 'action': 'fill', 'source': "info:first_name"},
+         {'selector': "#why_us", 'action': 'fill', 'source': "text:I have used Acme's products for years"}]
+REFERENCED = [{'selector': "#first_name", 'action': 'fill', 'source': "info:first_name"},
+              {'selector': "#resume", 'action': 'upload', 'source': "resume"}]
+
+def test_typed_text_stays_with_its_form():
+    store = bot.FormPlanStore(":memory:")
+    store.learn("f1", ACME, TYPED)
+    
+    assert store.get("f1", ACME)['steps'] == TYPED
+    assert store.get("f1", GLOBEX) is None
+
+def test_plan_without_literals_is_shared_by_the_template():
+    store = bot.FormPlanStore(":memory:")
+    store.learn("f1", ACME, REFERENCED)
+    
+    borrowed = store.get("f1", GLOBEX)
+    assert borrowed['form_key'] == ACME
+    assert borrowed['steps'] == REFERENCED
+
+def test_learning_on_another_form_keeps_both_plans():
+    store = bot.FormPlanStore(":memory:")
+    store.learn("f1", ACME, TYPED)
+    store.learn("f1", GLOBEX, REFERENCED)
+    
+    assert store.get("f1", ACME)['steps'] == TYPED
+    assert store.get("f1", GLOBEX)['steps'] == REFERENCED
+    store.invalidate("f1", GLOBEX)
+    assert store.get("f1", ACME)['form_key'] == ACME
+
+def test_table_keyed_on_the_fingerprint_alone_is_relearned(tmp_path):
+    path = str(tmp_path / "plans.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE form_plans (fingerprint TEXT PRIMARY KEY, form_key TEXT NOT NULL, "
+                     "plan_version INTEGER NOT NULL, revision INTEGER NOT NULL, steps TEXT NOT NULL, "
+                     "status TEXT NOT NULL, uses INTEGER DEFAULT 0, learned_at TEXT, last_used TEXT)")
+        conn.execute("INSERT INTO form_plans VALUES ('f1', ?, 1, 1, '[]', 'active', 0, NULL, NULL)", (ACME,))
+    conn.close()
+    
+    store = bot.FormPlanStore(path)
+    assert store.get("f1", ACME) is None
+    store.learn("f1", ACME, TYPED)
+    store.learn("f1", GLOBEX, REFERENCED)
+    assert store.get("f1", GLOBEX)['form_key'] == GLOBEX
+    store.close()
@@ -0,0 +1,20 @@
+"""JOB_CARD_SNAPSHOT_JS on the saved listing page: only the footer job state marks a card as applied"""
+import bot
+
+def snapshot_cards(job_bot, server):
+    job_bot.driver.get(server.url("linkedin_listing.html"))
+    job_bot.waits.until('listing_loaded')
+    return {card['job_id']: card for card in job_bot.driver.execute_script(bot.JOB_CARD_SNAPSHOT_JS)}
+
+def test_applied_badge_is_read_from_the_footer_state(job_bot, fixture_server):
+    cards = snapshot_cards(job_bot, fixture_server)
+    
+    assert cards["3900000135"]['applied'] is True
+    assert cards["3900000100"]['applied'] is False
+
+def test_title_starting_with_applied_is_not_an_applied_badge(job_bot, fixture_server):
+    card = snapshot_cards(job_bot, fixture_server)["3900000324"]
+    
+    assert (card['title'], card['company']) == ("Applied Scientist", "Applied Materials")
+    assert card['applied'] is False
+    assert card['easy_apply'] is True
@@ -0,0 +1,29 @@
+"""PAGE_STATE_CONDITIONS that gate a recorded application or end a search early"""
+import time
+
+import bot
+
+SUBMIT_CONFIRMED = bot.PAGE_STATE_CONDITIONS['submit_confirmed']
+
+def test_thank_you_in_the_job_description_is_not_a_confirmation(job_bot, fixture_server):
+    job_bot.driver.get(fixture_server.url("linkedin_job.html"))
+    job_bot.driver.execute_script(
+        "document.body.insertAdjacentHTML('beforeend', '<p>Thank you for your interest in this role.</p>"
+        "<div class=\"artdeco-modal\" role=\"dialog\" id=\"test-modal\"><h3>Contact info</h3></div>');")
+    
+    assert not job_bot.waits.check(SUBMIT_CONFIRMED, ())
+    
+    job_bot.driver.execute_script("document.getElementById('test-modal').innerHTML = "
+                                  "'<h2>Application sent</h2><p>Your application was sent to Acme!</p>';")
+    assert job_bot.waits.check(SUBMIT_CONFIRMED, ())
+
+def test_empty_search_does_not_wait_out_the_timeout(job_bot):
+    with bot.FixtureServer(jobs=5) as server:
+        job_bot.driver.get(server.url("jobs/search/?keywords=data%20analyst&start=100"))
+        start = time.perf_counter()
+        loaded = job_bot.waits.until('listing_loaded')
+        assert loaded == 'empty'
+        assert time.perf_counter() - start < bot.WAIT_TIMEOUT / 2
+        
+        job_bot.driver.get(server.url("jobs/search/?keywords=data%20analyst&start=0"))
+        assert job_bot.waits.until('listing_loaded') is True
@@ -0,0 +1,13 @@
+"""PAGE_STATS_JS on a fixture job page whose images, font and video are all same-origin and not cached yet"""
+import bot
+
+def test_same_origin_page_is_fully_measured(job_bot, fixture_server):
+    job_bot.driver.get(fixture_server.url("linkedin_job.html"))
+    job_bot.waits.until('page_ready')
+    stats = job_bot.driver.execute_script(bot.PAGE_STATS_JS)
+    
+    assert stats['opaque'] == 0
+    assert stats['cache_hits'] == 0  # First visit in a fresh profile
+    assert stats['resources'] > 0
+    # The page references at least the 300 KB banner and the 120 KB font from /_synthetic/
+    assert stats['transfer_bytes'] > 300 * 1024
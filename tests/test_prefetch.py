@@ -0,0 +1,82 @@
+"""JobPrefetcher on the replay server: prefetched job tabs are paced and reported like load_page navigations"""
+import pytest
+
+import bot
+
+@pytest.fixture(scope="module")
+def replay_server():
+    with bot.FixtureServer(jobs=len(bot.REPLAY_JOB_MIX)) as server:
+        yield server
+
+def start_prefetcher(job_bot, server, depth=2):
+    job_bot.driver.get(server.url("jobs/search/?keywords=data%20analyst&start=0"))
+    prefetcher = bot.JobPrefetcher(job_bot, depth=depth)
+    prefetcher.hub = job_bot.driver.current_window_handle
+    return prefetcher
+
+def replay_jobs(server, count):
+    return [{'url': server.url(f"jobs/view/{bot.replay_job(index)['job_id']}/")} for index in range(count)]
+
+def test_tab_opens_are_spaced_without_governor(new_bot, replay_server):
+    job_bot = new_bot()
+    delays = []
+    job_bot.random_delay = lambda *args, **kwargs: delays.append(args)
+    prefetcher = start_prefetcher(job_bot, replay_server)
+    
+    prefetcher.fill(replay_jobs(replay_server, 3))
+    
+    assert prefetcher.opened == 3
+    assert len(delays) == 2
+    prefetcher.close()
+
+def test_taken_tab_is_reported_and_recorded(new_bot, replay_server):
+    job_bot = new_bot()
+    job_bot.governor = bot.RateGovernor()
+    reports = []
+    job_bot.report_page_load = lambda action, seconds, problem=None: reports.append((action, problem))
+    prefetcher = start_prefetcher(job_bot, replay_server)
+    jobs = replay_jobs(replay_server, 1)
+    prefetcher.fill(jobs)
+    
+    summary = prefetcher.take(jobs[0]['url'])
+    
+    assert summary is not None
+    assert reports == [('page_load', None)]
+    assert job_bot.page_stats[-1]['label'] == "job"
+    prefetcher.release()
+    prefetcher.close()
+
+def test_taken_tab_is_switched_to_by_handle(new_bot, replay_server):
+    job_bot = new_bot()
+    prefetcher = start_prefetcher(job_bot, replay_server, depth=3)
+    jobs = replay_jobs(replay_server, 3)
+    prefetcher.fill(jobs)
+    assert len(prefetcher.handles) == 3
+    
+    with bot.count_webdriver_calls(job_bot.driver) as counts:
+        prefetcher.take(jobs[-1]['url'])
+    
+    assert counts.get('switchToWindow') == 1
+    assert prefetcher.current == job_bot.driver.current_window_handle
+    prefetcher.release()
+    prefetcher.close()
+
+def test_iterate_pulls_no_jobs_past_the_limit():
+    class Owner:
+        driver = type("Driver", (), {'current_window_handle': "hub"})()
+    
+    prefetcher = bot.JobPrefetcher(Owner(), depth=2)
+    filled = []
+    prefetcher.fill = lambda jobs: filled.extend(job['url'] for job in jobs if job['url'] not in filled)
+    pulled = []
+    
+    def crawl():
+        for index in range(10):
+            pulled.append(index)
+            yield {'url': f"job-{index}"}
+    
+    yielded = [job['url'] for job in prefetcher.iterate(crawl(), limit=3)]
+    
+    assert yielded == ["job-0", "job-1", "job-2"]
+    assert pulled == [0, 1, 2]
+    assert filled == yielded
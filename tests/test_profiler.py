@@ -0,0 +1,43 @@
+"""WebDriverProfiler attribution: commands issued through generic helpers land on the bot method that used them"""
+import sys
+
+import bot
+
+class RecordingDriver:
+    def __init__(self, profiler):
+        self.profiler = profiler
+    
+    def get(self, url):
+        self.profiler.record(sys._getframe(1), "get", 0.5)
+    
+    def execute_script(self, script, *args):
+        self.profiler.record(sys._getframe(1), "executeScript", 0.1)
+
+class ProfiledBot(bot.LinkedInJobBot):
+    def open_job(self, url):
+        self.load_page(url)
+    
+    def read_titles(self):
+        return [self.driver.execute_script("return 1") for _ in range(2)]
+
+def profiled_bot():
+    profiler = bot.WebDriverProfiler()
+    job_bot = ProfiledBot.__new__(ProfiledBot)
+    job_bot.governor = None
+    job_bot.driver = RecordingDriver(profiler)
+    return job_bot, profiler
+
+def test_helper_calls_are_attributed_to_the_calling_method():
+    job_bot, profiler = profiled_bot()
+    job_bot.open_job("https://www.linkedin.com/jobs/view/1/")
+    job_bot.read_titles()
+    
+    report = {method: (calls, commands) for method, calls, _, commands in profiler.report()}
+    assert set(report) == {"open_job", "read_titles"}
+    assert report["open_job"][1] == {"get": (1, 0.5)}
+    assert report["read_titles"][0] == 2
+
+def test_commands_outside_the_bot_are_grouped():
+    profiler = bot.WebDriverProfiler()
+    RecordingDriver(profiler).get("about:blank")
+    assert profiler.report()[0][0] == "<outside bot>"
@@ -0,0 +1,12 @@
+"""RateGovernor backoff stays within the action class that saw the slow responses"""
+import bot
+
+def test_slow_company_sites_do_not_slow_linkedin_pages():
+    governor = bot.RateGovernor()
+    linkedin_rate = governor.rate('page_load')
+    
+    for _ in range(3):
+        assert governor.report('company_site', bot.RATE_SLOW_RESPONSE + 1)
+    
+    assert governor.rate('page_load') == linkedin_rate
+    assert governor.rate('company_site') < bot.RATE_BUDGETS['company_site'][0] / 60
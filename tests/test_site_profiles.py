@@ -0,0 +1,61 @@
+"""SiteProfileStore counters when several workers record visits to the same domain at once"""
+import threading
+
+import bot
+
+def test_concurrent_visits_are_all_counted():
+    store = bot.SiteProfileStore(":memory:")
+    workers, visits = 8, 50
+    start = threading.Barrier(workers)
+    
+    def record(worker):
+        start.wait()
+        for _ in range(visits):
+            store.record_visit("jobs.example.com", success=worker % 2 == 0, apply_selector="#apply", load_ms=100)
+    
+    threads = [threading.Thread(target=record, args=(worker,)) for worker in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    profile = store.profile("jobs.example.com")
+    assert profile['visits'] == workers * visits
+    assert profile['successes'] == workers // 2 * visits
+    assert profile['load_ms'] == 100
+
+def test_record_visit_updates_streak_and_selector():
+    store = bot.SiteProfileStore(":memory:")
+    store.record_visit("jobs.example.com", success=True, apply_selector="#apply", load_ms=1000)
+    store.record_visit("jobs.example.com", success=None, load_ms=2000)
+    assert store.profile("jobs.example.com")['apply_selector'] == "#apply"
+    assert store.profile("jobs.example.com")['load_ms'] == 1300
+    
+    store.record_visit("jobs.example.com", success=False)
+    profile = store.record_visit("jobs.example.com", success=False)
+    assert profile['failure_streak'] == 2
+    assert profile['apply_selector'] is None
+    assert profile['load_ms'] == 1300
+    
+    profile = store.update_profile("jobs.example.com", cookie_banner=1)
+    assert (profile['visits'], profile['cookie_banner'], profile['failure_streak']) == (4, 1, 2)
+
+def test_failures_on_a_shared_ats_host_block_only_that_company():
+    store = bot.SiteProfileStore(":memory:")
+    acme = bot.site_key("https://boards.greenhouse.io/acme/jobs/101?gh_src=linkedin")
+    globex = bot.site_key("https://boards.greenhouse.io/globex/jobs/202")
+    assert (acme, globex) == ("boards.greenhouse.io/acme", "boards.greenhouse.io/globex")
+    store.link_company("Acme", acme)
+    store.link_company("Globex", globex)
+    
+    for _ in range(bot.SITE_FAILURE_LIMIT):
+        store.record_visit(acme, success=False)
+    
+    assert store.blocked_reason(domain=acme)
+    assert store.blocked_reason(company="Acme")
+    assert store.blocked_reason(domain=globex) is None
+    assert store.blocked_reason(company="Globex") is None
+
+def test_single_tenant_sites_are_keyed_on_the_host():
+    assert bot.site_key("https://careers.example.com/jobs/apply/7") == "careers.example.com"
+    assert bot.site_key("https://jobs.lever.co/") == "jobs.lever.co"
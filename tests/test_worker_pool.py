@@ -0,0 +1,50 @@
+"""Worker-pool mode end to end against the replay server: a collector browser and headless workers
+sharing its session, its result lists and its application history."""
+import pytest
+
+import bot
+
+POOL_JOBS = len(bot.REPLAY_JOB_MIX)  # One pass over the catalogue mix
+EASY_APPLY_JOBS = bot.REPLAY_JOB_MIX.count("easy_apply")
+
+@pytest.fixture
+def replay_server():
+    with bot.FixtureServer(jobs=POOL_JOBS) as server:
+        yield server
+
+@pytest.fixture
+def pool_bot(new_bot, replay_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(bot, "WORKER_PACING", (0.01, 0.01))
+    monkeypatch.setattr(bot, "KEYWORD_PACING", (0.01, 0.01))
+    # Company-site cards are dropped by triage, so every queued job is an Easy Apply one
+    monkeypatch.setattr(bot, "HANDLE_COMPANY_SITES", False)
+    resume_path = tmp_path / "resume.pdf"
+    resume_path.write_bytes(b"%PDF-1.4\n% worker pool test resume\n")
+    collector = new_bot(resume_path=str(resume_path))
+    for question, answer in bot.REPLAY_SCREENING_ANSWERS.items():
+        collector.answer_bank.add(question, answer)
+    collector.base_url = replay_server.url().rstrip("/")
+    return collector
+
+def test_pool_applies_to_every_easy_apply_job_once(pool_bot):
+    # The replay server lists the same jobs for both keywords; the second one must queue nothing new
+    attempted, applied = pool_bot.run_worker_pool(["data analyst", "data science"], pool_size=2)
+    
+    assert (attempted, applied) == (EASY_APPLY_JOBS, EASY_APPLY_JOBS)
+    urls = [job['url'] for job in pool_bot.applied_jobs]
+    assert len(urls) == len(set(urls)) == EASY_APPLY_JOBS
+    assert not pool_bot.failed_jobs
+    assert pool_bot.applied_store.count() == EASY_APPLY_JOBS
+
+def test_workers_share_the_collector_state(pool_bot):
+    pool_bot.load_page(pool_bot.base_url)
+    pool_bot.driver.add_cookie({'name': 'li_at', 'value': 'replay-session'})
+    worker = pool_bot.spawn_worker(1)
+    try:
+        assert worker.applied_jobs is pool_bot.applied_jobs
+        assert worker.results_lock is pool_bot.results_lock
+        assert worker.applied_store is pool_bot.applied_store
+        assert worker.resume_path == pool_bot.resume_path
+        assert worker.driver.get_cookie('li_at')['value'] == 'replay-session'
+    finally:
+        worker.driver.quit()